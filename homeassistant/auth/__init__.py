@@ -3,8 +3,9 @@ from __future__ import annotations
 
 import asyncio
 from collections import OrderedDict
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from datetime import timedelta
+import hashlib
 import time
 from typing import Any, cast
 
@@ -15,7 +16,7 @@ from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 
 from . import auth_store, jwt_wrapper, models
-from .const import ACCESS_TOKEN_EXPIRATION, GROUP_ID_ADMIN
+from .const import ACCESS_TOKEN_CACHE_SIZE, ACCESS_TOKEN_EXPIRATION, GROUP_ID_ADMIN
 from .mfa_modules import MultiFactorAuthModule, auth_mfa_module_from_config
 from .providers import AuthProvider, LoginFlow, auth_provider_from_config
 
@@ -158,6 +159,10 @@ class AuthManager:
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, list[CALLBACK_TYPE]] = {}
+        # Verified access tokens by digest with their expiration time
+        self._access_token_cache: dict[bytes, tuple[float, models.RefreshToken]] = {}
+        self.access_token_cache_hits = 0
+        self.access_token_cache_misses = 0
 
     @property
     def auth_providers(self) -> list[AuthProvider]:
@@ -311,6 +316,7 @@ class AuthManager:
             await asyncio.gather(*tasks)
 
         await self._store.async_remove_user(user)
+        self._async_invalidate_access_tokens(lambda token: token.user is user)
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
@@ -351,6 +357,7 @@ class AuthManager:
         if user.is_owner:
             raise ValueError("Unable to deactivate the owner")
         await self._store.async_deactivate_user(user)
+        self._async_invalidate_access_tokens(lambda token: token.user is user)
 
     async def async_remove_credentials(self, credentials: models.Credentials) -> None:
         """Remove credentials."""
@@ -474,6 +481,7 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._async_invalidate_access_tokens(lambda token: token.id == refresh_token.id)
 
         callbacks = self._revoke_callbacks.pop(refresh_token.id, [])
         for revoke_callback in callbacks:
@@ -556,6 +564,20 @@ class AuthManager:
         self, token: str
     ) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
+        digest = hashlib.sha256(token.encode()).digest()
+        if (cached := self._access_token_cache.get(digest)) is not None:
+            expire, cached_token = cached
+            if (
+                time.time() < expire
+                and cached_token.user.is_active
+                and cached_token.user.refresh_tokens.get(cached_token.id)
+                is cached_token
+            ):
+                self.access_token_cache_hits += 1
+                return cached_token
+            del self._access_token_cache[digest]
+        self.access_token_cache_misses += 1
+
         try:
             unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
         except jwt.InvalidTokenError:
@@ -573,7 +595,7 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt_wrapper.verify_and_decode(
+            claims = jwt_wrapper.verify_and_decode(
                 token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
             )
         except jwt.InvalidTokenError:
@@ -582,8 +604,21 @@ class AuthManager:
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        if len(self._access_token_cache) >= ACCESS_TOKEN_CACHE_SIZE:
+            # Drop the oldest verified token
+            del self._access_token_cache[next(iter(self._access_token_cache))]
+        self._access_token_cache[digest] = (claims["exp"], refresh_token)
         return refresh_token
 
+    @callback
+    def _async_invalidate_access_tokens(
+        self, matcher: Callable[[models.RefreshToken], bool]
+    ) -> None:
+        """Remove verified access tokens of matching refresh tokens from the cache."""
+        for digest, (_, refresh_token) in list(self._access_token_cache.items()):
+            if matcher(refresh_token):
+                del self._access_token_cache[digest]
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
@@ -8,7 +8,7 @@ import hmac
 from logging import getLogger
 from typing import Any
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
@@ -296,6 +296,12 @@ class AuthStore:
         refresh_token.last_used_ip = remote_ip
         self._async_schedule_save()
 
+    @callback
+    def _async_registry_updated(self, event: Event) -> None:
+        """Discard the cached permission lookups when the registries change."""
+        assert self._perm_lookup is not None
+        self._perm_lookup.generation += 1
+
     async def _async_load(self) -> None:
         """Load the users."""
         async with self._lock:
@@ -315,6 +321,13 @@ class AuthStore:
             return
 
         self._perm_lookup = perm_lookup = PermissionLookup(ent_reg, dev_reg)
+        for event_type in (
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+        ):
+            self.hass.bus.async_listen(
+                event_type, self._async_registry_updated, run_immediately=True
+            )
 
         if data is None or not isinstance(data, dict):
             self._set_defaults()
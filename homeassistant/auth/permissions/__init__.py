@@ -54,6 +54,27 @@ class PolicyPermissions(AbstractPermissions):
         """Initialize the permission class."""
         self._policy = policy
         self._perm_lookup = perm_lookup
+        self._cached_generation = 0
+        # Results of check_entity by key and entity id
+        self._cached_entity_results: dict[str, dict[str, bool]] = {}
+
+    def check_entity(self, entity_id: str, key: str) -> bool:
+        """Check if we can access entity.
+
+        The results are cached until the registries used to look up the
+        device and area of the entities change.
+        """
+        if (
+            self._perm_lookup is not None
+            and self._cached_generation != self._perm_lookup.generation
+        ):
+            self._cached_generation = self._perm_lookup.generation
+            self._cached_entity_results.clear()
+        if (results := self._cached_entity_results.get(key)) is None:
+            results = self._cached_entity_results[key] = {}
+        if (result := results.get(entity_id)) is None:
+            result = results[entity_id] = super().check_entity(entity_id, key)
+        return result
 
     def access_all_entities(self, key: str) -> bool:
         """Check if we have a certain access to all entities."""
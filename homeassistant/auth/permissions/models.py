@@ -15,3 +15,5 @@ class PermissionLookup:
 
     entity_registry: er.EntityRegistry = attr.ib()
     device_registry: dr.DeviceRegistry = attr.ib()
+    # Increased when the registries change so cached lookups can be discarded
+    generation: int = attr.ib(default=0)
@@ -137,6 +137,7 @@ async def async_setup_hass(
     _LOGGER.info("Config directory: %s", runtime_config.config_dir)
 
     loader.async_setup(hass)
+    await loader.async_load_manifest_cache(hass)
     config_dict = None
     basic_setup_success = False
 
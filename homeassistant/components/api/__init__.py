@@ -3,11 +3,13 @@ import asyncio
 from asyncio import shield, timeout
 from collections.abc import Collection
 from functools import lru_cache
+import hashlib
 from http import HTTPStatus
 import logging
 from typing import Any
 
 from aiohttp import web
+from aiohttp.helpers import ETAG_ANY, ETag
 from aiohttp.web_exceptions import HTTPBadRequest
 import voluptuous as vol
 
@@ -73,7 +75,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.http.register_view(APICoreStateView)
     hass.http.register_view(APIEventStream)
     hass.http.register_view(APIConfigView)
-    hass.http.register_view(APIStatesView)
+    states_view = APIStatesView()
+    hass.http.register_view(states_view)
+    hass.bus.async_listen(
+        EVENT_STATE_CHANGED, states_view.async_state_changed, run_immediately=True
+    )
     hass.http.register_view(APIEntityStateView)
     hass.http.register_view(APIEventListenersView)
     hass.http.register_view(APIEventView)
@@ -88,6 +94,37 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
+def _json_body(body: str) -> tuple[bytes, str]:
+    """Return the encoded JSON body and its ETag value."""
+    encoded = body.encode()
+    # A digest of the body, so the tag is stable across restarts and workers
+    return encoded, hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+@ha.callback
+def _async_json_response(
+    request: web.Request, encoded: bytes, etag: str, compress: bool = False
+) -> web.Response:
+    """Return a JSON response or a 304 if the client has the same body."""
+    if (if_none_match := request.if_none_match) is not None and any(
+        tag.value in (etag, ETAG_ANY) for tag in if_none_match
+    ):
+        response = web.Response(status=HTTPStatus.NOT_MODIFIED)
+    else:
+        response = web.Response(
+            body=encoded,
+            content_type=CONTENT_TYPE_JSON,
+            charset="utf-8",
+            zlib_executor_size=32768,
+        )
+        if compress:
+            response.enable_compression()
+    # The tag is weak since the same tag is sent for the compressed
+    # and the identity body
+    response.etag = ETag(value=etag, is_weak=True)
+    return response
+
+
 class APIStatusView(HomeAssistantView):
     """View to handle Status requests."""
 
@@ -202,13 +239,28 @@ class APIStatesView(HomeAssistantView):
     url = URL_API_STATES
     name = "api:states"
 
+    def __init__(self) -> None:
+        """Initialize the states view."""
+        # The encoded JSON of all states and its ETag value, only the
+        # changed states need to be encoded again since State caches its
+        # JSON. The body is encoded and hashed once per change instead of
+        # on every request, which keeps repeated requests and 304s cheap.
+        self._all_states_json: tuple[bytes, str] | None = None
+
+    @ha.callback
+    def async_state_changed(self, event: ha.Event) -> None:
+        """Discard the JSON of all states when a state changes."""
+        self._all_states_json = None
+
     @ha.callback
     def get(self, request: web.Request) -> web.Response:
         """Get current states."""
         user: User = request["hass_user"]
         hass: HomeAssistant = request.app["hass"]
         if user.is_admin:
-            states = (state.as_dict_json for state in hass.states.async_all())
+            if (json_body := self._all_states_json) is None:
+                states = (state.as_dict_json for state in hass.states.async_all())
+                json_body = self._all_states_json = _json_body(f'[{",".join(states)}]')
         else:
             entity_perm = user.permissions.check_entity
             states = (
@@ -216,13 +268,8 @@ class APIStatesView(HomeAssistantView):
                 for state in hass.states.async_all()
                 if entity_perm(state.entity_id, "read")
             )
-        response = web.Response(
-            body=f'[{",".join(states)}]',
-            content_type=CONTENT_TYPE_JSON,
-            zlib_executor_size=32768,
-        )
-        response.enable_compression()
-        return response
+            json_body = _json_body(f'[{",".join(states)}]')
+        return _async_json_response(request, *json_body, compress=True)
 
 
 class APIEntityStateView(HomeAssistantView):
@@ -240,10 +287,7 @@ class APIEntityStateView(HomeAssistantView):
             raise Unauthorized(entity_id=entity_id)
 
         if state := hass.states.get(entity_id):
-            return web.Response(
-                body=state.as_dict_json,
-                content_type=CONTENT_TYPE_JSON,
-            )
+            return _async_json_response(request, *_json_body(state.as_dict_json))
         return self.json_message("Entity not found.", HTTPStatus.NOT_FOUND)
 
     async def post(self, request, entity_id):
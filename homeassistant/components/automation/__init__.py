@@ -95,7 +95,7 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 from homeassistant.util.dt import parse_datetime
 
-from .config import AutomationConfig
+from .config import AutomationConfig, async_setup_validated_configs
 from .const import (
     CONF_ACTION,
     CONF_INITIAL_STATE,
@@ -266,6 +266,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     # Register automation as valid domain for Blueprint
     async_get_blueprints(hass)
 
+    async_setup_validated_configs(hass)
     await _async_process_config(hass, config, component)
 
     # Add some default blueprints to blueprints/automation, does nothing
@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Mapping
 from contextlib import suppress
+from copy import deepcopy
 from typing import Any
 
 import voluptuous as vol
@@ -19,9 +20,9 @@ from homeassistant.const import (
     CONF_ID,
     CONF_VARIABLES,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import config_validation as cv, script
+from homeassistant.helpers import config_validation as cv, device_registry as dr, script
 from homeassistant.helpers.condition import async_validate_conditions_config
 from homeassistant.helpers.trigger import async_validate_trigger_config
 from homeassistant.helpers.typing import ConfigType
@@ -41,6 +42,8 @@ from .helpers import async_get_blueprints
 
 PACKAGE_MERGE_HINT = "list"
 
+DATA_VALIDATED_CONFIGS = "automation_validated_configs"
+
 _MINIMAL_PLATFORM_SCHEMA = vol.Schema(
     {
         CONF_ID: str,
@@ -254,18 +257,49 @@ async def async_validate_config_item(
 
 
 async def async_validate_config(hass: HomeAssistant, config: ConfigType) -> ConfigType:
-    """Validate config."""
+    """Validate config.
+
+    Automations with an id whose configuration is unchanged since the previous
+    validation reuse the previously validated configuration. This makes reloads
+    after editing a single automation cheap; the automation integration only
+    recreates automations whose configuration changed.
+    """
+    previous: dict[str, tuple[Any, AutomationConfig]] = hass.data.get(
+        DATA_VALIDATED_CONFIGS, {}
+    )
+    validated: dict[str, tuple[Any, AutomationConfig]] = {}
+
+    async def _async_validate(p_config: Any) -> AutomationConfig | None:
+        """Validate config item or reuse the previous validation result."""
+        automation_id = None
+        if isinstance(p_config, dict) and not blueprint.is_blueprint_instance_config(
+            p_config
+        ):
+            automation_id = p_config.get(CONF_ID)
+        if not isinstance(automation_id, str):
+            return await _try_async_validate_config_item(hass, p_config)
+
+        if (cached := previous.get(automation_id)) and cached[0] == p_config:
+            validated[automation_id] = cached
+            return cached[1]
+
+        automation_config = await _try_async_validate_config_item(hass, p_config)
+        if automation_config is not None and not automation_config.validation_failed:
+            validated[automation_id] = (deepcopy(p_config), automation_config)
+        return automation_config
+
     automations = list(
         filter(
             lambda x: x is not None,
             await asyncio.gather(
                 *(
-                    _try_async_validate_config_item(hass, p_config)
+                    _async_validate(p_config)
                     for _, p_config in config_per_platform(config, DOMAIN)
                 )
             ),
         )
     )
+    hass.data[DATA_VALIDATED_CONFIGS] = validated
 
     # Create a copy of the configuration with all config for current
     # component removed and add validated config back in.
@@ -273,3 +307,24 @@ async def async_validate_config(hass: HomeAssistant, config: ConfigType) -> Conf
     config[DOMAIN] = automations
 
     return config
+
+
+@callback
+def async_setup_validated_configs(hass: HomeAssistant) -> None:
+    """Drop the previous validation results when the device registry is updated.
+
+    Device triggers, conditions and actions are validated against the device
+    registry, so a previous validation result is only reused while the device
+    registry is unchanged.
+    """
+
+    @callback
+    def _async_device_registry_updated(event: Event) -> None:
+        """Drop the previous validation results."""
+        hass.data.pop(DATA_VALIDATED_CONFIGS, None)
+
+    hass.bus.async_listen(
+        dr.EVENT_DEVICE_REGISTRY_UPDATED,
+        _async_device_registry_updated,
+        run_immediately=True,
+    )
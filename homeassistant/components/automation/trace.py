@@ -7,10 +7,12 @@ from typing import Any
 
 from homeassistant.components.trace import (
     CONF_STORED_TRACES,
+    CONF_TRACE_LEVEL,
     ActionTrace,
     async_store_trace,
 )
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import TraceLevel, trace_level
 from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
@@ -57,10 +59,13 @@ def trace_automation(
 ) -> Generator[AutomationTrace, None, None]:
     """Trace action execution of automation with automation_id."""
     trace = AutomationTrace(automation_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    level: TraceLevel = trace_config[CONF_TRACE_LEVEL]
+    if level is not TraceLevel.OFF:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
 
     try:
-        yield trace
+        with trace_level(level):
+            yield trace
     except Exception as ex:
         if automation_id:
             trace.set_error(ex)
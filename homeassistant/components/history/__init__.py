@@ -12,7 +12,7 @@ from homeassistant.components import frontend
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder import get_instance, history
 from homeassistant.components.recorder.util import session_scope
-from homeassistant.const import CONF_EXCLUDE, CONF_INCLUDE
+from homeassistant.const import CONF_EXCLUDE, CONF_INCLUDE, EVENT_STATE_CHANGED
 from homeassistant.core import HomeAssistant, valid_entity_id
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA
@@ -20,10 +20,12 @@ from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
 from . import websocket_api
-from .const import DOMAIN
+from .const import DATA_RECENT_HISTORY, DOMAIN
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
+from .recent import RecentHistory
 
 CONF_ORDER = "use_include_order"
+CONF_RECENT_HISTORY_MAX_STATES = "recent_history_max_states"
 
 _ONE_DAY = timedelta(days=1)
 
@@ -34,7 +36,12 @@ CONFIG_SCHEMA = vol.Schema(
             cv.deprecated(CONF_EXCLUDE),
             cv.deprecated(CONF_ORDER),
             INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
-                {vol.Optional(CONF_ORDER, default=False): cv.boolean}
+                {
+                    vol.Optional(CONF_ORDER, default=False): cv.boolean,
+                    vol.Optional(CONF_RECENT_HISTORY_MAX_STATES): vol.All(
+                        vol.Coerce(int), vol.Range(min=1)
+                    ),
+                }
             ),
         )
     },
@@ -47,6 +54,16 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.http.register_view(HistoryPeriodView())
     frontend.async_register_built_in_panel(hass, "history", "history", "hass:chart-box")
     websocket_api.async_setup(hass)
+    conf = config.get(DOMAIN, {})
+    instance = get_instance(hass)
+    # Keeping the recent history in memory is opt-in as it trades memory
+    # for answering recent history requests without the database
+    if (
+        max_states := conf.get(CONF_RECENT_HISTORY_MAX_STATES)
+    ) and EVENT_STATE_CHANGED not in instance.exclude_event_types:
+        recent_history = RecentHistory(hass, instance.entity_filter, max_states)
+        recent_history.async_setup()
+        hass.data[DATA_RECENT_HISTORY] = recent_history
     return True
 
 
@@ -1,7 +1,18 @@
 """History integration constants."""
 
+from datetime import timedelta
+
 DOMAIN = "history"
 
+DATA_RECENT_HISTORY = "history_recent"
+
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# The maximum number of entities to fetch and send in one history stream message
+MAX_ENTITY_IDS_PER_STREAM_MESSAGE = 25
+
+# The limits of the recent history kept in memory
+RECENT_HISTORY_MAX_AGE = timedelta(hours=24)
+RECENT_HISTORY_MAX_ENTITIES = 2048
@@ -3,9 +3,11 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime as dt
+from typing import Any
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant
 
 
@@ -30,3 +32,70 @@ def has_recorder_run_after(hass: HomeAssistant, run_time: dt) -> bool:
     return run_time >= process_timestamp(
         get_instance(hass).recorder_runs_manager.first.start
     )
+
+
+def _numeric_state(state: Any) -> float | None:
+    """Return the state as a float or None if it is not numeric."""
+    try:
+        return float(state)
+    except (TypeError, ValueError):
+        return None
+
+
+def downsample_compressed_states(
+    states: list[dict[str, Any]], max_points: int
+) -> list[dict[str, Any]]:
+    """Downsample the compressed states of an entity to about max_points states.
+
+    The period of the states is split in buckets of equal time and only the
+    minimum, maximum and last numeric state of each bucket are kept. The first
+    and last state and all non-numeric states are always kept.
+    """
+    if len(states) <= max_points:
+        return states
+    # Each bucket keeps up to three states
+    buckets = max(max_points // 3, 1)
+    first_time = states[0][COMPRESSED_STATE_LAST_UPDATED]
+    bucket_time = (states[-1][COMPRESSED_STATE_LAST_UPDATED] - first_time) / buckets
+    if not bucket_time:
+        return states
+
+    result = [states[0]]
+    bucket = -1
+    # Indexes of the minimum, maximum and last state of the current bucket
+    min_idx = max_idx = last_idx = -1
+    min_value = max_value = 0.0
+
+    def _flush_bucket() -> None:
+        if last_idx != -1:
+            result.extend(states[idx] for idx in sorted({min_idx, max_idx, last_idx}))
+
+    last = len(states) - 1
+    for idx in range(1, last):
+        state = states[idx]
+        if (value := _numeric_state(state[COMPRESSED_STATE_STATE])) is None:
+            # Keep the order of the kept numeric states and the non-numeric state
+            _flush_bucket()
+            last_idx = -1
+            result.append(state)
+            continue
+        if (
+            state_bucket := int(
+                (state[COMPRESSED_STATE_LAST_UPDATED] - first_time) // bucket_time
+            )
+        ) != bucket:
+            _flush_bucket()
+            bucket = state_bucket
+            last_idx = -1
+        if last_idx == -1:
+            min_idx = max_idx = last_idx = idx
+            min_value = max_value = value
+            continue
+        if value < min_value:
+            min_idx, min_value = idx, value
+        if value > max_value:
+            max_idx, max_value = idx, value
+        last_idx = idx
+    _flush_bucket()
+    result.append(states[last])
+    return result
@@ -0,0 +1,188 @@
+"""Keep the recent history of entities in memory."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Callable
+from itertools import islice
+from operator import itemgetter
+from typing import Any
+
+from homeassistant.components.recorder import history
+from homeassistant.const import (
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import Event, HomeAssistant, State, callback, split_entity_id
+import homeassistant.util.dt as dt_util
+
+from .const import RECENT_HISTORY_MAX_AGE, RECENT_HISTORY_MAX_ENTITIES
+
+_get_time = itemgetter(0)
+
+
+class RecentHistory:
+    """Keep the recent state changes of entities in memory.
+
+    The state changes are tracked from the same events the recorder writes,
+    so history requests for recent periods can be answered without querying
+    the database.
+
+    The total number of state changes kept is capped at max_states, apart
+    from the current state of each tracked entity.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entity_filter: Callable[[str], bool],
+        max_states: int,
+        max_age: float = RECENT_HISTORY_MAX_AGE.total_seconds(),
+        max_entities: int = RECENT_HISTORY_MAX_ENTITIES,
+    ) -> None:
+        """Initialize the recent history."""
+        self.hass = hass
+        self.hits = 0
+        self.misses = 0
+        self._entity_filter = entity_filter
+        self._max_states = max_states
+        self._max_age = max_age
+        self._max_entities = max_entities
+        # The last updated timestamp and state of each state change
+        self._states: dict[str, deque[tuple[float, str]]] = {}
+        # The entity id and last updated timestamp of the state changes
+        # in the order they were tracked, to drop the oldest ones first
+        self._changes: deque[tuple[str, float]] = deque()
+
+    @property
+    def entity_count(self) -> int:
+        """Return the number of tracked entities."""
+        return len(self._states)
+
+    @property
+    def state_count(self) -> int:
+        """Return the number of tracked state changes."""
+        return sum(len(states) for states in self._states.values())
+
+    @callback
+    def async_setup(self) -> None:
+        """Start tracking state changes."""
+        self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Track a state change."""
+        entity_id: str = event.data["entity_id"]
+        new_state: State | None = event.data["new_state"]
+        # Removed entities are answered from the database
+        if new_state is None:
+            self._states.pop(entity_id, None)
+            return
+        time = dt_util.utc_to_timestamp(new_state.last_updated)
+        state = new_state.state
+        if (states := self._states.get(entity_id)) is None:
+            if (
+                len(self._states) >= self._max_entities
+                or not self._entity_filter(entity_id)
+                or split_entity_id(entity_id)[0] in history.NEED_ATTRIBUTE_DOMAINS
+            ):
+                return
+            self._states[entity_id] = deque(((time, state),))
+            self._async_track_change(entity_id, time)
+            return
+        if states[-1][1] == state:
+            return
+        states.append((time, state))
+        self._async_track_change(entity_id, time)
+        # Keep the last state change before the max age
+        # to know the state at the start of the period
+        oldest_time = time - self._max_age
+        while len(states) > 1 and states[1][0] < oldest_time:
+            states.popleft()
+
+    @callback
+    def _async_track_change(self, entity_id: str, time: float) -> None:
+        """Track a state change and drop the oldest one when over the limit."""
+        changes = self._changes
+        changes.append((entity_id, time))
+        if len(changes) <= self._max_states:
+            return
+        oldest_entity_id, oldest_time = changes.popleft()
+        # The state change may already be gone if it was too old
+        # or the entity was removed
+        if (states := self._states.get(oldest_entity_id)) is None:
+            return
+        while len(states) > 1 and states[0][0] <= oldest_time:
+            states.popleft()
+
+    @callback
+    def async_get_states(
+        self,
+        run_start_ts: float,
+        start_time_ts: float,
+        entity_ids: list[str],
+    ) -> dict[str, list[tuple[float, str]]] | None:
+        """Return a copy of the tracked state changes of the entities.
+
+        Returns None if the state at the start time of any of the entities
+        is not known. Like the recorder, the state at the start time is only
+        taken from the current recorder run which started at run_start_ts.
+
+        The copy can be passed to minimal_states in the executor.
+        """
+        if start_time_ts <= run_start_ts:
+            self.misses += 1
+            return None
+        result: dict[str, list[tuple[float, str]]] = {}
+        for entity_id in entity_ids:
+            states = self._states.get(entity_id)
+            # The state at the start time must be known
+            if (
+                not states
+                or states[0][0] >= start_time_ts
+                or states[0][0] < run_start_ts
+            ):
+                self.misses += 1
+                return None
+            result[entity_id] = list(states)
+        self.hits += 1
+        return result
+
+
+def minimal_states(
+    states_by_entity: dict[str, list[tuple[float, str]]],
+    start_time_ts: float,
+    end_time_ts: float | None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the minimal compressed history without attributes.
+
+    The history has the same format as the recorder returns with
+    include_start_time_state, minimal_response, no_attributes and
+    compressed_state_format set.
+    """
+    result: dict[str, list[dict[str, Any]]] = {}
+    for entity_id, states in states_by_entity.items():
+        start_idx = bisect_left(states, start_time_ts, key=_get_time)
+        prev_state = states[start_idx - 1][1]
+        entity_result = [
+            {
+                COMPRESSED_STATE_STATE: prev_state,
+                COMPRESSED_STATE_LAST_UPDATED: start_time_ts,
+            }
+        ]
+        for time, state in islice(states, start_idx, None):
+            if end_time_ts is not None and time >= end_time_ts:
+                break
+            if time == start_time_ts or state == prev_state:
+                continue
+            entity_result.append(
+                {
+                    COMPRESSED_STATE_STATE: (prev_state := state),
+                    COMPRESSED_STATE_LAST_UPDATED: time,
+                }
+            )
+        result[entity_id] = entity_result
+    return result
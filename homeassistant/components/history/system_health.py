@@ -0,0 +1,30 @@
+"""Provide info to system health."""
+from typing import Any
+
+from homeassistant.components import system_health
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_RECENT_HISTORY
+from .recent import RecentHistory
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    register.async_register_info(system_health_info)
+
+
+async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Get info for the info page."""
+    recent_history: RecentHistory | None = hass.data.get(DATA_RECENT_HISTORY)
+    if recent_history is None:
+        return {"recent_history": False}
+    return {
+        "recent_history": True,
+        "recent_history_entities": recent_history.entity_count,
+        "recent_history_states": recent_history.state_count,
+        "recent_history_hits": recent_history.hits,
+        "recent_history_misses": recent_history.misses,
+    }
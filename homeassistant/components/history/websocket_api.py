@@ -12,6 +12,8 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.util import chunked
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import (
@@ -38,8 +40,18 @@ from homeassistant.helpers.json import JSON_DUMP
 from homeassistant.helpers.typing import EventType
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
-from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
+from .const import (
+    DATA_RECENT_HISTORY,
+    EVENT_COALESCE_TIME,
+    MAX_ENTITY_IDS_PER_STREAM_MESSAGE,
+    MAX_PENDING_HISTORY_STATES,
+)
+from .helpers import (
+    downsample_compressed_states,
+    entities_may_have_state_changes_after,
+    has_recorder_run_after,
+)
+from .recent import RecentHistory, minimal_states
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -62,6 +74,25 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_stream)
 
 
+def _ws_get_recent_states(
+    msg_id: int,
+    recent_states: dict[str, list[tuple[float, str]]],
+    start_time: dt,
+    end_time: dt | None,
+    max_points: int | None,
+) -> str:
+    """Build the minimal history from the recent history and encode it."""
+    states = minimal_states(
+        recent_states,
+        dt_util.utc_to_timestamp(start_time),
+        dt_util.utc_to_timestamp(end_time) if end_time else None,
+    )
+    if max_points:
+        for entity_id, state_list in states.items():
+            states[entity_id] = downsample_compressed_states(state_list, max_points)
+    return JSON_DUMP(messages.result_message(msg_id, states))
+
+
 def _ws_get_significant_states(
     hass: HomeAssistant,
     msg_id: int,
@@ -72,25 +103,28 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
 ) -> str:
     """Fetch history significant_states and convert them to json in the executor."""
-    return JSON_DUMP(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
-        )
+    states = cast(
+        MutableMapping[str, list[dict[str, Any]]],
+        history.get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ),
     )
+    if max_points:
+        for entity_id, state_list in states.items():
+            states[entity_id] = downsample_compressed_states(state_list, max_points)
+    return JSON_DUMP(messages.result_message(msg_id, states))
 
 
 @websocket_api.websocket_command(
@@ -103,6 +137,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -154,6 +189,36 @@ async def ws_get_history_during_period(
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
+    max_points: int | None = msg.get("max_points")
+
+    recent_history: RecentHistory | None = hass.data.get(DATA_RECENT_HISTORY)
+    if (
+        recent_history
+        and include_start_time_state
+        and minimal_response
+        and no_attributes
+        and (
+            recent_states := recent_history.async_get_states(
+                process_timestamp(
+                    get_instance(hass).recorder_runs_manager.current.start
+                ).timestamp(),
+                dt_util.utc_to_timestamp(start_time),
+                entity_ids,
+            )
+        )
+        is not None
+    ):
+        connection.send_message(
+            await hass.async_add_executor_job(
+                _ws_get_recent_states,
+                msg["id"],
+                recent_states,
+                start_time,
+                end_time,
+                max_points,
+            )
+        )
+        return
 
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
@@ -167,6 +232,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            max_points,
         )
     )
 
@@ -277,24 +343,71 @@ async def _async_send_historical_states(
     no_attributes: bool,
     send_empty: bool,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
+    """Fetch history significant_states and send them to the client.
+
+    The states are fetched and sent in chunks of entities. The next chunk
+    is only fetched once the previous one has been written to the client.
+    """
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
-        hass,
-        msg_id,
-        start_time,
-        end_time,
-        entity_ids,
-        include_start_time_state,
-        significant_changes_only,
-        minimal_response,
-        no_attributes,
-        send_empty,
-    )
-    if payload:
-        connection.send_message(payload)
-    return last_time_dt if last_time_ts != 0 else None
+    if entity_ids is None or len(entity_ids) <= MAX_ENTITY_IDS_PER_STREAM_MESSAGE:
+        last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+            _generate_historical_response,
+            hass,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            send_empty,
+        )
+        if payload:
+            connection.send_message(payload)
+        return last_time_dt if last_time_ts != 0 else None
+
+    last_time_ts = 0.0
+    last_time_dt = None
+    for entity_ids_chunk in chunked(entity_ids, MAX_ENTITY_IDS_PER_STREAM_MESSAGE):
+        (
+            chunk_last_time_ts,
+            chunk_last_time_dt,
+            payload,
+        ) = await instance.async_add_executor_job(
+            _generate_historical_response,
+            hass,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids_chunk,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            False,
+        )
+        if msg_id not in connection.subscriptions:
+            # Unsubscribe happened while fetching the chunk
+            return None
+        if payload:
+            connection.send_message(payload)
+            # Don't fetch the next chunk before the client has read this one
+            await connection.async_drain()
+            if msg_id not in connection.subscriptions:
+                return None
+        if chunk_last_time_ts > last_time_ts:
+            last_time_ts = chunk_last_time_ts
+            last_time_dt = chunk_last_time_dt
+
+    if last_time_ts == 0 and send_empty:
+        # If we did not send any states ever, we need to send an empty response
+        # so the websocket client knows it should render/process/consume the
+        # data.
+        connection.send_message(
+            _generate_websocket_response(msg_id, start_time, end_time, {})
+        )
+    return last_time_dt
 
 
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
@@ -20,11 +20,14 @@ from homeassistant.helpers import (
     entity_registry as er,
     template,
 )
-from homeassistant.helpers.event import (
-    async_track_same_state,
-    async_track_state_change_event,
+from homeassistant.helpers.event import async_track_same_state
+from homeassistant.helpers.trigger import (
+    IndexedStateTrigger,
+    TriggerActionType,
+    TriggerInfo,
+    async_get_state_trigger_index,
+    state_trigger_predicate_key,
 )
-from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
 
 
@@ -141,7 +144,15 @@ async def async_attach_trigger(
             )
 
     @callback
-    def state_automation_listener(event):
+    def numeric_state_predicate(entity_id, from_s, to_s):
+        """Return whether the criteria are met or the error if unknown."""
+        try:
+            return check_numeric_state(entity_id, from_s, to_s)
+        except exceptions.ConditionError as ex:
+            return ex
+
+    @callback
+    def state_automation_listener(event, matching):
         """Listen for state changes and calls action."""
         entity_id = event.data.get("entity_id")
         from_s = event.data.get("old_state")
@@ -176,13 +187,11 @@ async def async_attach_trigger(
             except exceptions.ConditionError:
                 # This is an internal same-state listener so we just drop the
                 # error. The same error will be reached and logged by the
-                # primary async_track_state_change_event() listener.
+                # primary state trigger index listener.
                 return False
 
-        try:
-            matching = check_numeric_state(entity_id, from_s, to_s)
-        except exceptions.ConditionError as ex:
-            _LOGGER.warning("Error in '%s' trigger: %s", trigger_info["name"], ex)
+        if isinstance(matching, exceptions.ConditionError):
+            _LOGGER.warning("Error in '%s' trigger: %s", trigger_info["name"], matching)
             return
 
         if not matching:
@@ -213,7 +222,23 @@ async def async_attach_trigger(
             else:
                 call_action()
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    # Value templates are rendered with the variables of this trigger, so the
+    # result can only be shared when there is no value template.
+    predicate_key = (
+        state_trigger_predicate_key("numeric_state", attribute, below, above)
+        if value_template is None
+        else object()
+    )
+    unsub = async_get_state_trigger_index(hass).async_add(
+        entity_ids,
+        IndexedStateTrigger(
+            trigger_info["name"],
+            predicate_key,
+            numeric_state_predicate,
+            state_automation_listener,
+            dispatch_all=True,
+        ),
+    )
 
     @callback
     def async_remove():
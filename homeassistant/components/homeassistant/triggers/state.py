@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from datetime import timedelta
 import logging
+from typing import Any
 
 import voluptuous as vol
 
@@ -17,10 +18,15 @@ from homeassistant.helpers import (
 from homeassistant.helpers.event import (
     EventStateChangedData,
     async_track_same_state,
-    async_track_state_change_event,
     process_state_match,
 )
-from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+from homeassistant.helpers.trigger import (
+    IndexedStateTrigger,
+    TriggerActionType,
+    TriggerInfo,
+    async_get_state_trigger_index,
+    state_trigger_predicate_key,
+)
 from homeassistant.helpers.typing import ConfigType, EventType
 
 _LOGGER = logging.getLogger(__name__)
@@ -123,39 +129,32 @@ async def async_attach_trigger(
     _variables = trigger_info["variables"] or {}
 
     @callback
-    def state_automation_listener(event: EventType[EventStateChangedData]) -> None:
-        """Listen for state changes and calls action."""
-        entity = event.data["entity_id"]
-        from_s = event.data["old_state"]
-        to_s = event.data["new_state"]
-
-        if from_s is None:
-            old_value = None
-        elif attribute is None:
-            old_value = from_s.state
-        else:
-            old_value = from_s.attributes.get(attribute)
-
-        if to_s is None:
-            new_value = None
-        elif attribute is None:
-            new_value = to_s.state
-        else:
-            new_value = to_s.attributes.get(attribute)
+    def state_predicate(entity: str, from_s: State | None, to_s: State | None) -> bool:
+        """Return if a state change matches the trigger."""
+        old_value = _get_value(from_s, attribute)
+        new_value = _get_value(to_s, attribute)
 
         # When we listen for state changes with `match_all`, we
         # will trigger even if just an attribute changes. When
         # we listen to just an attribute, we should ignore all
         # other attribute changes.
         if attribute is not None and old_value == new_value:
-            return
+            return False
 
-        if (
-            not match_from_state(old_value)
-            or not match_to_state(new_value)
-            or (not match_all and old_value == new_value)
-        ):
-            return
+        return (
+            match_from_state(old_value)
+            and match_to_state(new_value)
+            and (match_all or old_value != new_value)
+        )
+
+    @callback
+    def state_automation_listener(
+        event: EventType[EventStateChangedData], _matched: bool
+    ) -> None:
+        """Listen for matching state changes and calls action."""
+        entity = event.data["entity_id"]
+        from_s = event.data["old_state"]
+        to_s = event.data["new_state"]
 
         @callback
         def call_action():
@@ -205,16 +204,12 @@ async def async_attach_trigger(
             if new_st is None:
                 return False
 
-            cur_value: str | None
-            if attribute is None:
-                cur_value = new_st.state
-            else:
-                cur_value = new_st.attributes.get(attribute)
+            cur_value = _get_value(new_st, attribute)
 
             if CONF_FROM in config and CONF_TO not in config:
-                return cur_value != old_value
+                return cur_value != _get_value(from_s, attribute)
 
-            return cur_value == new_value
+            return cur_value == _get_value(to_s, attribute)
 
         unsub_track_same[entity] = async_track_same_state(
             hass,
@@ -224,7 +219,21 @@ async def async_attach_trigger(
             entity_ids=entity,
         )
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    unsub = async_get_state_trigger_index(hass).async_add(
+        entity_ids,
+        IndexedStateTrigger(
+            trigger_info["name"],
+            state_trigger_predicate_key(
+                "state",
+                attribute,
+                _match_key(config, CONF_FROM, CONF_NOT_FROM),
+                _match_key(config, CONF_TO, CONF_NOT_TO),
+                match_all,
+            ),
+            state_predicate,
+            state_automation_listener,
+        ),
+    )
 
     @callback
     def async_remove():
@@ -235,3 +244,20 @@ async def async_attach_trigger(
         unsub_track_same.clear()
 
     return async_remove
+
+
+def _get_value(state: State | None, attribute: str | None) -> Any:
+    """Return the state or attribute value the trigger is matching on."""
+    if state is None:
+        return None
+    if attribute is None:
+        return state.state
+    return state.attributes.get(attribute)
+
+
+def _match_key(config: ConfigType, key: str, not_key: str) -> tuple[str, Any] | None:
+    """Return a hashable representation of a from or to match."""
+    for conf_key in (key, not_key):
+        if (value := config.get(conf_key)) is not None:
+            return (conf_key, tuple(value) if isinstance(value, list) else value)
+    return None
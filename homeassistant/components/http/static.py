@@ -4,10 +4,11 @@ from __future__ import annotations
 from collections.abc import Mapping
 import mimetypes
 from pathlib import Path
-from typing import Final
+from typing import Final, NamedTuple
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse, Request, StreamResponse
+from aiohttp.helpers import ETAG_ANY
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
 from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU
@@ -20,6 +21,37 @@ CACHE_TIME: Final = 31 * 86400  # = 1 month
 CACHE_HEADER = f"public, max-age={CACHE_TIME}"
 CACHE_HEADERS: Mapping[str, str] = {hdrs.CACHE_CONTROL: CACHE_HEADER}
 PATH_CACHE: LRU[tuple[str, Path, bool], tuple[Path | None, str | None]] = LRU(512)
+# Files up to this size are served from memory
+MAX_CACHED_FILE_SIZE: Final = 64 * 1024
+# Precompressed variants in order of preference
+ENCODING_SUFFIXES: Final = (("br", ".br"), ("gzip", ".gz"))
+# Requests that need the full handling of FileResponse
+FILE_RESPONSE_HEADERS: Final = (
+    hdrs.RANGE,
+    hdrs.IF_MATCH,
+    hdrs.IF_UNMODIFIED_SINCE,
+)
+
+
+class _CachedBody(NamedTuple):
+    """A file body held in memory."""
+
+    body: bytes
+    etag: str
+    last_modified: float
+
+
+class _CachedFile(NamedTuple):
+    """The bodies of a file by content encoding, empty if not kept in memory."""
+
+    bodies: dict[str | None, _CachedBody]
+    signature: tuple[tuple[int, int] | None, ...]
+    checked: float
+
+
+# Seconds before the files on disk are checked for changes
+FILE_CACHE_TTL: Final = 10
+FILE_CACHE: LRU[Path, _CachedFile] = LRU(256)
 
 
 def _get_file_path(rel_url: str, directory: Path, follow_symlinks: bool) -> Path | None:
@@ -41,15 +73,168 @@ def _get_file_path(rel_url: str, directory: Path, follow_symlinks: bool) -> Path
     raise FileNotFoundError
 
 
+def _read_file(filepath: Path) -> _CachedBody | None:
+    """Read a file if it is small enough to keep in memory."""
+    stat = filepath.stat()
+    if stat.st_size > MAX_CACHED_FILE_SIZE:
+        return None
+    return _CachedBody(
+        filepath.read_bytes(),
+        f"{stat.st_mtime_ns:x}-{stat.st_size:x}",
+        stat.st_mtime,
+    )
+
+
+def _stat_signature(filepath: Path) -> tuple[int, int] | None:
+    """Return the modification time and size of a file, or None if missing."""
+    try:
+        stat = filepath.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _file_signature(filepath: Path) -> tuple[tuple[int, int] | None, ...]:
+    """Return the signature of a file and its precompressed variants."""
+    return (
+        _stat_signature(filepath),
+        *(
+            _stat_signature(filepath.with_name(filepath.name + suffix))
+            for _, suffix in ENCODING_SUFFIXES
+        ),
+    )
+
+
+def _revalidate_file(filepath: Path, cached: _CachedFile, now: float) -> _CachedFile:
+    """Return the cached file, or load it again if it changed on disk."""
+    if _file_signature(filepath) == cached.signature:
+        return cached._replace(checked=now)
+    return _load_file(filepath, now)
+
+
+def _load_file(filepath: Path, now: float) -> _CachedFile:
+    """Load a file and its precompressed variants into memory."""
+    signature = _file_signature(filepath)
+    return _CachedFile(_read_bodies(filepath), signature, now)
+
+
+def _read_bodies(filepath: Path) -> dict[str | None, _CachedBody]:
+    """Read a file and its precompressed variants if they are small enough."""
+    try:
+        if (body := _read_file(filepath)) is None:
+            return {}
+    except OSError:
+        return {}
+    bodies: dict[str | None, _CachedBody] = {}
+    for encoding, suffix in ENCODING_SUFFIXES:
+        try:
+            encoded_body = _read_file(filepath.with_name(filepath.name + suffix))
+        except OSError:
+            continue
+        if encoded_body is not None:
+            bodies[encoding] = encoded_body
+    bodies[None] = body
+    return bodies
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    """Return the content codings of an Accept-Encoding header with q > 0."""
+    accepted: set[str] = set()
+    for part in accept_encoding.split(","):
+        coding, *params = part.split(";")
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0
+        if quality > 0:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def _cached_response(
+    request: Request, bodies: dict[str | None, _CachedBody], content_type: str
+) -> Response:
+    """Return a response for a file held in memory."""
+    encoding: str | None = None
+    if len(bodies) > 1 and (
+        accept_encoding := request.headers.get(hdrs.ACCEPT_ENCODING)
+    ):
+        accepted = _accepted_encodings(accept_encoding)
+        encoding = next((enc for enc in bodies if enc in accepted), None)
+    cached = bodies[encoding]
+
+    headers: dict[str, str] = {
+        hdrs.CACHE_CONTROL: CACHE_HEADER,
+        hdrs.CONTENT_TYPE: content_type,
+    }
+    if len(bodies) > 1:
+        headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+    if encoding is not None:
+        headers[hdrs.CONTENT_ENCODING] = encoding
+
+    if (if_none_match := request.if_none_match) is not None:
+        not_modified = any(
+            etag.value in (cached.etag, ETAG_ANY) for etag in if_none_match
+        )
+    elif (if_modified_since := request.if_modified_since) is not None:
+        not_modified = cached.last_modified <= if_modified_since.timestamp()
+    else:
+        not_modified = False
+
+    if not_modified:
+        response = Response(status=304, headers=headers)
+    else:
+        response = Response(body=cached.body, headers=headers)
+    response.etag = cached.etag  # type: ignore[assignment]
+    response.last_modified = cached.last_modified  # type: ignore[assignment]
+    return response
+
+
+def _file_response(
+    request: Request,
+    filepath: Path,
+    cached: _CachedFile,
+    content_type: str,
+    chunk_size: int,
+) -> FileResponse:
+    """Return a response sending a file or its precompressed variant from disk."""
+    headers: dict[str, str] = {
+        hdrs.CACHE_CONTROL: CACHE_HEADER,
+        hdrs.CONTENT_TYPE: content_type,
+    }
+    # The signature of a missing variant is None
+    available = [
+        (encoding, suffix)
+        for (encoding, suffix), signature in zip(
+            ENCODING_SUFFIXES, cached.signature[1:]
+        )
+        if signature is not None
+    ]
+    if available:
+        headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+        if accept_encoding := request.headers.get(hdrs.ACCEPT_ENCODING):
+            accepted = _accepted_encodings(accept_encoding)
+            for encoding, suffix in available:
+                if encoding in accepted:
+                    filepath = filepath.with_name(filepath.name + suffix)
+                    headers[hdrs.CONTENT_ENCODING] = encoding
+                    break
+    return FileResponse(filepath, chunk_size=chunk_size, headers=headers)
+
+
 class CachingStaticResource(StaticResource):
     """Static Resource handler that will add cache headers."""
 
     async def _handle(self, request: Request) -> StreamResponse:
-        """Return requested file from disk as a FileResponse."""
+        """Return requested file from memory or disk as a FileResponse."""
         rel_url = request.match_info["filename"]
         key = (rel_url, self._directory, self._follow_symlinks)
+        hass: HomeAssistant = request.app[KEY_HASS]
         if (filepath_content_type := PATH_CACHE.get(key)) is None:
-            hass: HomeAssistant = request.app[KEY_HASS]
             try:
                 filepath = await hass.async_add_executor_job(_get_file_path, *key)
             except (ValueError, FileNotFoundError) as error:
@@ -73,13 +258,23 @@ class CachingStaticResource(StaticResource):
             filepath, content_type = filepath_content_type
 
         if filepath and content_type:
-            return FileResponse(
-                filepath,
-                chunk_size=self._chunk_size,
-                headers={
-                    hdrs.CACHE_CONTROL: CACHE_HEADER,
-                    hdrs.CONTENT_TYPE: content_type,
-                },
+            now = hass.loop.time()
+            if (cached := FILE_CACHE.get(filepath)) is None:
+                cached = await hass.async_add_executor_job(_load_file, filepath, now)
+                FILE_CACHE[filepath] = cached
+            elif now - cached.checked > FILE_CACHE_TTL:
+                cached = await hass.async_add_executor_job(
+                    _revalidate_file, filepath, cached, now
+                )
+                FILE_CACHE[filepath] = cached
+            bodies = cached.bodies
+            if bodies and not any(
+                header in request.headers for header in FILE_RESPONSE_HEADERS
+            ):
+                return _cached_response(request, bodies, content_type)
+            # Large files are sent with sendfile
+            return _file_response(
+                request, filepath, cached, content_type, self._chunk_size
             )
 
         return await super()._handle(request)
@@ -412,12 +412,12 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa:
         base["params"] = data
         return base
 
-    async def async_handle_light_on_service(  # noqa: C901
+    def light_on_params(  # noqa: C901
         light: LightEntity, call: ServiceCall
-    ) -> None:
-        """Handle turning a light on.
+    ) -> dict[str, Any] | None:
+        """Return the params to turn a light on with.
 
-        If brightness is set to 0, this service will turn the light off.
+        Returns None if brightness is set to 0 and the light should be turned off.
         """
         params: dict[str, Any] = dict(call.data["params"])
 
@@ -619,20 +619,35 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa:
 
         # Remove deprecated white value if the light supports color mode
         if params.get(ATTR_BRIGHTNESS) == 0 or params.get(ATTR_WHITE) == 0:
-            await async_handle_light_off_service(light, call)
-        else:
-            await light.async_turn_on(**filter_turn_on_params(light, params))
+            return None
+        return filter_turn_on_params(light, params)
 
-    async def async_handle_light_off_service(
+    async def async_handle_light_on_service(
         light: LightEntity, call: ServiceCall
     ) -> None:
-        """Handle turning off a light."""
+        """Handle turning a light on.
+
+        If brightness is set to 0, this service will turn the light off.
+        """
+        if (params := light_on_params(light, call)) is None:
+            await async_handle_light_off_service(light, call)
+        else:
+            await light.async_turn_on(**params)
+
+    def light_off_params(light: LightEntity, call: ServiceCall) -> dict[str, Any]:
+        """Return the params to turn a light off with."""
         params = dict(call.data["params"])
 
         if ATTR_TRANSITION not in params:
             profiles.apply_default(light.entity_id, True, params)
 
-        await light.async_turn_off(**filter_turn_off_params(light, params))
+        return filter_turn_off_params(light, params)
+
+    async def async_handle_light_off_service(
+        light: LightEntity, call: ServiceCall
+    ) -> None:
+        """Handle turning off a light."""
+        await light.async_turn_off(**light_off_params(light, call))
 
     async def async_handle_toggle_service(
         light: LightEntity, call: ServiceCall
@@ -649,12 +664,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa:
         SERVICE_TURN_ON,
         vol.All(cv.make_entity_service_schema(LIGHT_TURN_ON_SCHEMA), preprocess_data),
         async_handle_light_on_service,
+        batch_params=light_on_params,
     )
 
     component.async_register_entity_service(
         SERVICE_TURN_OFF,
         vol.All(cv.make_entity_service_schema(LIGHT_TURN_OFF_SCHEMA), preprocess_data),
         async_handle_light_off_service,
+        batch_params=light_off_params,
     )
 
     component.async_register_entity_service(
@@ -6,10 +6,12 @@ from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
+import math
 from typing import Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -21,6 +23,7 @@ from homeassistant.components.recorder.models import (
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.util import (
+    chunked_or_all,
     execute_stmt_lambda_element,
     session_scope,
 )
@@ -62,8 +65,9 @@ from .const import (
 )
 from .helpers import is_sensor_continuous
 from .models import EventAsRow, LazyEventPartialState, LogbookConfig, async_event_to_row
-from .queries import statement_for_request
+from .queries import page_statement_for_request, statement_for_request
 from .queries.common import PSEUDO_EVENT_STATE_CHANGED
+from .queries.contexts import context_rows_stmt
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -142,32 +146,111 @@ class EventProcessor:
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
-                )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
-                )
-            )
-            stmt = statement_for_request(
-                start_day,
-                end_day,
+            return self.humanify(self._get_rows(session, start_day, end_day))
+
+    def get_events_page(
+        self,
+        start_day: dt,
+        end_day: dt,
+        limit: int,
+        cursor: tuple[float, int] | None = None,
+    ) -> tuple[list[dict[str, Any]], tuple[float, int] | None]:
+        """Get a page of events for a period of time.
+
+        At most limit rows are selected from the database. Returns the events
+        and the cursor to continue the next page from, which is None when the
+        page is the last one of the period. The cursor is the time of the last
+        row of the page and the number of rows at that time on this and the
+        earlier pages.
+        """
+        start_day_ts = dt_util.utc_to_timestamp(start_day)
+        end_day_ts = dt_util.utc_to_timestamp(end_day)
+        skip = 0
+        if cursor is not None and cursor[0] >= start_day_ts:
+            # Select the rows at the time of the cursor again,
+            # and skip the ones that were on the earlier pages
+            start_day_ts = math.nextafter(cursor[0], -math.inf)
+            skip = cursor[1]
+        with session_scope(hass=self.hass, read_only=True) as session:
+            metadata_ids, event_type_ids = self._get_ids(session)
+            stmt = page_statement_for_request(
+                start_day_ts,
+                end_day_ts,
                 event_type_ids,
                 self.entity_ids,
                 metadata_ids,
                 self.device_ids,
                 self.filters,
                 self.context_id,
+                limit + skip,
+            )
+            rows = list(execute_stmt_lambda_element(session, stmt, orm_rows=False))
+            page = rows[skip:]
+            self._load_context_rows(session, page)
+        if len(rows) < limit + skip:
+            return self.humanify(page), None
+        last_time_fired_ts = rows[-1].time_fired_ts
+        offset = sum(1 for row in rows if row.time_fired_ts == last_time_fired_ts)
+        return self.humanify(page), (last_time_fired_ts, offset)
+
+    def _get_ids(self, session: Session) -> tuple[list[int] | None, tuple[int, ...]]:
+        """Get the states metadata ids and event type ids to select."""
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
             )
+        )
+        return metadata_ids, event_type_ids
+
+    def _get_rows(
+        self,
+        session: Session,
+        start_day: dt,
+        end_day: dt,
+    ) -> Sequence[Row] | Result:
+        """Select the rows for a period of time."""
+        metadata_ids, event_type_ids = self._get_ids(session)
+        stmt = statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            self.entity_ids,
+            metadata_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+        )
+        return execute_stmt_lambda_element(session, stmt, orm_rows=False)
+
+    def _load_context_rows(self, session: Session, rows: Sequence[Row]) -> None:
+        """Load the first row of each context of the rows into the context lookup.
+
+        A page does not include the rows of the earlier pages, or the rows
+        before the start of the period, so the rows that started the contexts
+        are looked up by their context id instead.
+        """
+        context_lookup = self.logbook_run.context_lookup
+        context_ids_bin = {
+            context_id_bin
+            for row in rows
+            for context_id_bin in (row.context_id_bin, row.context_parent_id_bin)
+            if context_id_bin not in context_lookup
+        }
+        if not context_ids_bin:
+            return
+        # The context ids are bound twice for events and twice for states
+        max_bind_vars = get_instance(self.hass).max_bind_vars // 4
+        for context_ids_chunk in chunked_or_all(context_ids_bin, max_bind_vars):
+            for row in execute_stmt_lambda_element(
+                session, context_rows_stmt(context_ids_chunk), orm_rows=False
+            ):
+                context_lookup.setdefault(row.context_id_bin, row)
 
     def humanify(
         self, rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result
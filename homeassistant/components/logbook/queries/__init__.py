@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections.abc import Collection
 from datetime import datetime as dt
 
+from sqlalchemy import literal_column
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.components.recorder.filters import Filters
@@ -28,8 +29,65 @@ def statement_for_request(
     context_id: str | None = None,
 ) -> StatementLambdaElement:
     """Generate the logbook statement for a logbook request."""
-    start_day = dt_util.utc_to_timestamp(start_day_dt)
-    end_day = dt_util.utc_to_timestamp(end_day_dt)
+    return _statement_for_request(
+        dt_util.utc_to_timestamp(start_day_dt),
+        dt_util.utc_to_timestamp(end_day_dt),
+        event_type_ids,
+        entity_ids,
+        states_metadata_ids,
+        device_ids,
+        filters,
+        context_id,
+        True,
+    )
+
+
+def page_statement_for_request(
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+    entity_ids: list[str] | None,
+    states_metadata_ids: Collection[int] | None,
+    device_ids: list[str] | None,
+    filters: Filters | None,
+    context_id: str | None,
+    limit: int,
+) -> StatementLambdaElement:
+    """Generate the logbook statement for a page of a logbook request.
+
+    The rows that are only selected to link contexts are left out, they are
+    looked up by context id for the rows of the page instead. Rows with the
+    same time are ordered by their row id so a page can end between them.
+    """
+    stmt = _statement_for_request(
+        start_day,
+        end_day,
+        event_type_ids,
+        entity_ids,
+        states_metadata_ids,
+        device_ids,
+        filters,
+        context_id,
+        False,
+    )
+    stmt += lambda s: s.order_by(
+        literal_column("row_id"), literal_column("event_type")
+    ).limit(limit)
+    return stmt
+
+
+def _statement_for_request(
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+    entity_ids: list[str] | None,
+    states_metadata_ids: Collection[int] | None,
+    device_ids: list[str] | None,
+    filters: Filters | None,
+    context_id: str | None,
+    context_rows: bool,
+) -> StatementLambdaElement:
+    """Generate the logbook statement ordered by time."""
     # No entities: logbook sends everything for the timeframe
     # limited by the context_id and the yaml configured filter
     if not entity_ids and not device_ids:
@@ -56,6 +114,7 @@ def statement_for_request(
             states_metadata_ids or [],
             [json_dumps(entity_id) for entity_id in entity_ids],
             [json_dumps(device_id) for device_id in device_ids],
+            context_rows,
         )
 
     # entities: logbook sends everything for the timeframe for the entities
@@ -66,6 +125,7 @@ def statement_for_request(
             event_type_ids,
             states_metadata_ids or [],
             [json_dumps(entity_id) for entity_id in entity_ids],
+            context_rows,
         )
 
     # devices: logbook sends everything for the timeframe for the devices
@@ -75,4 +135,5 @@ def statement_for_request(
         end_day,
         event_type_ids,
         [json_dumps(device_id) for device_id in device_ids],
+        context_rows,
     )
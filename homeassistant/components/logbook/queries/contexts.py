@@ -0,0 +1,67 @@
+"""Context queries for logbook."""
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from sqlalchemy import func, lambda_stmt, select
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    States,
+    StatesMeta,
+)
+
+from .common import (
+    apply_events_context_hints,
+    apply_states_context_hints,
+    select_events_context_only,
+    select_states_context_only,
+)
+
+
+def context_rows_stmt(context_ids_bin: Collection[bytes]) -> StatementLambdaElement:
+    """Generate a logbook query for the first rows of the given context ids.
+
+    Only the earliest event and the earliest state of each context are
+    selected, since only the row that started a context is used to
+    describe it.
+    """
+    return lambda_stmt(
+        lambda: apply_events_context_hints(
+            select_events_context_only()
+            .join(
+                first_events := select(
+                    Events.context_id_bin,
+                    func.min(Events.time_fired_ts).label("time_fired_ts"),
+                )
+                .where(Events.context_id_bin.in_(context_ids_bin))
+                .group_by(Events.context_id_bin)
+                .subquery(),
+                (Events.context_id_bin == first_events.c.context_id_bin)
+                & (Events.time_fired_ts == first_events.c.time_fired_ts),
+            )
+            .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
+            .outerjoin(EventData, (Events.data_id == EventData.data_id))
+        )
+        .union_all(
+            apply_states_context_hints(
+                select_states_context_only()
+                .join(
+                    first_states := select(
+                        States.context_id_bin,
+                        func.min(States.last_updated_ts).label("last_updated_ts"),
+                    )
+                    .where(States.context_id_bin.in_(context_ids_bin))
+                    .group_by(States.context_id_bin)
+                    .subquery(),
+                    (States.context_id_bin == first_states.c.context_id_bin)
+                    & (States.last_updated_ts == first_states.c.last_updated_ts),
+                )
+                .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+            )
+        )
+        .order_by(Events.time_fired_ts)
+    )
@@ -107,8 +107,22 @@ def entities_devices_stmt(
     states_metadata_ids: Collection[int],
     json_quoted_entity_ids: list[str],
     json_quoted_device_ids: list[str],
+    context_rows: bool = True,
 ) -> StatementLambdaElement:
     """Generate a logbook query for multiple entities."""
+    if not context_rows:
+        return lambda_stmt(
+            lambda: select_events_without_states(start_day, end_day, event_type_ids)
+            .where(
+                _apply_event_entity_id_device_id_matchers(
+                    json_quoted_entity_ids, json_quoted_device_ids
+                )
+            )
+            .union_all(
+                states_select_for_entity_ids(start_day, end_day, states_metadata_ids)
+            )
+            .order_by(Events.time_fired_ts)
+        )
     stmt = lambda_stmt(
         lambda: _apply_entities_devices_context_union(
             select_events_without_states(start_day, end_day, event_type_ids).where(
@@ -444,6 +444,23 @@ def _ws_formatted_get_events(
     )
 
 
+def _ws_formatted_get_events_page(
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    limit: int,
+    cursor: tuple[float, int] | None,
+    event_processor: EventProcessor,
+) -> str:
+    """Fetch a page of events and convert it to json in the executor."""
+    events, next_cursor = event_processor.get_events_page(
+        start_time, end_time, limit, cursor
+    )
+    return JSON_DUMP(
+        messages.result_message(msg_id, {"events": events, "cursor": next_cursor})
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "logbook/get_events",
@@ -452,6 +469,10 @@ def _ws_formatted_get_events(
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
         vol.Optional("context_id"): str,
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1)),
+        vol.Optional("cursor"): vol.ExactSequence(
+            [vol.Coerce(float), vol.All(int, vol.Range(min=0))]
+        ),
     }
 )
 @websocket_api.async_response
@@ -477,8 +498,17 @@ async def ws_get_events(
         connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
         return
 
+    limit: int | None = msg.get("limit")
+    cursor: tuple[float, int] | None = None
+    if (cursor_list := msg.get("cursor")) is not None:
+        # The time of the last row of the previous page
+        # and the number of rows at that time already sent
+        cursor = (cursor_list[0], cursor_list[1])
+
     if start_time > utc_now:
-        connection.send_result(msg["id"], [])
+        connection.send_result(
+            msg["id"], {"events": [], "cursor": None} if limit else []
+        )
         return
 
     device_ids = msg.get("device_ids")
@@ -488,7 +518,9 @@ async def ws_get_events(
         entity_ids = async_filter_entities(hass, entity_ids)
         if not entity_ids and not device_ids:
             # Everything has been filtered away
-            connection.send_result(msg["id"], [])
+            connection.send_result(
+                msg["id"], {"events": [], "cursor": None} if limit else []
+            )
             return
 
     event_types = async_determine_event_types(hass, entity_ids, device_ids)
@@ -503,6 +535,20 @@ async def ws_get_events(
         include_entity_name=False,
     )
 
+    if limit:
+        connection.send_message(
+            await get_instance(hass).async_add_executor_job(
+                _ws_formatted_get_events_page,
+                msg["id"],
+                start_time,
+                end_time,
+                limit,
+                cursor,
+                event_processor,
+            )
+        )
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_formatted_get_events,
@@ -20,10 +20,16 @@ from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.entity import (
+    async_get_state_write_profile,
+    async_start_state_write_profile,
+    async_stop_state_write_profile,
+)
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
 
-from .const import DOMAIN
+from .const import DOMAIN, STATE_WRITE_PROFILE
+from .websocket_api import async_load_websocket_api
 
 SERVICE_START = "start"
 SERVICE_MEMORY = "memory"
@@ -35,6 +41,7 @@ SERVICE_DUMP_LOG_OBJECTS = "dump_log_objects"
 SERVICE_LRU_STATS = "lru_stats"
 SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
+SERVICE_STATE_WRITE_STATS = "state_write_stats"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -57,6 +64,7 @@ SERVICES = (
     SERVICE_LRU_STATS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_STATE_WRITE_STATS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -254,6 +262,52 @@ async def async_setup_entry(  # noqa: C901
             arepr.maxstring = original_maxstring
             arepr.maxother = original_maxother
 
+    async def _async_state_write_stats(call: ServiceCall) -> None:
+        """Collect and log statistics of state writes of entities."""
+        if async_get_state_write_profile(hass) is not None:
+            raise HomeAssistantError("State write statistics already running")
+
+        profile = domain_data[STATE_WRITE_PROFILE] = async_start_state_write_profile(
+            hass
+        )
+        persistent_notification.async_create(
+            hass,
+            (
+                "Collecting state write statistics has started. This notification"
+                " will be updated when it is complete."
+            ),
+            title="State write statistics started",
+            notification_id="profile_state_write_stats",
+        )
+        try:
+            await asyncio.sleep(float(call.data[CONF_SECONDS]))
+        finally:
+            async_stop_state_write_profile(hass)
+
+        for stats in profile.as_list():
+            _LOGGER.critical(
+                (
+                    "State writes of %s from %s: %s (%.2f/s), %s unchanged, %.3fs"
+                    " calculating state, %.3fs setting state"
+                ),
+                stats["entity_class"],
+                stats["integration"],
+                stats["writes"],
+                stats["writes_per_second"],
+                stats["unchanged_writes"],
+                stats["calculate_time"],
+                stats["set_time"],
+            )
+        persistent_notification.async_create(
+            hass,
+            (
+                "State write statistics have been dumped to the log. See [the"
+                " logs](/config/logs) to review the stats."
+            ),
+            title="State write statistics completed",
+            notification_id="profile_state_write_stats",
+        )
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -348,6 +402,18 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_scheduled,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STATE_WRITE_STATS,
+        _async_state_write_stats,
+        schema=vol.Schema(
+            {vol.Optional(CONF_SECONDS, default=60.0): vol.Coerce(float)}
+        ),
+    )
+
+    async_load_websocket_api(hass)
+
     return True
 
 
@@ -357,6 +423,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    async_stop_state_write_profile(hass)
     hass.data.pop(DOMAIN)
     return True
 
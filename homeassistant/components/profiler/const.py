@@ -2,3 +2,5 @@
 
 DOMAIN = "profiler"
 DEFAULT_NAME = "Profiler"
+
+STATE_WRITE_PROFILE = "state_write_profile"
@@ -0,0 +1,45 @@
+"""Websocket API handlers for the profiler integration."""
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.components.websocket_api.connection import ActiveConnection
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import (
+    StateWriteProfile,
+    async_get_state_write_profile,
+)
+
+from .const import DOMAIN, STATE_WRITE_PROFILE
+
+
+@callback
+def async_load_websocket_api(hass: HomeAssistant) -> None:
+    """Set up the websocket API."""
+    websocket_api.async_register_command(hass, handle_state_write_stats)
+
+
+@callback
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/state_write_stats"})
+def handle_state_write_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle statistics of state writes of entities.
+
+    Returns the statistics being collected, or the last collected statistics.
+    """
+    running = True
+    profile: StateWriteProfile | None
+    if (profile := async_get_state_write_profile(hass)) is None:
+        running = False
+        profile = hass.data.get(DOMAIN, {}).get(STATE_WRITE_PROFILE)
+    connection.send_result(
+        msg["id"],
+        {
+            "running": running,
+            "duration": profile.duration if profile else 0.0,
+            "stats": profile.as_list() if profile else [],
+        },
+    )
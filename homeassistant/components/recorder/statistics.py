@@ -222,12 +222,12 @@ def get_display_unit(
     return state_unit
 
 
-def _get_statistic_to_display_unit_converter(
+def _get_statistic_to_display_unit(
     statistic_unit: str | None,
     state_unit: str | None,
     requested_units: dict[str, str] | None,
-) -> Callable[[float | None], float | None] | None:
-    """Prepare a converter from the statistics unit to display unit."""
+) -> tuple[type[BaseUnitConverter], str | None] | None:
+    """Return the converter and display unit, or None if no conversion is needed."""
     if (converter := STATISTIC_UNIT_TO_UNIT_CONVERTER.get(statistic_unit)) is None:
         return None
 
@@ -245,11 +245,45 @@ def _get_statistic_to_display_unit_converter(
     if display_unit == statistic_unit:
         return None
 
+    return converter, display_unit
+
+
+def _get_statistic_to_display_unit_converter(
+    statistic_unit: str | None,
+    state_unit: str | None,
+    requested_units: dict[str, str] | None,
+) -> Callable[[float | None], float | None] | None:
+    """Prepare a converter from the statistics unit to display unit."""
+    if not (
+        converter_unit := _get_statistic_to_display_unit(
+            statistic_unit, state_unit, requested_units
+        )
+    ):
+        return None
+    converter, display_unit = converter_unit
     return converter.converter_factory_allow_none(
         from_unit=statistic_unit, to_unit=display_unit
     )
 
 
+def _get_statistic_to_display_unit_batch_converter(
+    statistic_unit: str | None,
+    state_unit: str | None,
+    requested_units: dict[str, str] | None,
+) -> Callable[[Iterable[float | None]], list[float | None]] | None:
+    """Prepare a converter of many values from the statistics unit to display unit."""
+    if not (
+        converter_unit := _get_statistic_to_display_unit(
+            statistic_unit, state_unit, requested_units
+        )
+    ):
+        return None
+    converter, display_unit = converter_unit
+    return converter.converter_factory_allow_none_batch(
+        from_unit=statistic_unit, to_unit=display_unit
+    )
+
+
 def _get_display_to_statistic_unit_converter(
     display_unit: str | None,
     statistic_unit: str | None,
@@ -1994,7 +2028,7 @@ def _statistics_at_time(
 def _fast_build_sum_list(
     stats_list: list[Row],
     table_duration_seconds: float,
-    convert: Callable | None,
+    convert: Callable[[Iterable[float | None]], list[float | None]] | None,
     start_ts_idx: int,
     sum_idx: int,
 ) -> list[StatisticsRow]:
@@ -2004,9 +2038,11 @@ def _fast_build_sum_list(
             {
                 "start": (start_ts := db_state[start_ts_idx]),
                 "end": start_ts + table_duration_seconds,
-                "sum": convert(db_state[sum_idx]),
+                "sum": sum_,
             }
-            for db_state in stats_list
+            for db_state, sum_ in zip(
+                stats_list, convert([db_state[sum_idx] for db_state in stats_list])
+            )
         ]
     return [
         {
@@ -2073,7 +2109,9 @@ def _sorted_statistics_to_dict(  # noqa: C901
             state_unit = unit = metadata_by_id["unit_of_measurement"]
             if state := hass.states.get(statistic_id):
                 state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-            convert = _get_statistic_to_display_unit_converter(unit, state_unit, units)
+            convert = _get_statistic_to_display_unit_batch_converter(
+                unit, state_unit, units
+            )
         else:
             convert = None
 
@@ -2101,7 +2139,20 @@ def _sorted_statistics_to_dict(  # noqa: C901
         # Specifically, we want to avoid function calls,
         # attribute lookups, and dict lookups as much as possible.
         #
-        for db_state in stats_list:
+        if convert:
+            # Convert whole columns at once, instead of calling
+            # the converter for each value
+            if mean_idx is not None:
+                means = convert([db_state[mean_idx] for db_state in stats_list])
+            if min_idx is not None:
+                mins = convert([db_state[min_idx] for db_state in stats_list])
+            if max_idx is not None:
+                maxs = convert([db_state[max_idx] for db_state in stats_list])
+            if state_idx is not None:
+                states = convert([db_state[state_idx] for db_state in stats_list])
+            if sum_idx is not None:
+                sums = convert([db_state[sum_idx] for db_state in stats_list])
+        for row_idx, db_state in enumerate(stats_list):
             row: StatisticsRow = {
                 "start": (start_ts := db_state[start_ts_idx]),
                 "end": start_ts + table_duration_seconds,
@@ -2110,15 +2161,15 @@ def _sorted_statistics_to_dict(  # noqa: C901
                 row["last_reset"] = db_state[last_reset_ts_idx]
             if convert:
                 if mean_idx is not None:
-                    row["mean"] = convert(db_state[mean_idx])
+                    row["mean"] = means[row_idx]
                 if min_idx is not None:
-                    row["min"] = convert(db_state[min_idx])
+                    row["min"] = mins[row_idx]
                 if max_idx is not None:
-                    row["max"] = convert(db_state[max_idx])
+                    row["max"] = maxs[row_idx]
                 if state_idx is not None:
-                    row["state"] = convert(db_state[state_idx])
+                    row["state"] = states[row_idx]
                 if sum_idx is not None:
-                    row["sum"] = convert(db_state[sum_idx])
+                    row["sum"] = sums[row_idx]
             else:
                 if mean_idx is not None:
                     row["mean"] = db_state[mean_idx]
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 import logging
 from typing import Any, cast
 
@@ -49,6 +49,7 @@ from homeassistant.helpers.script import (
     CONF_MAX,
     CONF_MAX_EXCEEDED,
     Script,
+    async_get_service_concurrency_limit,
     script_stack_cv,
 )
 from homeassistant.helpers.service import async_set_service_schema
@@ -57,7 +58,7 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 from homeassistant.util.dt import parse_datetime
 
-from .config import ScriptConfig
+from .config import ScriptConfig, async_setup_validated_configs
 from .const import (
     ATTR_LAST_ACTION,
     ATTR_LAST_TRIGGERED,
@@ -188,6 +189,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     # Register script as valid domain for Blueprint
     async_get_blueprints(hass)
 
+    async_setup_validated_configs(hass)
     await _async_process_config(hass, config, component)
 
     # Add some default blueprints to blueprints/script, does nothing
@@ -244,6 +246,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         DOMAIN, SERVICE_TOGGLE, toggle_service, schema=SCRIPT_TURN_ONOFF_SCHEMA
     )
     websocket_api.async_register_command(hass, websocket_config)
+    websocket_api.async_register_command(hass, websocket_concurrency_stats)
 
     return True
 
@@ -664,3 +667,18 @@ def websocket_config(
             "config": script.raw_config,
         },
     )
+
+
+@callback
+@websocket_api.require_admin
+@websocket_api.websocket_command({"type": "script/concurrency_stats"})
+def websocket_concurrency_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Get the statistics of the concurrency limits of service calls."""
+    stats = async_get_service_concurrency_limit(hass).async_get_stats()
+    connection.send_result(
+        msg["id"], {key: asdict(key_stats) for key, key_stats in stats.items()}
+    )
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from contextlib import suppress
+from copy import deepcopy
 from typing import Any
 
 import voluptuous as vol
@@ -28,9 +29,9 @@ from homeassistant.const import (
     SERVICE_TURN_OFF,
     SERVICE_TURN_ON,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import config_validation as cv, device_registry as dr
 from homeassistant.helpers.script import (
     SCRIPT_MODE_SINGLE,
     async_validate_actions_config,
@@ -53,6 +54,8 @@ from .helpers import async_get_blueprints
 
 PACKAGE_MERGE_HINT = "dict"
 
+DATA_VALIDATED_CONFIGS = "script_validated_configs"
+
 _MINIMAL_SCRIPT_ENTITY_SCHEMA = vol.Schema(
     {
         CONF_ALIAS: cv.string,
@@ -256,16 +259,36 @@ async def async_validate_config_item(
 
 
 async def async_validate_config(hass, config):
-    """Validate config."""
+    """Validate config.
+
+    Scripts whose configuration is unchanged since the previous validation
+    reuse the previously validated configuration.
+    """
+    previous: dict[str, tuple[Any, ScriptConfig]] = hass.data.get(
+        DATA_VALIDATED_CONFIGS, {}
+    )
+    validated: dict[str, tuple[Any, ScriptConfig]] = {}
     scripts = {}
     for _, p_config in config_per_platform(config, DOMAIN):
         for object_id, cfg in p_config.items():
             if object_id in scripts:
                 LOGGER.warning("Duplicate script detected with name: '%s'", object_id)
                 continue
+            if (
+                (cached := previous.get(object_id))
+                and cached[0] == cfg
+                and not is_blueprint_instance_config(cfg)
+            ):
+                validated[object_id] = cached
+                scripts[object_id] = cached[1]
+                continue
+            raw_cfg = cfg
             cfg = await _try_async_validate_config_item(hass, object_id, cfg)
             if cfg is not None:
                 scripts[object_id] = cfg
+                if not cfg.validation_failed:
+                    validated[object_id] = (deepcopy(raw_cfg), cfg)
+    hass.data[DATA_VALIDATED_CONFIGS] = validated
 
     # Create a copy of the configuration with all config for current
     # component removed and add validated config back in.
@@ -273,3 +296,24 @@ async def async_validate_config(hass, config):
     config[DOMAIN] = scripts
 
     return config
+
+
+@callback
+def async_setup_validated_configs(hass: HomeAssistant) -> None:
+    """Drop the previous validation results when the device registry is updated.
+
+    Device triggers, conditions and actions are validated against the device
+    registry, so a previous validation result is only reused while the device
+    registry is unchanged.
+    """
+
+    @callback
+    def _async_device_registry_updated(event: Event) -> None:
+        """Drop the previous validation results."""
+        hass.data.pop(DATA_VALIDATED_CONFIGS, None)
+
+    hass.bus.async_listen(
+        dr.EVENT_DEVICE_REGISTRY_UPDATED,
+        _async_device_registry_updated,
+        run_immediately=True,
+    )
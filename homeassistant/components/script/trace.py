@@ -7,10 +7,12 @@ from typing import Any
 
 from homeassistant.components.trace import (
     CONF_STORED_TRACES,
+    CONF_TRACE_LEVEL,
     ActionTrace,
     async_store_trace,
 )
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import TraceLevel, trace_level
 
 from .const import DOMAIN
 
@@ -32,10 +34,13 @@ def trace_script(
 ) -> Iterator[ScriptTrace]:
     """Trace execution of a script."""
     trace = ScriptTrace(item_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    level: TraceLevel = trace_config[CONF_TRACE_LEVEL]
+    if level is not TraceLevel.OFF:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
 
     try:
-        yield trace
+        with trace_level(level):
+            yield trace
     except Exception as ex:
         if item_id:
             trace.set_error(ex)
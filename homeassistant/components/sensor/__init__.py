@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
@@ -224,6 +224,11 @@ class SensorEntity(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     _last_reset_reported = False
     _sensor_option_display_precision: int | None = None
     _sensor_option_unit_of_measurement: str | None | UndefinedType = UNDEFINED
+    # Cached unit conversion, see _get_unit_conversion
+    _sensor_unit_conversion: tuple[
+        tuple[SensorDeviceClass | None, str | None, str | None],
+        tuple[Callable[[float], float], int] | None,
+    ] | None = None
 
     @callback
     def add_to_platform_start(
@@ -667,14 +672,18 @@ class SensorEntity(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
                 f"'{numerical_value}'"
             )
 
-        if native_unit_of_measurement != unit_of_measurement and (
-            converter := UNIT_CONVERTERS.get(device_class)
+        if (
+            native_unit_of_measurement != unit_of_measurement
+            and (
+                unit_conversion := self._get_unit_conversion(
+                    device_class, native_unit_of_measurement, unit_of_measurement
+                )
+            )
+            is not None
         ):
             # Unit conversion needed
-            converted_numerical_value = converter.converter_factory(
-                native_unit_of_measurement,
-                unit_of_measurement,
-            )(float(numerical_value))
+            convert, precision_scale = unit_conversion
+            converted_numerical_value = convert(float(numerical_value))
 
             # If unit conversion is happening, and there's no rounding for display,
             # do a best effort rounding here.
@@ -686,19 +695,7 @@ class SensorEntity(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
                 value_s = str(value)
                 precision = (
                     len(value_s) - value_s.index(".") - 1 if "." in value_s else 0
-                )
-
-                # Scale the precision when converting to a larger unit
-                # For example 1.1 Wh should be rendered as 0.0011 kWh, not 0.0 kWh
-                ratio_log = max(
-                    0,
-                    log10(
-                        converter.get_unit_ratio(
-                            native_unit_of_measurement, unit_of_measurement
-                        )
-                    ),
-                )
-                precision = precision + floor(ratio_log)
+                ) + precision_scale
 
                 value = f"{converted_numerical_value:z.{precision}f}"
             else:
@@ -733,6 +730,41 @@ class SensorEntity(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
 
         return value
 
+    def _get_unit_conversion(
+        self,
+        device_class: SensorDeviceClass | None,
+        native_unit_of_measurement: str | None,
+        unit_of_measurement: str | None,
+    ) -> tuple[Callable[[float], float], int] | None:
+        """Return a function converting to the unit of measurement, and a scale.
+
+        The scale is added to the precision of the native value when converting to
+        a larger unit, for example 1.1 Wh should be rendered as 0.0011 kWh, not
+        0.0 kWh. The result is cached until the units or device class change.
+        """
+        key = (device_class, native_unit_of_measurement, unit_of_measurement)
+        if (cached := self._sensor_unit_conversion) is not None and cached[0] == key:
+            return cached[1]
+
+        unit_conversion: tuple[Callable[[float], float], int] | None = None
+        if converter := UNIT_CONVERTERS.get(device_class):
+            ratio_log = max(
+                0,
+                log10(
+                    converter.get_unit_ratio(
+                        native_unit_of_measurement, unit_of_measurement
+                    )
+                ),
+            )
+            unit_conversion = (
+                converter.converter_factory(
+                    native_unit_of_measurement, unit_of_measurement
+                ),
+                floor(ratio_log),
+            )
+        self._sensor_unit_conversion = (key, unit_conversion)
+        return unit_conversion
+
     def _suggested_precision_or_none(self) -> int | None:
         """Return suggested display precision, or None if not set."""
         assert self.registry_entry
@@ -821,6 +853,7 @@ class SensorEntity(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         Called when the entity registry entry has been updated and before the sensor is
         added to the state machine.
         """
+        self._sensor_unit_conversion = None
         self._sensor_option_display_precision = self._suggested_precision_or_none()
         assert self.registry_entry
         if (
@@ -13,12 +13,14 @@ from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.storage import Store
+from homeassistant.helpers.trace import TraceLevel
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 
 from . import websocket_api
 from .const import (
     CONF_STORED_TRACES,
+    CONF_TRACE_LEVEL,
     DATA_TRACE,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
@@ -34,7 +36,8 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_TRACE_LEVEL, default=TraceLevel.FULL): vol.Coerce(TraceLevel),
 }
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -1,6 +1,7 @@
 """Shared constants for script and automation tracing and debugging."""
 
 CONF_STORED_TRACES = "stored_traces"
+CONF_TRACE_LEVEL = "trace_level"
 DATA_TRACE = "trace"
 DATA_TRACE_STORE = "trace_store"
 DATA_TRACES_RESTORED = "trace_traces_restored"
@@ -1,7 +1,7 @@
 """Handle the auth of a connection."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Coroutine
 from typing import TYPE_CHECKING, Any, Final
 
 from aiohttp.web import Request
@@ -60,10 +60,12 @@ class AuthPhase:
         send_message: Callable[[str | dict[str, Any]], None],
         cancel_ws: CALLBACK_TYPE,
         request: Request,
+        drain: Callable[[], Coroutine[Any, Any, None]] | None = None,
     ) -> None:
         """Initialize the authentiated connection."""
         self._hass = hass
         self._send_message = send_message
+        self._drain = drain
         self._cancel_ws = cancel_ws
         self._logger = logger
         self._request = request
@@ -106,5 +108,10 @@ class AuthPhase:
         process_success_login(self._request)
         self._send_message(auth_ok_message())
         return ActiveConnection(
-            self._logger, self._hass, self._send_message, user, refresh_token
+            self._logger,
+            self._hass,
+            self._send_message,
+            user,
+            refresh_token,
+            self._drain,
         )
@@ -19,6 +19,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     HomeAssistant,
@@ -35,6 +36,7 @@ from homeassistant.exceptions import (
 )
 from homeassistant.helpers import config_validation as cv, entity, template
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entityfilter import generate_filter
 from homeassistant.helpers.event import (
     EventStateChangedData,
     TrackTemplate,
@@ -107,6 +109,7 @@ def _forward_events_check_permissions(
     send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
     user: User,
     msg_id: int,
+    event_message: Callable[[int, Event], str],
     event: Event,
 ) -> None:
     """Forward state changed events to websocket."""
@@ -117,54 +120,122 @@ def _forward_events_check_permissions(
         POLICY_READ
     ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
         return
-    send_message(messages.cached_event_message(msg_id, event))
+    send_message(event_message(msg_id, event))
 
 
 @callback
 def _forward_events_unconditional(
     send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
     msg_id: int,
+    event_message: Callable[[int, Event], str],
     event: Event,
 ) -> None:
     """Forward events to websocket."""
-    send_message(messages.cached_event_message(msg_id, event))
+    send_message(event_message(msg_id, event))
+
+
+@callback
+def _entity_event_filter(entity_filter: Callable[[str], bool], event: Event) -> bool:
+    """Filter events by the entity_id in their data."""
+    entity_id = event.data.get("entity_id")
+    return isinstance(entity_id, str) and entity_filter(entity_id)
 
 
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_events",
-        vol.Optional("event_type", default=MATCH_ALL): str,
+        vol.Optional("event_type", default=MATCH_ALL): vol.Any(
+            str, vol.All([str], vol.Length(min=1))
+        ),
+        vol.Optional("entity_ids"): [str],
+        vol.Optional("domains"): [str],
+        vol.Optional("include_attributes"): [str],
+        vol.Optional("exclude_attributes"): [str],
     }
 )
 def handle_subscribe_events(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle subscribe events command."""
-    event_type = msg["event_type"]
-
-    if event_type not in SUBSCRIBE_ALLOWLIST and not connection.user.is_admin:
-        _LOGGER.error(
-            "Refusing to allow %s to subscribe to event %s",
-            connection.user.name,
-            event_type,
+    event_types: list[str]
+    if isinstance(msg["event_type"], str):
+        event_types = [msg["event_type"]]
+    elif MATCH_ALL in msg["event_type"]:
+        event_types = [MATCH_ALL]
+    else:
+        # Each event type is only listened to once
+        event_types = list(dict.fromkeys(msg["event_type"]))
+
+    for event_type in event_types:
+        if event_type not in SUBSCRIBE_ALLOWLIST and not connection.user.is_admin:
+            _LOGGER.error(
+                "Refusing to allow %s to subscribe to event %s",
+                connection.user.name,
+                event_type,
+            )
+            raise Unauthorized(user_id=connection.user.id)
+
+    event_message: Callable[[int, Event], str] = messages.cached_event_message
+    if "include_attributes" in msg or "exclude_attributes" in msg:
+        # Connections with the same attribute filter share the serialized events
+        event_message = partial(
+            messages.cached_filtered_event_message,
+            include_attributes=(
+                frozenset(msg["include_attributes"])
+                if "include_attributes" in msg
+                else None
+            ),
+            exclude_attributes=(
+                frozenset(msg["exclude_attributes"])
+                if "exclude_attributes" in msg
+                else None
+            ),
         )
-        raise Unauthorized(user_id=connection.user.id)
 
-    if event_type == EVENT_STATE_CHANGED:
-        forward_events = partial(
-            _forward_events_check_permissions,
-            connection.send_message,
-            connection.user,
-            msg["id"],
+    event_filter: Callable[[Event], bool] | None = None
+    if "entity_ids" in msg or "domains" in msg:
+        event_filter = partial(
+            _entity_event_filter,
+            generate_filter(
+                msg.get("domains", []), [], [], [], msg.get("entity_ids", [])
+            ),
         )
-    else:
-        forward_events = partial(
-            _forward_events_unconditional, connection.send_message, msg["id"]
+
+    unsubs: list[CALLBACK_TYPE] = []
+    for event_type in event_types:
+        if event_type == EVENT_STATE_CHANGED:
+            forward_events = partial(
+                _forward_events_check_permissions,
+                connection.send_message,
+                connection.user,
+                msg["id"],
+                event_message,
+            )
+        else:
+            forward_events = partial(
+                _forward_events_unconditional,
+                connection.send_message,
+                msg["id"],
+                event_message,
+            )
+        unsubs.append(
+            hass.bus.async_listen(
+                event_type,
+                forward_events,
+                event_filter=event_filter,
+                run_immediately=True,
+            )
         )
 
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        event_type, forward_events, run_immediately=True
+    @callback
+    def _unsubscribe() -> None:
+        """Unsubscribe from all event types."""
+        for unsub in unsubs:
+            unsub()
+
+    connection.subscriptions[msg["id"]] = (
+        unsubs[0] if len(unsubs) == 1 else _unsubscribe
     )
 
     connection.send_result(msg["id"])
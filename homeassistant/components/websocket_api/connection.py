@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Hashable
+from collections.abc import Callable, Coroutine, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
 
@@ -37,6 +37,7 @@ class ActiveConnection:
         "logger",
         "hass",
         "send_message",
+        "_drain",
         "user",
         "refresh_token_id",
         "subscriptions",
@@ -54,11 +55,13 @@ class ActiveConnection:
         send_message: Callable[[str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        drain: Callable[[], Coroutine[Any, Any, None]] | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        self._drain = drain
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
@@ -75,6 +78,15 @@ class ActiveConnection:
         """Return the representation."""
         return f"<ActiveConnection {self.get_description(None)}>"
 
+    async def async_drain(self) -> None:
+        """Wait until the messages sent so far are written to the client.
+
+        Commands that send a lot of data can use this to not queue more
+        messages than the client reads.
+        """
+        if self._drain is not None:
+            await self._drain()
+
     def set_supported_features(self, features: dict[str, float]) -> None:
         """Set supported features."""
         self.supported_features = features
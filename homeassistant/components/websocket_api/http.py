@@ -75,6 +75,7 @@ class WebSocketHandler:
         "_connection",
         "_message_queue",
         "_ready_future",
+        "_drain_future",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -96,6 +97,8 @@ class WebSocketHandler:
         # an asyncio.Queue.
         self._message_queue: deque[str | None] = deque()
         self._ready_future: asyncio.Future[None] | None = None
+        # Resolved when the writer has written all queued messages
+        self._drain_future: asyncio.Future[None] | None = None
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -130,6 +133,7 @@ class WebSocketHandler:
         try:
             while not wsock.closed:
                 if (messages_remaining := len(message_queue)) == 0:
+                    self._resolve_drain_future()
                     self._ready_future = loop.create_future()
                     await self._ready_future
                     messages_remaining = len(message_queue)
@@ -170,9 +174,31 @@ class WebSocketHandler:
             debug("%s: Unexpected error in writer: %s", self.description, ex)
         finally:
             debug("%s: Writer done", self.description)
+            self._resolve_drain_future()
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    @callback
+    def _resolve_drain_future(self) -> None:
+        """Wake up the tasks waiting for the message queue to drain."""
+        if (drain_future := self._drain_future) is not None:
+            self._drain_future = None
+            if not drain_future.done():
+                drain_future.set_result(None)
+
+    async def _async_drain(self) -> None:
+        """Wait until the writer has written all queued messages."""
+        if (
+            self._closing
+            or not self._message_queue
+            or self._writer_task is None
+            or self._writer_task.done()
+        ):
+            return
+        if self._drain_future is None:
+            self._drain_future = self._hass.loop.create_future()
+        await self._drain_future
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -291,7 +317,9 @@ class WebSocketHandler:
         # event we do not want to block for websocket responses
         self._writer_task = asyncio.create_task(self._writer())
 
-        auth = AuthPhase(logger, hass, self._send_message, self._cancel, request)
+        auth = AuthPhase(
+            logger, hass, self._send_message, self._cancel, request, self._async_drain
+        )
         connection = None
         disconnect_warn = None
 
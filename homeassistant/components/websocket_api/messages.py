@@ -1,6 +1,7 @@
 """Message templates for websocket commands."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 from functools import lru_cache
 import logging
 from typing import TYPE_CHECKING, Any, Final, cast
@@ -121,6 +122,68 @@ def _partial_cached_event_message(event: Event) -> str:
     )
 
 
+def cached_filtered_event_message(
+    iden: int,
+    event: Event,
+    include_attributes: frozenset[str] | None,
+    exclude_attributes: frozenset[str] | None,
+) -> str:
+    """Return an event message with the attributes of its states filtered.
+
+    Serialize to json once per message and attribute filter,
+    so connections with the same filter share the result.
+    """
+    partial_message = _partial_cached_filtered_event_message(
+        event, include_attributes, exclude_attributes
+    )
+    return f'{partial_message[:-1]},"id":{iden}}}'
+
+
+@lru_cache(maxsize=128)
+def _partial_cached_filtered_event_message(
+    event: Event,
+    include_attributes: frozenset[str] | None,
+    exclude_attributes: frozenset[str] | None,
+) -> str:
+    """Cache and serialize the event with filtered attributes to json.
+
+    The message is constructed without the id which appended
+    in cached_filtered_event_message.
+    """
+    data = {
+        key: _filtered_state_dict(value, include_attributes, exclude_attributes)
+        if isinstance(value, State)
+        else value
+        for key, value in event.data.items()
+    }
+    return (
+        _message_to_json_or_none(
+            {"type": "event", "event": {**event.as_dict(), "data": data}}
+        )
+        or INVALID_JSON_PARTIAL_MESSAGE
+    )
+
+
+def _filtered_state_dict(
+    state: State,
+    include_attributes: frozenset[str] | None,
+    exclude_attributes: frozenset[str] | None,
+) -> dict[str, Any]:
+    """Return the state as a dict with only the wanted attributes."""
+    attributes: Mapping[str, Any] = state.attributes
+    if include_attributes is not None:
+        attributes = {
+            key: value for key, value in attributes.items() if key in include_attributes
+        }
+    if exclude_attributes is not None:
+        attributes = {
+            key: value
+            for key, value in attributes.items()
+            if key not in exclude_attributes
+        }
+    return {**state.as_dict(), "attributes": attributes}
+
+
 def cached_state_diff_message(iden: int, event: Event) -> str:
     """Return an event message.
 
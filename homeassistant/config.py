@@ -45,6 +45,7 @@ from .const import (
     CONF_LATITUDE,
     CONF_LEGACY_TEMPLATES,
     CONF_LONGITUDE,
+    CONF_MAX_IN_FLIGHT,
     CONF_MEDIA_DIRS,
     CONF_NAME,
     CONF_PACKAGES,
@@ -375,6 +376,9 @@ CORE_CONFIG_SCHEMA = vol.All(
             vol.Optional(CONF_CURRENCY): _validate_currency,
             vol.Optional(CONF_COUNTRY): cv.country,
             vol.Optional(CONF_LANGUAGE): cv.language,
+            vol.Optional(CONF_MAX_IN_FLIGHT): {
+                cv.string: vol.All(vol.Coerce(int), vol.Range(min=1))
+            },
         }
     ),
     _filter_bad_internal_external_urls,
@@ -935,6 +939,19 @@ async def async_process_ha_core_config(hass: HomeAssistant, config: dict) -> Non
     if CONF_UNIT_SYSTEM in config:
         hac.units = get_unit_system(config[CONF_UNIT_SYSTEM])
 
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers import script
+
+    # The maximum number of concurrent service calls made by scripts
+    # per service domain or integration of the targeted entities
+    if (
+        CONF_MAX_IN_FLIGHT in config
+        or script.DATA_SERVICE_CONCURRENCY_LIMIT in hass.data
+    ):
+        script.async_get_service_concurrency_limit(hass).async_set_limits(
+            config.get(CONF_MAX_IN_FLIGHT, {})
+        )
+
 
 def _log_pkg_error(
     hass: HomeAssistant, package: str, component: str, config: dict, message: str
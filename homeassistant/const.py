@@ -193,6 +193,7 @@ CONF_LOCATION: Final = "location"
 CONF_LONGITUDE: Final = "longitude"
 CONF_MAC: Final = "mac"
 CONF_MATCH: Final = "match"
+CONF_MAX_IN_FLIGHT: Final = "max_in_flight"
 CONF_MAXIMUM: Final = "maximum"
 CONF_MEDIA_DIRS: Final = "media_dirs"
 CONF_METHOD: Final = "method"
@@ -1961,6 +1961,21 @@ class ServiceRegistry:
         """
         return service.lower() in self._services.get(domain.lower(), [])
 
+    @callback
+    def async_is_callback(self, domain: str, service: str) -> bool:
+        """Return if the handler of a service is a callback.
+
+        A blocking call to such a service completes without yielding to the
+        event loop. Will return False if the service does not exist.
+
+        This method must be run in the event loop.
+        """
+        if (domain_services := self._services.get(domain.lower())) is None or (
+            handler := domain_services.get(service.lower())
+        ) is None:
+            return False
+        return handler.job.job_type == HassJobType.Callback
+
     def supports_response(self, domain: str, service: str) -> SupportsResponse:
         """Return whether or not the service supports response data.
 
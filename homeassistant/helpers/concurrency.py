@@ -0,0 +1,201 @@
+"""Concurrency limit helper."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Hashable, Iterable, Mapping
+from contextlib import suppress
+from dataclasses import dataclass, replace
+from functools import partial
+import time
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+
+@dataclass(slots=True)
+class ConcurrencyStats:
+    """Statistics of a concurrency limit."""
+
+    limit: int
+    in_flight: int = 0
+    queued: int = 0
+    max_queued: int = 0
+    acquired: int = 0
+    waited: int = 0
+    total_wait_time: float = 0.0
+
+
+class _ConcurrencyLimit:
+    """Limit the number of concurrent actions for a single key."""
+
+    __slots__ = ("stats", "removed", "_waiters")
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the limit."""
+        self.stats = ConcurrencyStats(limit)
+        self.removed = False
+        # The waiters of each owner, owners are served in turn
+        self._waiters: dict[Hashable, deque[asyncio.Future[None]]] = {}
+
+    def try_acquire(self) -> bool:
+        """Acquire a slot if one is available without waiting."""
+        stats = self.stats
+        if not self.removed and (self._waiters or stats.in_flight >= stats.limit):
+            return False
+        stats.in_flight += 1
+        stats.acquired += 1
+        return True
+
+    async def acquire(self, owner: Hashable) -> None:
+        """Wait for a slot.
+
+        The owners that are waiting get a slot in turn, and the waiters of
+        an owner get them in the order they were requested.
+        """
+        if self.try_acquire():
+            return
+        stats = self.stats
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        if (owner_waiters := self._waiters.get(owner)) is None:
+            owner_waiters = self._waiters[owner] = deque()
+        owner_waiters.append(future)
+        stats.queued += 1
+        stats.max_queued = max(stats.max_queued, stats.queued)
+        start = time.monotonic()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed to us before we were cancelled
+                self.release()
+            elif (owner_waiters := self._waiters.get(owner)) is not None:
+                with suppress(ValueError):
+                    owner_waiters.remove(future)
+                    stats.queued -= 1
+                if not owner_waiters:
+                    del self._waiters[owner]
+            raise
+        stats.waited += 1
+        stats.total_wait_time += time.monotonic() - start
+
+    def release(self) -> None:
+        """Release a slot and hand it to the next waiter."""
+        self.stats.in_flight -= 1
+        self.wake_waiters()
+
+    def wake_waiters(self) -> None:
+        """Hand out the available slots to waiters."""
+        stats = self.stats
+        waiters = self._waiters
+        while waiters and (self.removed or stats.in_flight < stats.limit):
+            owner = next(iter(waiters))
+            owner_waiters = waiters.pop(owner)
+            future = owner_waiters.popleft()
+            if owner_waiters:
+                # Move the owner to the back of the line
+                waiters[owner] = owner_waiters
+            stats.queued -= 1
+            if future.done():
+                continue
+            stats.in_flight += 1
+            stats.acquired += 1
+            future.set_result(None)
+
+
+def _release(limits: list[_ConcurrencyLimit]) -> None:
+    """Release a slot of each limit."""
+    for limit in limits:
+        limit.release()
+
+
+class KeyedConcurrencyLimit:
+    """Limit the number of concurrent actions per key.
+
+    Actions are only limited for keys that have a limit set. Actions for
+    multiple keys acquire their slots in a fixed order to avoid deadlocks.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the concurrency limit."""
+        self.hass = hass
+        self._limits: dict[str, _ConcurrencyLimit] = {}
+
+    @callback
+    def async_set_limit(self, key: str, limit: int | None) -> None:
+        """Set the maximum number of concurrent actions for a key.
+
+        Removing the limit hands out a slot to all actions waiting for one.
+        """
+        if limit is not None and limit < 1:
+            raise ValueError(f"The limit of {key} must be at least 1, got {limit}")
+        if limit is None:
+            if (removed := self._limits.pop(key, None)) is not None:
+                removed.removed = True
+                removed.wake_waiters()
+            return
+        if (existing := self._limits.get(key)) is None:
+            self._limits[key] = _ConcurrencyLimit(limit)
+            return
+        existing.stats.limit = limit
+        existing.wake_waiters()
+
+    @callback
+    def async_set_limits(self, limits: Mapping[str, int]) -> None:
+        """Replace the limits of all keys."""
+        for key in self._limits.keys() - limits.keys():
+            self.async_set_limit(key, None)
+        for key, limit in limits.items():
+            self.async_set_limit(key, limit)
+
+    @callback
+    def async_has_limits(self) -> bool:
+        """Return if a limit is set for any key."""
+        return bool(self._limits)
+
+    @callback
+    def async_limited_keys(self, keys: Iterable[str]) -> list[str]:
+        """Return the keys which have a limit set, in acquiring order."""
+        if not self._limits:
+            return []
+        return sorted({key for key in keys if key in self._limits})
+
+    @callback
+    def async_try_acquire(self, keys: Iterable[str]) -> CALLBACK_TYPE | None:
+        """Acquire a slot for each key without waiting.
+
+        Returns a callback to release the slots, or None if a slot is not
+        available.
+        """
+        acquired: list[_ConcurrencyLimit] = []
+        for key in self.async_limited_keys(keys):
+            limit = self._limits[key]
+            if not limit.try_acquire():
+                _release(acquired)
+                return None
+            acquired.append(limit)
+        return partial(_release, acquired)
+
+    async def async_acquire(
+        self, keys: Iterable[str], owner: Hashable = None
+    ) -> CALLBACK_TYPE:
+        """Wait for a slot for each key, returns a callback to release them.
+
+        Waiting owners are served in turn, so an owner that requests many
+        slots at once does not hold up the others.
+        """
+        # Limits removed while waiting hand out slots without waiting
+        limits = [self._limits[key] for key in self.async_limited_keys(keys)]
+        acquired: list[_ConcurrencyLimit] = []
+        try:
+            for limit in limits:
+                await limit.acquire(owner)
+                acquired.append(limit)
+        except BaseException:
+            _release(acquired)
+            raise
+        return partial(_release, acquired)
+
+    @callback
+    def async_get_stats(self) -> dict[str, ConcurrencyStats]:
+        """Return a copy of the statistics per key."""
+        return {key: replace(limit.stats) for key, limit in self._limits.items()}
@@ -63,6 +63,7 @@ from .template import Template, attach as template_attach, render_complex
 from .trace import (
     TraceElement,
     trace_append_element,
+    trace_enabled,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -90,6 +91,19 @@ _PLATFORM_ALIASES = {
     "zone": None,
 }
 
+# Relative cost of evaluating a condition, used to evaluate cheap conditions
+# first when the order of evaluation is not traced
+_CONDITION_COST = {
+    "trigger": 0,
+    "state": 1,
+    "numeric_state": 1,
+    "time": 2,
+    "zone": 2,
+    "sun": 3,
+    "template": 4,
+}
+_DEFAULT_CONDITION_COST = 3
+
 INPUT_ENTITY_ID = re.compile(
     r"^input_(?:select|text|number|boolean|datetime)\.(?!.+__)(?!_)[\da-z_]+(?<!_)$"
 )
@@ -129,8 +143,8 @@ def condition_trace_set_result(result: bool, **kwargs: Any) -> None:
     node = trace_stack_top(trace_stack_cv)
 
     # The condition function may be called directly, in which case tracing
-    # is not setup
-    if not node:
+    # is not setup, or the stack may be inherited from a traced caller
+    if not node or not trace_enabled():
         return
 
     node.set_result(result=result, **kwargs)
@@ -141,8 +155,8 @@ def condition_trace_update_result(**kwargs: Any) -> None:
     node = trace_stack_top(trace_stack_cv)
 
     # The condition function may be called directly, in which case tracing
-    # is not setup
-    if not node:
+    # is not setup, or the stack may be inherited from a traced caller
+    if not node or not trace_enabled():
         return
 
     node.update_result(**kwargs)
@@ -175,6 +189,8 @@ def trace_condition_function(condition: ConditionCheckerType) -> ConditionChecke
     @ft.wraps(condition)
     def wrapper(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool | None:
         """Trace condition."""
+        if not trace_enabled():
+            return condition(hass, variables)
         with trace_condition(variables):
             result = condition(hass, variables)
             condition_trace_update_result(result=result)
@@ -252,28 +268,14 @@ async def async_and_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'AND'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    plan = _async_evaluation_plan(config["conditions"], checks)
 
     @trace_condition_function
     def if_and_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
         """Test and condition."""
-        errors = []
-        for index, check in enumerate(checks):
-            try:
-                with trace_path(["conditions", str(index)]):
-                    if check(hass, variables) is False:
-                        return False
-            except ConditionError as ex:
-                errors.append(
-                    ConditionErrorIndex("and", index=index, total=len(checks), error=ex)
-                )
-
-        # Raise the errors if no check was false
-        if errors:
-            raise ConditionErrorContainer("and", errors=errors)
-
-        return True
+        return not _async_check_until(hass, variables, "and", checks, plan, _is_false)
 
     return if_and_condition
 
@@ -283,28 +285,14 @@ async def async_or_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'OR'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    plan = _async_evaluation_plan(config["conditions"], checks)
 
     @trace_condition_function
     def if_or_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
         """Test or condition."""
-        errors = []
-        for index, check in enumerate(checks):
-            try:
-                with trace_path(["conditions", str(index)]):
-                    if check(hass, variables) is True:
-                        return True
-            except ConditionError as ex:
-                errors.append(
-                    ConditionErrorIndex("or", index=index, total=len(checks), error=ex)
-                )
-
-        # Raise the errors if no check was true
-        if errors:
-            raise ConditionErrorContainer("or", errors=errors)
-
-        return False
+        return _async_check_until(hass, variables, "or", checks, plan, _is_true)
 
     return if_or_condition
 
@@ -314,30 +302,117 @@ async def async_not_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'NOT'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    plan = _async_evaluation_plan(config["conditions"], checks)
 
     @trace_condition_function
     def if_not_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
         """Test not condition."""
-        errors = []
-        for index, check in enumerate(checks):
-            try:
+        return not _async_check_until(hass, variables, "not", checks, plan, bool)
+
+    return if_not_condition
+
+
+def _is_false(result: bool | None) -> bool:
+    """Return if a check returned False."""
+    return result is False
+
+
+def _is_true(result: bool | None) -> bool:
+    """Return if a check returned True."""
+    return result is True
+
+
+@callback
+def _async_check_until(
+    hass: HomeAssistant,
+    variables: TemplateVarsType,
+    condition: str,
+    checks: list[ConditionCheckerType],
+    plan: list[tuple[int, ConditionCheckerType]],
+    stop: Callable[[bool | None], bool],
+) -> bool:
+    """Run the checks of an and, or or not condition until stop matches a result.
+
+    The checks are run in the order of the plan when not traced. Returns if a
+    result matched, raises the errors of the checks if no result matched.
+    """
+    errors = []
+    tracing = trace_enabled()
+    for index, check in enumerate(checks) if tracing else plan:
+        try:
+            if tracing:
                 with trace_path(["conditions", str(index)]):
-                    if check(hass, variables):
-                        return False
-            except ConditionError as ex:
-                errors.append(
-                    ConditionErrorIndex("not", index=index, total=len(checks), error=ex)
-                )
+                    result = check(hass, variables)
+            else:
+                result = check(hass, variables)
+        except ConditionError as ex:
+            errors.append(
+                ConditionErrorIndex(condition, index=index, total=len(checks), error=ex)
+            )
+            continue
+        if stop(result):
+            return True
 
-        # Raise the errors if no check was true
-        if errors:
-            raise ConditionErrorContainer("not", errors=errors)
+    if errors:
+        raise ConditionErrorContainer(condition, errors=errors)
 
-        return True
+    return False
 
-    return if_not_condition
+
+def _condition_cost(config: ConfigType) -> int:
+    """Return the relative cost of evaluating a condition."""
+    condition: str = config.get(CONF_CONDITION, "")
+    if condition in ("and", "or", "not"):
+        return max(map(_condition_cost, config["conditions"]), default=0)
+    if CONF_VALUE_TEMPLATE in config:
+        return _CONDITION_COST["template"]
+    return _CONDITION_COST.get(condition, _DEFAULT_CONDITION_COST)
+
+
+def _async_evaluation_plan(
+    configs: list[ConfigType], checks: list[ConditionCheckerType]
+) -> list[tuple[int, ConditionCheckerType]]:
+    """Return the checks with their index, ordered cheapest first.
+
+    The result of and, or and not conditions does not depend on the order
+    the checks are evaluated in, only the trace does.
+    """
+    return sorted(enumerate(checks), key=lambda item: _condition_cost(configs[item[0]]))
+
+
+class _EntityResultCache:
+    """Cache the result of a condition per entity.
+
+    The cached result is keyed on the identity of the state object of the
+    entity. A new state object is created whenever the state or attributes of
+    an entity change, which invalidates the cached result.
+    """
+
+    __slots__ = ("_check", "_results")
+
+    def __init__(
+        self,
+        check: Callable[[HomeAssistant, str | State, TemplateVarsType], bool],
+    ) -> None:
+        """Initialize the cache."""
+        self._check = check
+        self._results: dict[str, tuple[State, bool]] = {}
+
+    def __call__(
+        self, hass: HomeAssistant, entity_id: str, variables: TemplateVarsType
+    ) -> bool:
+        """Return the cached result or test the condition."""
+        if (entity := hass.states.get(entity_id)) is None:
+            # Let the condition raise the error about the unknown entity
+            self._results.pop(entity_id, None)
+            return self._check(hass, entity_id, variables)
+        if (cached := self._results.get(entity_id)) and cached[0] is entity:
+            return cached[1]
+        result = self._check(hass, entity, variables)
+        self._results[entity_id] = (entity, result)
+        return result
 
 
 def numeric_state(
@@ -495,6 +570,25 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
     above = config.get(CONF_ABOVE)
     value_template = config.get(CONF_VALUE_TEMPLATE)
 
+    @callback
+    def check_entity(
+        hass: HomeAssistant, entity: str | State, variables: TemplateVarsType
+    ) -> bool:
+        """Test numeric state condition of a single entity."""
+        return async_numeric_state(
+            hass, entity, below, above, value_template, variables, attribute
+        )
+
+    # The result only depends on the state of the entity when there is no
+    # template and no entity to compare with
+    cache = (
+        _EntityResultCache(check_entity)
+        if value_template is None
+        and not isinstance(below, str)
+        and not isinstance(above, str)
+        else None
+    )
+
     @trace_condition_function
     def if_numeric_state(
         hass: HomeAssistant, variables: TemplateVarsType = None
@@ -503,20 +597,21 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
         if value_template is not None:
             value_template.hass = hass
 
+        tracing = trace_enabled()
         errors = []
         for index, entity_id in enumerate(entity_ids):
             try:
-                with trace_path(["entity_id", str(index)]), trace_condition(variables):
-                    if not async_numeric_state(
-                        hass,
-                        entity_id,
-                        below,
-                        above,
-                        value_template,
-                        variables,
-                        attribute,
+                if tracing:
+                    with trace_path(["entity_id", str(index)]), trace_condition(
+                        variables
                     ):
-                        return False
+                        matched = check_entity(hass, entity_id, variables)
+                elif cache is not None:
+                    matched = cache(hass, entity_id, variables)
+                else:
+                    matched = check_entity(hass, entity_id, variables)
+                if not matched:
+                    return False
             except ConditionError as ex:
                 errors.append(
                     ConditionErrorIndex(
@@ -600,7 +695,7 @@ def state(
     except vol.Invalid as ex:
         raise ConditionErrorMessage("state", f"schema error: {ex}") from ex
 
-    duration = dt_util.utcnow() - cast(timedelta, for_period)
+    duration = dt_util.utcnow() - for_period
     duration_ok = duration > entity.last_changed
     condition_trace_set_result(duration_ok, state=value, duration=duration)
     return duration_ok
@@ -617,21 +712,47 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
     if not isinstance(req_states, list):
         req_states = [req_states]
 
+    @callback
+    def check_entity(
+        hass: HomeAssistant, entity: str | State, variables: TemplateVarsType
+    ) -> bool:
+        """Test state condition of a single entity."""
+        return state(hass, entity, req_states, for_period, attribute, variables)
+
+    # The result only depends on the state of the entity when there is no
+    # duration and no input entity to compare with
+    cache = (
+        _EntityResultCache(check_entity)
+        if for_period is None
+        and not any(
+            isinstance(req_state, str) and INPUT_ENTITY_ID.match(req_state)
+            for req_state in req_states
+        )
+        else None
+    )
+
     @trace_condition_function
     def if_state(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Test if condition."""
         template_attach(hass, for_period)
+        tracing = trace_enabled()
         errors = []
         result: bool = match != ENTITY_MATCH_ANY
         for index, entity_id in enumerate(entity_ids):
             try:
-                with trace_path(["entity_id", str(index)]), trace_condition(variables):
-                    if state(
-                        hass, entity_id, req_states, for_period, attribute, variables
+                if tracing:
+                    with trace_path(["entity_id", str(index)]), trace_condition(
+                        variables
                     ):
-                        result = True
-                    elif match == ENTITY_MATCH_ALL:
-                        return False
+                        matched = check_entity(hass, entity_id, variables)
+                elif cache is not None:
+                    matched = cache(hass, entity_id, variables)
+                else:
+                    matched = check_entity(hass, entity_id, variables)
+                if matched:
+                    result = True
+                elif match == ENTITY_MATCH_ALL:
+                    return False
             except ConditionError as ex:
                 errors.append(
                     ConditionErrorIndex(
@@ -10,6 +10,7 @@ from datetime import (
     timedelta,
 )
 from enum import Enum, StrEnum
+from functools import lru_cache
 import inspect
 import logging
 from numbers import Number
@@ -99,7 +100,7 @@ from homeassistant.generated.countries import COUNTRIES
 from homeassistant.generated.languages import LANGUAGES
 from homeassistant.util import raise_if_invalid_path, slugify as util_slugify
 import homeassistant.util.dt as dt_util
-from homeassistant.util.yaml.objects import NodeStrClass
+from homeassistant.util.yaml.objects import NodeDictClass, NodeStrClass
 
 from . import script_variables as script_variables_helper, template as template_helper
 
@@ -340,17 +341,46 @@ def entity_ids_or_uuids(value: str | list) -> list[str]:
     return _entity_ids(value, True)
 
 
-comp_entity_ids = vol.Any(
+_COMP_ENTITY_IDS = vol.Any(
     vol.All(vol.Lower, vol.Any(ENTITY_MATCH_ALL, ENTITY_MATCH_NONE)), entity_ids
 )
 
 
-comp_entity_ids_or_uuids = vol.Any(
+_COMP_ENTITY_IDS_OR_UUIDS = vol.Any(
     vol.All(vol.Lower, vol.Any(ENTITY_MATCH_ALL, ENTITY_MATCH_NONE)),
     entity_ids_or_uuids,
 )
 
 
+def _comp_entity_ids(
+    value: Any, allow_uuid: bool, validator: vol.Any
+) -> str | list[str]:
+    """Help validate all, none or entity IDs.
+
+    The vol.Any validator raises and catches an exception for entity IDs,
+    which are the most common value, so strings and lists are checked first.
+    """
+    if isinstance(value, str) and (
+        (lower := value.lower()) == ENTITY_MATCH_ALL or lower == ENTITY_MATCH_NONE
+    ):
+        return lower
+    if isinstance(value, (str, list)):
+        with contextlib.suppress(vol.Invalid):
+            return _entity_ids(value, allow_uuid)
+    # Other values and the errors are handled by the vol.Any validator
+    return validator(value)  # type: ignore[no-any-return]
+
+
+def comp_entity_ids(value: Any) -> str | list[str]:
+    """Validate all, none or entity IDs."""
+    return _comp_entity_ids(value, False, _COMP_ENTITY_IDS)
+
+
+def comp_entity_ids_or_uuids(value: Any) -> str | list[str]:
+    """Validate all, none or entities specified by entity IDs or UUIDs."""
+    return _comp_entity_ids(value, True, _COMP_ENTITY_IDS_OR_UUIDS)
+
+
 def domain_key(config_key: Any) -> str:
     """Validate a top level config key with an optional label and return the domain.
 
@@ -522,7 +552,48 @@ def time_period_seconds(value: float | str) -> timedelta:
         raise vol.Invalid(f"Expected seconds, got {value}") from err
 
 
-time_period = vol.Any(time_period_str, time_period_seconds, timedelta, time_period_dict)
+_time_period_any = vol.Any(
+    time_period_str, time_period_seconds, timedelta, time_period_dict
+)
+
+
+@lru_cache(maxsize=1024)
+def _time_period_from_str(value: str) -> timedelta:
+    """Validate and transform a time period string.
+
+    Results are immutable and cached since the same periods are used all over
+    the configuration.
+    """
+    return cast(timedelta, _time_period_any(value))
+
+
+def time_period(value: Any) -> timedelta:
+    """Validate and transform a time period.
+
+    Accepts the same values as trying time_period_str, time_period_seconds,
+    timedelta and time_period_dict in order, but dispatches on the type of the
+    value to avoid raising and catching an exception per attempted validator.
+    """
+    if isinstance(value, timedelta):
+        return value
+    value_type = type(value)
+    if value_type is str or value_type is NodeStrClass:
+        return _time_period_from_str(value)
+    if value_type is int or value_type is float:
+        return time_period_seconds(value)
+    if (
+        value_type is dict or value_type is NodeDictClass
+    ) and _is_simple_time_period_dict(value):
+        return timedelta(**{key: float(val) for key, val in value.items()})
+    return cast(timedelta, _time_period_any(value))
+
+
+def _is_simple_time_period_dict(value: dict[Any, Any]) -> bool:
+    """Return if a time period dict only has valid keys with numeric values."""
+    return bool(value) and all(
+        key in _TIME_PERIOD_DICT_KEYS and type(val) in (int, float)
+        for key, val in value.items()
+    )
 
 
 def match_all(value: _T) -> _T:
@@ -538,7 +609,11 @@ def positive_timedelta(value: timedelta) -> timedelta:
 
 
 positive_time_period_dict = vol.All(time_period_dict, positive_timedelta)
-positive_time_period = vol.All(time_period, positive_timedelta)
+
+
+def positive_time_period(value: Any) -> timedelta:
+    """Validate and transform a positive time period."""
+    return positive_timedelta(time_period(value))
 
 
 def remove_falsy(value: list[_T]) -> list[_T]:
@@ -73,6 +73,7 @@ _T = TypeVar("_T")
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
 DATA_ENTITY_SOURCE = "entity_info"
+DATA_STATE_WRITE_PROFILE = "entity_state_write_profile"
 
 # Used when converting float states to string: limit precision according to machine
 # epsilon to make the string representation readable
@@ -98,6 +99,28 @@ def entity_sources(hass: HomeAssistant) -> dict[str, EntityInfo]:
     return _entity_sources
 
 
+@callback
+def async_start_state_write_profile(hass: HomeAssistant) -> StateWriteProfile:
+    """Start collecting statistics of state writes of entities."""
+    profile = hass.data[DATA_STATE_WRITE_PROFILE] = StateWriteProfile()
+    return profile
+
+
+@callback
+def async_stop_state_write_profile(hass: HomeAssistant) -> StateWriteProfile | None:
+    """Stop collecting statistics of state writes of entities."""
+    profile: StateWriteProfile | None = hass.data.pop(DATA_STATE_WRITE_PROFILE, None)
+    if profile is not None:
+        profile.end = timer()
+    return profile
+
+
+@callback
+def async_get_state_write_profile(hass: HomeAssistant) -> StateWriteProfile | None:
+    """Return the statistics of state writes being collected."""
+    return hass.data.get(DATA_STATE_WRITE_PROFILE)
+
+
 def generate_entity_id(
     entity_id_format: str,
     name: str | None,
@@ -264,6 +287,68 @@ class CalculatedState:
     shadowed_attributes: Mapping[str, Any]
 
 
+@dataclasses.dataclass(slots=True)
+class StateWriteStats:
+    """Statistics of state writes of an entity class of an integration."""
+
+    writes: int = 0
+    # Writes which did not change the state or attributes
+    unchanged_writes: int = 0
+    # Time spent calculating the state and attributes
+    calculate_time: float = 0.0
+    # Time spent setting the state, including callback state change listeners
+    set_time: float = 0.0
+
+
+@dataclasses.dataclass(slots=True)
+class StateWriteProfile:
+    """Statistics of state writes per integration and entity class."""
+
+    start: float = dataclasses.field(default_factory=timer)
+    end: float | None = None
+    stats: dict[tuple[str, type[Entity]], StateWriteStats] = dataclasses.field(
+        default_factory=dict
+    )
+
+    @property
+    def duration(self) -> float:
+        """Return the number of seconds statistics have been collected."""
+        return (self.end or timer()) - self.start
+
+    @callback
+    def async_record(
+        self, entity: Entity, calculate_time: float, set_time: float, changed: bool
+    ) -> None:
+        """Record a state write."""
+        platform_name = entity.platform.platform_name if entity.platform else ""
+        key = (platform_name, type(entity))
+        if (stats := self.stats.get(key)) is None:
+            stats = self.stats[key] = StateWriteStats()
+        stats.writes += 1
+        if not changed:
+            stats.unchanged_writes += 1
+        stats.calculate_time += calculate_time
+        stats.set_time += set_time
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the statistics as a list sorted by number of writes."""
+        duration = self.duration
+        return [
+            {
+                "integration": platform_name,
+                "entity_class": f"{entity_class.__module__}.{entity_class.__qualname__}",
+                "writes": stats.writes,
+                "writes_per_second": stats.writes / duration if duration else 0.0,
+                "unchanged_writes": stats.unchanged_writes,
+                "calculate_time": stats.calculate_time,
+                "set_time": stats.set_time,
+            }
+            for (platform_name, entity_class), stats in sorted(
+                self.stats.items(), key=lambda item: item[1].writes, reverse=True
+            )
+        ]
+
+
 class CachedProperties(type):
     """Metaclass which invalidates cached entity properties on write to _attr_.
 
@@ -517,6 +602,14 @@ class Entity(
     __capabilities_updated_at_reported: bool = False
     __remove_event: asyncio.Event | None = None
 
+    # Coalesce calls of async_write_ha_state. If None, the state is written
+    # immediately. Otherwise the state is written once at the end of the current
+    # event loop iteration, and at most once per this many seconds. Note that
+    # a blocking service call then returns before the new state is written.
+    _state_write_coalesce_interval: float | None = None
+    __coalesced_write: asyncio.Handle | None = None
+    __coalesced_write_time: float | None = None
+
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_attribution: str | None = None
@@ -938,6 +1031,33 @@ class Entity(
                 f"No entity id specified for entity {self.name}"
             )
 
+        if (interval := self._state_write_coalesce_interval) is not None:
+            self.__async_schedule_coalesced_write(interval)
+            return
+
+        self._async_write_ha_state()
+
+    @callback
+    def __async_schedule_coalesced_write(self, interval: float) -> None:
+        """Schedule a write of the state, unless one is already scheduled."""
+        if self.__coalesced_write is not None:
+            return
+        loop = self.hass.loop
+        if (
+            self.__coalesced_write_time is not None
+            and (delay := self.__coalesced_write_time + interval - loop.time()) > 0
+        ):
+            self.__coalesced_write = loop.call_later(
+                delay, self.__async_coalesced_write
+            )
+        else:
+            self.__coalesced_write = loop.call_soon(self.__async_coalesced_write)
+
+    @callback
+    def __async_coalesced_write(self) -> None:
+        """Write the coalesced state to the state machine."""
+        self.__coalesced_write = None
+        self.__coalesced_write_time = self.hass.loop.time()
         self._async_write_ha_state()
 
     def _stringify_state(self, available: bool) -> str:
@@ -1121,6 +1241,10 @@ class Entity(
             self._context = None
             self._context_set = None
 
+        if (profile := hass.data.get(DATA_STATE_WRITE_PROFILE)) is not None:
+            old_state = hass.states.get(entity_id)
+            set_start = timer()
+
         try:
             hass.states.async_set(
                 entity_id,
@@ -1138,6 +1262,14 @@ class Entity(
                 entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
             )
 
+        if profile is not None:
+            profile.async_record(
+                self,
+                end - start,
+                timer() - set_start,
+                hass.states.get(entity_id) is not old_state,
+            )
+
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
 
@@ -1304,6 +1436,10 @@ class Entity(
 
         self._platform_state = EntityPlatformState.REMOVED
 
+        if self.__coalesced_write is not None:
+            self.__coalesced_write.cancel()
+            self.__coalesced_write = None
+
         self._call_on_remove_callbacks()
 
         await self.async_internal_will_remove_from_hass()
@@ -33,7 +33,7 @@ from homeassistant.loader import async_get_integration, bind_hass
 from homeassistant.setup import async_prepare_setup_platform
 
 from . import config_validation as cv, discovery, entity, service
-from .entity_platform import EntityPlatform
+from .entity_platform import BatchServiceParams, EntityPlatform
 from .typing import ConfigType, DiscoveryInfoType
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=15)
@@ -260,8 +260,14 @@ class EntityComponent(Generic[_EntityT]):
         func: str | Callable[..., Any],
         required_features: list[int] | None = None,
         supports_response: SupportsResponse = SupportsResponse.NONE,
+        batch_params: BatchServiceParams | None = None,
     ) -> None:
-        """Register an entity service."""
+        """Register an entity service.
+
+        If func is a service handler, batch_params can return the data of the
+        entity method the handler would call for an entity, so the call can be
+        passed to a batch handler of the entity platform.
+        """
         if isinstance(schema, dict):
             schema = cv.make_entity_service_schema(schema)
 
@@ -270,7 +276,12 @@ class EntityComponent(Generic[_EntityT]):
         ) -> EntityServiceResponse | None:
             """Handle the service."""
             return await service.entity_service_call(
-                self.hass, self._platforms.values(), func, call, required_features
+                self.hass,
+                self._platforms.values(),
+                func,
+                call,
+                required_features,
+                batch_params,
             )
 
         self.hass.services.async_register(
@@ -59,6 +59,11 @@ PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
 _LOGGER = getLogger(__name__)
 
+BatchServiceHandler = Callable[
+    [list[tuple["Entity", dict[str, Any]]]], Coroutine[Any, Any, None]
+]
+BatchServiceParams = Callable[[Any, ServiceCall], dict[str, Any] | None]
+
 
 class AddEntitiesCallback(Protocol):
     """Protocol type for EntityPlatform.add_entities callback."""
@@ -138,6 +143,8 @@ class EntityPlatform:
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
+        # Handlers calling a service for all targeted entities at once
+        self.batch_service_handlers: dict[tuple[str, str], BatchServiceHandler] = {}
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
@@ -815,10 +822,16 @@ class EntityPlatform:
         func: str | Callable[..., Any],
         required_features: Iterable[int] | None = None,
         supports_response: SupportsResponse = SupportsResponse.NONE,
+        batch_params: BatchServiceParams | None = None,
     ) -> None:
         """Register an entity service.
 
         Services will automatically be shared by all platforms of the same domain.
+
+        If func is a service handler, batch_params can return the data of the
+        entity method the handler would call for an entity, so the call can be
+        passed to a batch handler. It returns None if the entity can not be
+        handled in a batch.
         """
         if self.hass.services.has_service(self.platform_name, name):
             return
@@ -838,12 +851,31 @@ class EntityPlatform:
                 func,
                 call,
                 required_features,
+                batch_params,
             )
 
         self.hass.services.async_register(
             self.platform_name, name, handle_service, schema, supports_response
         )
 
+    @callback
+    def async_register_batch_service_handler(
+        self, domain: str, name: str, handler: BatchServiceHandler
+    ) -> None:
+        """Register a handler calling an entity service for many entities at once.
+
+        When a call of the service targets more than one entity of this platform,
+        the handler is called once with those entities and their data, instead
+        of calling the service for each entity. This allows platforms to send a
+        single group command to their devices.
+
+        The data of each entity is what the entity method would be called with,
+        without the target fields. Services with their own handler are only
+        batched if they are registered with batch_params, since they may
+        preprocess the call differently for each entity.
+        """
+        self.batch_service_handlers[(domain, name)] = handler
+
     async def _update_entity_states(self, now: datetime) -> None:
         """Update the states of all the polling entities.
 
@@ -28,6 +28,10 @@ STORAGE_VERSION = 1
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# Periodic dumps are skipped while no stored state changed, but we still write
+# at least this often to keep last_seen of the stored states current
+STATE_DUMP_MAX_INTERVAL = timedelta(hours=1)
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -56,23 +60,50 @@ class RestoredExtraData(ExtraStoredData):
 
 
 class StoredState:
-    """Object to represent a stored state."""
+    """Object to represent a stored state.
+
+    States loaded from storage are only deserialized when they are first
+    accessed, since most entities only ask for their own last state.
+    """
 
     def __init__(
         self,
-        state: State,
+        state: State | dict[str, Any],
         extra_data: ExtraStoredData | None,
         last_seen: datetime,
     ) -> None:
-        """Initialize a new stored state."""
+        """Initialize a new stored state.
+
+        A state passed as a dict is deserialized on first access.
+        """
         self.extra_data = extra_data
         self.last_seen = last_seen
-        self.state = state
+        self._state: State | None = None
+        self._state_dict: dict[str, Any] | None = None
+        if isinstance(state, State):
+            self._state = state
+        else:
+            self._state_dict = state
+
+    @property
+    def state(self) -> State:
+        """Return the stored state, deserializing it on first access."""
+        if self._state is None:
+            assert self._state_dict is not None
+            self._state = cast(State, State.from_dict(self._state_dict))
+            self._state_dict = None
+        return self._state
+
+    @state.setter
+    def state(self, state: State) -> None:
+        """Set the stored state."""
+        self._state = state
+        self._state_dict = None
 
     def as_dict(self) -> dict[str, Any]:
         """Return a dict representation of the stored state."""
         result = {
-            "state": self.state.as_dict(),
+            "state": self._state_dict if self._state is None else self._state.as_dict(),
             "extra_data": self.extra_data.as_dict() if self.extra_data else None,
             "last_seen": self.last_seen,
         }
@@ -88,9 +119,7 @@ class StoredState:
         if isinstance(last_seen, str):
             last_seen = dt_util.parse_datetime(last_seen)
 
-        return cls(
-            cast(State, State.from_dict(json_dict["state"])), extra_data, last_seen
-        )
+        return cls(json_dict["state"], extra_data, last_seen)
 
 
 async def async_load(hass: HomeAssistant) -> None:
@@ -137,6 +166,9 @@ class RestoreStateData:
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # What was written by the last dump, to skip periodic dumps without changes
+        self._last_dump: dict[str, tuple[State | StoredState, Any]] = {}
+        self._last_dump_time: datetime | None = None
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -175,6 +207,17 @@ class RestoreStateData:
         stored states from the previous run, which have not been created as
         entities on this run, and have not expired.
         """
+        return [stored_state for stored_state, _ in self._async_get_stored_states()]
+
+    @callback
+    def _async_get_stored_states(
+        self,
+    ) -> list[tuple[StoredState, State | StoredState]]:
+        """Get the states which should be stored with the object they originate from.
+
+        The origin is the current State object for registered entities, or the
+        StoredState from the previous run. Both are replaced when they change.
+        """
         now = dt_util.utcnow()
         all_states = self.hass.states.async_all()
         # Entities currently backed by an entity object
@@ -185,9 +228,12 @@ class RestoreStateData:
         }
 
         # Start with the currently registered states
-        stored_states = [
-            StoredState(
-                state, self.entities[state.entity_id].extra_restore_state_data, now
+        stored_states: list[tuple[StoredState, State | StoredState]] = [
+            (
+                StoredState(
+                    state, self.entities[state.entity_id].extra_restore_state_data, now
+                ),
+                state,
             )
             for state in all_states
             if state.entity_id in self.entities
@@ -208,22 +254,48 @@ class RestoreStateData:
             if stored_state.last_seen < expiration_time:
                 continue
 
-            stored_states.append(stored_state)
+            stored_states.append((stored_state, stored_state))
 
         return stored_states
 
-    async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+    async def async_dump_states(self, skip_unchanged: bool = False) -> None:
+        """Save the current state machine to storage.
+
+        If skip_unchanged is set, the dump is skipped if no stored state changed
+        since the last dump unless that was more than STATE_DUMP_MAX_INTERVAL ago.
+        """
+        now = dt_util.utcnow()
+        dump: dict[str, tuple[State | StoredState, Any]] = {}
+        changed = (
+            not skip_unchanged
+            or self._last_dump_time is None
+            or now - self._last_dump_time >= STATE_DUMP_MAX_INTERVAL
+        )
+        rows: list[dict[str, Any]] = []
+        for stored_state, origin in self._async_get_stored_states():
+            row = stored_state.as_dict()
+            rows.append(row)
+            entity_id = row["state"]["entity_id"]
+            dump[entity_id] = (origin, row["extra_data"])
+            if not changed and (
+                (last := self._last_dump.get(entity_id)) is None
+                or last[0] is not origin
+                or last[1] != row["extra_data"]
+            ):
+                changed = True
+
+        if not changed and dump.keys() == self._last_dump.keys():
+            _LOGGER.debug("Skipping dump of unchanged states")
+            return
+
         _LOGGER.debug("Dumping states")
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.store.async_save(rows)
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+        self._last_dump = dump
+        self._last_dump_time = now
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -232,6 +304,9 @@ class RestoreStateData:
         async def _async_dump_states(*_: Any) -> None:
             await self.async_dump_states()
 
+        async def _async_dump_changed_states(*_: Any) -> None:
+            await self.async_dump_states(skip_unchanged=True)
+
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
@@ -240,7 +315,7 @@ class RestoreStateData:
         # Dump states periodically
         cancel_interval = async_track_time_interval(
             self.hass,
-            _async_dump_states,
+            _async_dump_changed_states,
             STATE_DUMP_INTERVAL,
             name="RestoreStateData dump states",
         )
@@ -65,10 +65,12 @@ from homeassistant.const import (
     SERVICE_TURN_ON,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     HassJob,
     HomeAssistant,
+    ServiceCall,
     ServiceResponse,
     SupportsResponse,
     callback,
@@ -76,7 +78,14 @@ from homeassistant.core import (
 from homeassistant.util import slugify
 from homeassistant.util.dt import utcnow
 
-from . import condition, config_validation as cv, service, template
+from . import (
+    condition,
+    config_validation as cv,
+    entity_registry as er,
+    service,
+    template,
+)
+from .concurrency import KeyedConcurrencyLimit
 from .condition import ConditionCheckerType, trace_condition_function
 from .dispatcher import async_dispatcher_connect, async_dispatcher_send
 from .event import async_call_later, async_track_template
@@ -86,6 +95,7 @@ from .trace import (
     async_trace_path,
     script_execution_set,
     trace_append_element,
+    trace_enabled,
     trace_id_get,
     trace_path,
     trace_path_get,
@@ -129,6 +139,7 @@ ATTR_MAX = "max"
 DATA_SCRIPTS = "helpers.script"
 DATA_SCRIPT_BREAKPOINTS = "helpers.script_breakpoints"
 DATA_NEW_SCRIPT_RUNS_NOT_ALLOWED = "helpers.script_not_allowed"
+DATA_SERVICE_CONCURRENCY_LIMIT = "helpers.script_service_concurrency_limit"
 RUN_ID_ANY = "*"
 NODE_ANY = "*"
 
@@ -148,6 +159,12 @@ SCRIPT_DEBUG_CONTINUE_ALL = "script_debug_continue_all"
 
 script_stack_cv: ContextVar[list[int] | None] = ContextVar("script_stack", default=None)
 
+# The concurrency limit keys of the service calls the current one is made from.
+# Nested calls don't wait for these keys, their slots are already held.
+_held_concurrency_limit_keys_cv: ContextVar[frozenset[str]] = ContextVar(
+    "held_concurrency_limit_keys", default=frozenset()
+)
+
 
 def action_trace_append(variables, path):
     """Append a TraceElement to trace[path]."""
@@ -453,7 +470,11 @@ class _ScriptRun:
         return ScriptRunResult(response, self._variables)
 
     async def _async_step(self, log_exceptions: bool) -> None:
-        continue_on_error = self._action.get(CONF_CONTINUE_ON_ERROR, False)
+        if not trace_enabled():
+            # Nothing is recorded, so run the step without trace bookkeeping
+            if not self._stop.is_set():
+                await self._async_run_step(log_exceptions, None)
+            return
 
         with trace_path(str(self._step)):
             async with trace_action(
@@ -461,24 +482,28 @@ class _ScriptRun:
             ) as trace_element:
                 if self._stop.is_set():
                     return
+                await self._async_run_step(log_exceptions, trace_element)
 
-                action = cv.determine_script_action(self._action)
+    async def _async_run_step(
+        self, log_exceptions: bool, trace_element: TraceElement | None
+    ) -> None:
+        continue_on_error = self._action.get(CONF_CONTINUE_ON_ERROR, False)
+        action = cv.determine_script_action(self._action)
 
-                if not self._action.get(CONF_ENABLED, True):
-                    self._log(
-                        "Skipped disabled step %s", self._action.get(CONF_ALIAS, action)
-                    )
-                    trace_set_result(enabled=False)
-                    return
+        if not self._action.get(CONF_ENABLED, True):
+            self._log("Skipped disabled step %s", self._action.get(CONF_ALIAS, action))
+            trace_set_result(enabled=False)
+            return
 
-                try:
-                    handler = f"_async_{action}_step"
-                    await getattr(self, handler)()
-                    trace_element.update_variables(self._variables)
-                except Exception as ex:  # pylint: disable=broad-except
-                    self._handle_exception(
-                        ex, continue_on_error, self._log_exceptions or log_exceptions
-                    )
+        try:
+            handler = f"_async_{action}_step"
+            await getattr(self, handler)()
+            if trace_element is not None:
+                trace_element.update_variables(self._variables)
+        except Exception as ex:  # pylint: disable=broad-except
+            self._handle_exception(
+                ex, continue_on_error, self._log_exceptions or log_exceptions
+            )
 
     def _finish(self) -> None:
         self._script._runs.remove(self)  # pylint: disable=protected-access
@@ -710,19 +735,52 @@ class _ScriptRun:
             or params[CONF_DOMAIN] in ("python_script", "script")
         )
         trace_set_result(params=params, running_script=running_script)
-        response_data = await self._async_run_long_action(
-            self._hass.async_create_task(
-                self._hass.services.async_call(
-                    **params,
-                    blocking=True,
-                    context=self._context,
-                    return_response=return_response,
-                )
-            ),
+        release_limit: CALLBACK_TYPE | None = None
+        if not running_script and (
+            limit_keys := _async_service_concurrency_limit_keys(self._hass, params)
+        ):
+            release_limit = await self._async_acquire_concurrency_limit(limit_keys)
+            if release_limit is None:
+                # Stopped while waiting for the service calls in flight
+                return
+            held_keys_token = _held_concurrency_limit_keys_cv.set(
+                _held_concurrency_limit_keys_cv.get().union(limit_keys)
+            )
+        service_call = self._hass.services.async_call(
+            **params,
+            blocking=True,
+            context=self._context,
+            return_response=return_response,
         )
+        try:
+            if self._hass.services.async_is_callback(
+                params[CONF_DOMAIN], params[CONF_SERVICE]
+            ):
+                # The call completes without yielding to the event loop, so it can't
+                # be stopped and there's no need to run it in a task
+                response_data = await service_call
+            else:
+                response_data = await self._async_run_long_action(
+                    self._hass.async_create_task(service_call)
+                )
+        finally:
+            if release_limit is not None:
+                _held_concurrency_limit_keys_cv.reset(held_keys_token)
+                release_limit()
         if response_variable:
             self._variables[response_variable] = response_data
 
+    async def _async_acquire_concurrency_limit(
+        self, keys: list[str]
+    ) -> CALLBACK_TYPE | None:
+        """Wait until the service call is allowed to run, unless stopped."""
+        limit = async_get_service_concurrency_limit(self._hass)
+        if (release := limit.async_try_acquire(keys)) is not None:
+            return release
+        return await self._async_run_long_action(
+            self._hass.async_create_task(limit.async_acquire(keys, self._script))
+        )
+
     async def _async_device_step(self):
         """Perform the device automation specified in the action."""
         self._step_log("device automation")
@@ -771,8 +829,7 @@ class _ScriptRun:
         )
         cond = await self._async_get_condition(self._action)
         try:
-            trace_element = trace_stack_top(trace_stack_cv)
-            if trace_element:
+            if trace_enabled() and (trace_element := trace_stack_top(trace_stack_cv)):
                 trace_element.reuse_by_child = True
             check = cond(self._hass, self._variables)
         except exceptions.ConditionError as ex:
@@ -1122,6 +1179,47 @@ class _QueuedScriptRun(_ScriptRun):
         super()._finish()
 
 
+@callback
+def async_get_service_concurrency_limit(hass: HomeAssistant) -> KeyedConcurrencyLimit:
+    """Return the limit of concurrent service calls made by scripts.
+
+    Limits are keyed by the domain of the called service and by the platforms
+    of the targeted entities, calls that exceed a limit wait in line.
+    """
+    if (limit := hass.data.get(DATA_SERVICE_CONCURRENCY_LIMIT)) is None:
+        limit = hass.data[DATA_SERVICE_CONCURRENCY_LIMIT] = KeyedConcurrencyLimit(hass)
+    return cast(KeyedConcurrencyLimit, limit)
+
+
+@callback
+def _async_service_concurrency_limit_keys(
+    hass: HomeAssistant, params: dict[str, Any]
+) -> list[str]:
+    """Return the limited keys of a service call.
+
+    The keys are the domain of the service and the platforms of the
+    targeted entities, including those targeted by area or device. Keys
+    held by the service call this one is made from are left out.
+    """
+    limit: KeyedConcurrencyLimit | None = hass.data.get(DATA_SERVICE_CONCURRENCY_LIMIT)
+    if limit is None or not limit.async_has_limits():
+        return []
+    keys = [params[CONF_DOMAIN]]
+    service_call = ServiceCall(
+        params[CONF_DOMAIN],
+        params[CONF_SERVICE],
+        {**(params.get("service_data") or {}), **(params.get("target") or {})},
+    )
+    selected = service.async_extract_referenced_entity_ids(hass, service_call)
+    if entity_ids := selected.referenced | selected.indirectly_referenced:
+        ent_reg = er.async_get(hass)
+        for entity_id in entity_ids:
+            if (entry := ent_reg.async_get(entity_id)) is not None:
+                keys.append(entry.platform)
+    held_keys = _held_concurrency_limit_keys_cv.get()
+    return [key for key in limit.async_limited_keys(keys) if key not in held_keys]
+
+
 @callback
 def _schedule_stop_scripts_after_shutdown(hass: HomeAssistant) -> None:
     """Stop running Script objects started after shutdown."""
@@ -6,7 +6,9 @@ from collections.abc import Awaitable, Callable, Coroutine, Iterable
 import dataclasses
 from enum import Enum
 from functools import cache, partial, wraps
+from itertools import chain
 import logging
+from operator import itemgetter
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, TypedDict, TypeGuard, TypeVar, cast
 
@@ -58,7 +60,7 @@ from .typing import ConfigType, TemplateVarsType
 
 if TYPE_CHECKING:
     from .entity import Entity
-    from .entity_platform import EntityPlatform
+    from .entity_platform import BatchServiceHandler, BatchServiceParams, EntityPlatform
 
     _EntityT = TypeVar("_EntityT", bound=Entity)
 
@@ -797,6 +799,7 @@ async def entity_service_call(
     func: str | Callable[..., Coroutine[Any, Any, ServiceResponse]],
     call: ServiceCall,
     required_features: Iterable[int] | None = None,
+    batch_params: BatchServiceParams | None = None,
 ) -> EntityServiceResponse | None:
     """Handle an entity service call.
 
@@ -876,7 +879,15 @@ async def entity_service_call(
             )
         return None
 
-    if len(entities) == 1:
+    batches: list[tuple[BatchServiceHandler, list[tuple[Entity, dict[str, Any]]]]] = []
+    if (
+        len(entities) > 1
+        and not return_response
+        and (entity_data := _batch_entity_data(call, data, batch_params))
+    ):
+        entities, batches = _group_batched_entities(call, entities, entity_data)
+
+    if len(entities) == 1 and not batches:
         # Single entity case avoids creating task
         entity = entities[0]
         single_response = await _handle_entity_call(
@@ -898,6 +909,12 @@ async def entity_service_call(
             )
             for entity in entities
         ],
+        *[
+            batch[0][0].async_request_call(
+                _handle_batch_call(handler, batch, call.context)
+            )
+            for handler, batch in batches
+        ],
         return_exceptions=True,
     )
 
@@ -906,10 +923,15 @@ async def entity_service_call(
         if isinstance(result, BaseException):
             raise result from None
         response_data[entity.entity_id] = result
+    for result in results[len(entities) :]:
+        if isinstance(result, BaseException):
+            raise result from None
 
     tasks: list[asyncio.Task[None]] = []
 
-    for entity in entities:
+    for entity in chain(
+        entities, *(map(itemgetter(0), batch) for _, batch in batches)
+    ):
         if not entity.should_poll:
             continue
 
@@ -927,6 +949,69 @@ async def entity_service_call(
     return response_data if return_response and response_data else None
 
 
+def _batch_entity_data(
+    call: ServiceCall,
+    data: dict | ServiceCall,
+    batch_params: BatchServiceParams | None,
+) -> Callable[[Entity], dict[str, Any] | None] | None:
+    """Return the function returning the data of an entity for batch handlers.
+
+    Returns None if the service can not be handled in batches.
+    """
+    if isinstance(data, dict):
+        return lambda entity: data
+    # Services with their own handler may preprocess the call per entity,
+    # so they are only batched with the data they would call the entity with
+    if batch_params is not None:
+        return lambda entity: batch_params(entity, call)
+    return None
+
+
+def _group_batched_entities(
+    call: ServiceCall,
+    entities: list[Entity],
+    entity_data: Callable[[Entity], dict[str, Any] | None],
+) -> tuple[
+    list[Entity], list[tuple[BatchServiceHandler, list[tuple[Entity, dict[str, Any]]]]]
+]:
+    """Group the entities of platforms which handle the service call in batches.
+
+    Returns the entities which are called one by one and the batches with the
+    data of each entity.
+    """
+    key = (call.domain, call.service)
+    single: list[Entity] = []
+    grouped: dict[EntityPlatform, list[tuple[Entity, dict[str, Any]]]] = {}
+    for entity in entities:
+        if (
+            (platform := entity.platform)
+            and key in platform.batch_service_handlers
+            and (data := entity_data(entity)) is not None
+        ):
+            grouped.setdefault(platform, []).append((entity, data))
+        else:
+            single.append(entity)
+
+    batches: list[tuple[BatchServiceHandler, list[tuple[Entity, dict[str, Any]]]]] = []
+    for platform, batch in grouped.items():
+        if len(batch) == 1:
+            single.append(batch[0][0])
+        else:
+            batches.append((platform.batch_service_handlers[key], batch))
+    return single, batches
+
+
+async def _handle_batch_call(
+    handler: BatchServiceHandler,
+    batch: list[tuple[Entity, dict[str, Any]]],
+    context: Context,
+) -> None:
+    """Handle calling a batch service handler."""
+    for entity, _ in batch:
+        entity.async_set_context(context)
+    await handler(batch)
+
+
 async def _handle_entity_call(
     hass: HomeAssistant,
     entity: Entity,
@@ -5,6 +5,7 @@ from collections import deque
 from collections.abc import Callable, Coroutine, Generator
 from contextlib import contextmanager
 from contextvars import ContextVar
+from enum import StrEnum
 from functools import wraps
 from typing import Any, TypeVar, TypeVarTuple
 
@@ -17,10 +18,22 @@ _T = TypeVar("_T")
 _Ts = TypeVarTuple("_Ts")
 
 
+class TraceLevel(StrEnum):
+    """Level of detail recorded in a trace."""
+
+    # Nothing is recorded
+    OFF = "off"
+    # Path, timestamp, result and errors of steps are recorded
+    SUMMARY = "summary"
+    # Variables of steps are recorded as well
+    FULL = "full"
+
+
 class TraceElement:
     """Container for trace data."""
 
     __slots__ = (
+        "_changed_variables",
         "_child_key",
         "_child_run_id",
         "_error",
@@ -41,7 +54,12 @@ class TraceElement:
         self._result: dict[str, Any] | None = None
         self.reuse_by_child = False
         self._timestamp = dt_util.utcnow()
+        self._variables: dict[str, Any] | None = None
+        self._changed_variables: dict[str, Any] | None = None
 
+        if trace_level_cv.get() is not TraceLevel.FULL:
+            self._last_variables: dict[str, Any] = {}
+            return
         self._last_variables = variables_cv.get() or {}
         self.update_variables(variables)
 
@@ -68,17 +86,28 @@ class TraceElement:
         self._result = {**old_result, **kwargs}
 
     def update_variables(self, variables: TemplateVarsType) -> None:
-        """Update variables."""
-        if variables is None:
-            variables = {}
-        last_variables = self._last_variables
-        variables_cv.set(dict(variables))
-        changed_variables = {
-            key: value
-            for key, value in variables.items()
-            if key not in last_variables or last_variables[key] != value
-        }
-        self._variables = changed_variables
+        """Update variables.
+
+        Only a shallow copy of the variables is made, the changed variables are
+        computed when the trace element is viewed.
+        """
+        if trace_level_cv.get() is not TraceLevel.FULL:
+            return
+        variables = dict(variables) if variables else {}
+        variables_cv.set(variables)
+        self._variables = variables
+        self._changed_variables = None
+
+    def _get_changed_variables(self) -> dict[str, Any] | None:
+        """Return the variables which changed compared to the previous element."""
+        if self._changed_variables is None and self._variables is not None:
+            last_variables = self._last_variables
+            self._changed_variables = {
+                key: value
+                for key, value in self._variables.items()
+                if key not in last_variables or last_variables[key] != value
+            }
+        return self._changed_variables
 
     def as_dict(self) -> dict[str, Any]:
         """Return dictionary version of this TraceElement."""
@@ -90,8 +119,8 @@ class TraceElement:
                 "item_id": item_id,
                 "run_id": str(self._child_run_id),
             }
-        if self._variables:
-            result["changed_variables"] = self._variables
+        if changed_variables := self._get_changed_variables():
+            result["changed_variables"] = changed_variables
         if self._error is not None:
             result["error"] = str(self._error)
         if self._result is not None:
@@ -114,6 +143,10 @@ trace_path_stack_cv: ContextVar[list[str] | None] = ContextVar(
 )
 # Copy of last variables
 variables_cv: ContextVar[Any | None] = ContextVar("variables_cv", default=None)
+# Level of detail of the current trace
+trace_level_cv: ContextVar[TraceLevel] = ContextVar(
+    "trace_level_cv", default=TraceLevel.FULL
+)
 # (domain.item_id, Run ID)
 trace_id_cv: ContextVar[tuple[str, str] | None] = ContextVar(
     "trace_id_cv", default=None
@@ -183,6 +216,8 @@ def trace_append_element(
     maxlen: int | None = None,
 ) -> None:
     """Append a TraceElement to trace[path]."""
+    if trace_level_cv.get() is TraceLevel.OFF:
+        return
     if (trace := trace_cv.get()) is None:
         trace = {}
         trace_cv.set(trace)
@@ -191,6 +226,21 @@ def trace_append_element(
     trace[path].append(trace_element)
 
 
+def trace_enabled() -> bool:
+    """Return if trace elements are recorded."""
+    return trace_level_cv.get() is not TraceLevel.OFF
+
+
+@contextmanager
+def trace_level(level: TraceLevel) -> Generator[None, None, None]:
+    """Set the level of detail recorded in the trace."""
+    token = trace_level_cv.set(level)
+    try:
+        yield
+    finally:
+        trace_level_cv.reset(token)
+
+
 def trace_get(clear: bool = True) -> dict[str, deque[TraceElement]] | None:
     """Return the current trace."""
     if clear:
@@ -215,13 +265,15 @@ def trace_set_child_id(child_key: str, child_run_id: str) -> None:
 
 def trace_set_result(**kwargs: Any) -> None:
     """Set the result of TraceElement at the top of the stack."""
-    if node := trace_stack_top(trace_stack_cv):
+    # The stack is inherited from a traced caller when not traced
+    if trace_enabled() and (node := trace_stack_top(trace_stack_cv)):
         node.set_result(**kwargs)
 
 
 def trace_update_result(**kwargs: Any) -> None:
     """Update the result of TraceElement at the top of the stack."""
-    if node := trace_stack_top(trace_stack_cv):
+    # The stack is inherited from a traced caller when not traced
+    if trace_enabled() and (node := trace_stack_top(trace_stack_cv)):
         node.update_result(**kwargs)
 
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Hashable, Iterable
 from dataclasses import dataclass, field
 import functools
 import logging
@@ -23,13 +23,15 @@ from homeassistant.core import (
     Context,
     HassJob,
     HomeAssistant,
+    State,
     callback,
     is_callback,
 )
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import IntegrationNotFound, async_get_integration
 
-from .typing import ConfigType, TemplateVarsType
+from .event import EventStateChangedData, async_track_state_change_event
+from .typing import ConfigType, EventType, TemplateVarsType
 
 _PLATFORM_ALIASES = {
     "device": "device_automation",
@@ -41,6 +43,9 @@ _PLATFORM_ALIASES = {
 }
 
 DATA_PLUGGABLE_ACTIONS = "pluggable_actions"
+DATA_STATE_TRIGGER_INDEX = "state_trigger_index"
+
+_LOGGER = logging.getLogger(__name__)
 
 
 class TriggerProtocol(Protocol):
@@ -211,6 +216,126 @@ class PluggableAction:
                 await task
 
 
+@dataclass(slots=True)
+class IndexedStateTrigger:
+    """A state based trigger registered with the state trigger index.
+
+    The predicate is called with the entity_id, old state and new state of a
+    state change. Triggers with an equal predicate key must have equivalent
+    predicates, the result is shared between them for each state change.
+    """
+
+    name: str
+    predicate_key: Hashable
+    predicate: Callable[[str, State | None, State | None], Any]
+    action: Callable[[EventType[EventStateChangedData], Any], None]
+    # Also call the action when the predicate did not match
+    dispatch_all: bool = False
+    evaluations: int = 0
+    matches: int = 0
+
+
+class StateTriggerIndex:
+    """Index of state based triggers grouped by entity_id.
+
+    A single state changed listener is registered per entity_id instead of one
+    per trigger. Predicates are evaluated once per predicate key for each state
+    change and only the triggers whose predicate matched are dispatched to.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the state trigger index."""
+        self._hass = hass
+        self._triggers: dict[str, list[IndexedStateTrigger]] = {}
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def async_add(
+        self, entity_ids: str | Iterable[str], trigger: IndexedStateTrigger
+    ) -> CALLBACK_TYPE:
+        """Add a trigger for the given entity ids."""
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        entity_ids = [entity_id.lower() for entity_id in entity_ids]
+        for entity_id in entity_ids:
+            if triggers := self._triggers.get(entity_id):
+                triggers.append(trigger)
+                continue
+            self._triggers[entity_id] = [trigger]
+            self._unsubs[entity_id] = async_track_state_change_event(
+                self._hass, entity_id, self._async_state_changed
+            )
+        return functools.partial(self._async_remove, entity_ids, trigger)
+
+    @callback
+    def _async_remove(
+        self, entity_ids: list[str], trigger: IndexedStateTrigger
+    ) -> None:
+        """Remove a trigger."""
+        for entity_id in entity_ids:
+            triggers = self._triggers[entity_id]
+            triggers.remove(trigger)
+            if not triggers:
+                del self._triggers[entity_id]
+                self._unsubs.pop(entity_id)()
+
+    @callback
+    def async_get_triggers(self, entity_id: str) -> list[IndexedStateTrigger]:
+        """Return the triggers for an entity_id."""
+        return list(self._triggers.get(entity_id, ()))
+
+    @callback
+    def _async_state_changed(self, event: EventType[EventStateChangedData]) -> None:
+        """Evaluate the triggers of an entity and dispatch to the matching ones."""
+        entity_id = event.data["entity_id"]
+        if not (triggers := self._triggers.get(entity_id)):
+            return
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        results: dict[Hashable, Any] = {}
+        for trigger in triggers[:]:
+            try:
+                if (key := trigger.predicate_key) in results:
+                    result = results[key]
+                else:
+                    result = results[key] = trigger.predicate(
+                        entity_id, old_state, new_state
+                    )
+                trigger.evaluations += 1
+                if result is True:
+                    trigger.matches += 1
+                elif not trigger.dispatch_all:
+                    continue
+                trigger.action(event, result)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while dispatching state change of %s to %s",
+                    entity_id,
+                    trigger.name,
+                )
+
+
+@callback
+def async_get_state_trigger_index(hass: HomeAssistant) -> StateTriggerIndex:
+    """Return the state trigger index."""
+    if (index := hass.data.get(DATA_STATE_TRIGGER_INDEX)) is None:
+        index = hass.data[DATA_STATE_TRIGGER_INDEX] = StateTriggerIndex(hass)
+    return cast(StateTriggerIndex, index)
+
+
+def state_trigger_predicate_key(*items: Any) -> Hashable:
+    """Return a predicate key for the given items.
+
+    Items which are not hashable get a key that is not shared with any other
+    trigger.
+    """
+    try:
+        hash(items)
+    except TypeError:
+        return object()
+    return items
+
+
 async def _async_get_trigger_platform(
     hass: HomeAssistant, config: ConfigType
 ) -> TriggerProtocol:
@@ -13,7 +13,9 @@ import functools as ft
 import importlib
 import logging
 import pathlib
+from stat import S_ISREG
 import sys
+import threading
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, TypeVar, cast
 
@@ -25,7 +27,12 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
-from .core import HomeAssistant, callback
+from .const import (
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_HOMEASSISTANT_STOP,
+    __version__ as HA_VERSION,
+)
+from .core import Event, HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.dhcp import DHCP
@@ -48,6 +55,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_CACHE = "manifest_cache"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -63,6 +71,10 @@ MAX_LOAD_CONCURRENTLY = 4
 
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
+MANIFEST_CACHE_STORAGE_KEY = "core.manifest_cache"
+MANIFEST_CACHE_STORAGE_VERSION = 1
+MANIFEST_CACHE_SAVE_DELAY = 30
+
 
 class DHCPMatcherRequired(TypedDict, total=True):
     """Matcher for the dhcp integration for required fields."""
@@ -181,6 +193,123 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
 
 
+class ManifestCache:
+    """Cache of parsed manifest.json files that is persisted across restarts.
+
+    Entries are keyed by the path of the manifest file. Manifests of built-in
+    integrations are trusted as long as the Home Assistant version matches the
+    version that wrote the cache (dev builds are always validated); all other
+    manifests are validated against the modification time and size of the file,
+    which costs a single stat instead of a read and parse.
+    """
+
+    def __init__(self, ha_version: str) -> None:
+        """Initialize the manifest cache."""
+        self.ha_version = ha_version
+        self.trust_built_in = "dev" not in ha_version
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.dirty = False
+        # Integrations are resolved in the executor
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> ManifestCache:
+        """Restore the cache from stored data, dropping it on version change."""
+        cache = cls(HA_VERSION)
+        if data is not None and data.get("ha_version") == HA_VERSION:
+            cache.entries = data["manifests"]
+        return cache
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cache as a dict that can be stored."""
+        with self._lock:
+            return {"ha_version": self.ha_version, "manifests": dict(self.entries)}
+
+    def prune(self) -> None:
+        """Remove the entries of manifests that no longer exist."""
+        with self._lock:
+            keys = list(self.entries)
+        for key in keys:
+            if pathlib.Path(key).is_file():
+                continue
+            with self._lock:
+                if self.entries.pop(key, None) is not None:
+                    self.dirty = True
+
+    def get(self, manifest_path: pathlib.Path, is_built_in: bool) -> Manifest | None:
+        """Return the manifest at path, reading and caching it if needed.
+
+        Returns None if the manifest does not exist.
+        Raises on invalid JSON.
+        """
+        key = str(manifest_path)
+        entry = self.entries.get(key)
+        if entry is not None and is_built_in and self.trust_built_in:
+            return cast(Manifest, entry["manifest"].copy())
+
+        try:
+            file_stat = manifest_path.stat()
+        except OSError:
+            file_stat = None
+        if file_stat is None or not S_ISREG(file_stat.st_mode):
+            with self._lock:
+                if self.entries.pop(key, None) is not None:
+                    self.dirty = True
+            return None
+
+        if (
+            entry is not None
+            and entry["mtime_ns"] == file_stat.st_mtime_ns
+            and entry["size"] == file_stat.st_size
+        ):
+            return cast(Manifest, entry["manifest"].copy())
+
+        manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+        with self._lock:
+            self.entries[key] = {
+                "mtime_ns": file_stat.st_mtime_ns,
+                "size": file_stat.st_size,
+                "manifest": manifest.copy(),
+            }
+            self.dirty = True
+        return manifest
+
+
+async def async_load_manifest_cache(hass: HomeAssistant) -> None:
+    """Load the persistent manifest cache.
+
+    The cache is written back to disk once Home Assistant has started and
+    again when it stops if integrations were resolved in the meantime.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers.storage import Store
+
+    store: Store[dict[str, Any]] = Store(
+        hass,
+        MANIFEST_CACHE_STORAGE_VERSION,
+        MANIFEST_CACHE_STORAGE_KEY,
+        private=True,
+    )
+    cache = ManifestCache.from_dict(await store.async_load())
+    hass.data[DATA_MANIFEST_CACHE] = cache
+
+    @callback
+    def _async_save_if_dirty(_: Event) -> None:
+        """Schedule a save of the manifest cache if it changed."""
+        if not cache.dirty:
+            return
+        cache.dirty = False
+        store.async_delay_save(cache.as_dict, MANIFEST_CACHE_SAVE_DELAY)
+
+    async def _async_prune_and_save(event: Event) -> None:
+        """Drop removed manifests and schedule a save if the cache changed."""
+        await hass.async_add_executor_job(cache.prune)
+        _async_save_if_dirty(event)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_prune_and_save)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_save_if_dirty)
+
+
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     """Generate a manifest from a legacy module."""
     return {
@@ -562,14 +691,21 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        manifest_cache: ManifestCache | None = hass.data.get(DATA_MANIFEST_CACHE)
+        is_built_in = root_module.__name__ == PACKAGE_BUILTIN
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
             try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                if manifest_cache is not None:
+                    if (
+                        manifest := manifest_cache.get(manifest_path, is_built_in)
+                    ) is None:
+                        continue
+                elif not manifest_path.is_file():
+                    continue
+                else:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
             except JSON_DECODE_EXCEPTIONS as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
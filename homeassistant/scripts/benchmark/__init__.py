@@ -6,8 +6,10 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import json
 import logging
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 from typing import TypeVar
 
@@ -314,6 +316,308 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def validate_script_config(hass):
+    """Validate triggers, conditions and actions of a thousand automations."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import config_validation as cv
+
+    configs = [
+        {
+            "trigger": [
+                {
+                    "platform": "state",
+                    "entity_id": [f"binary_sensor.motion_{i}", "sun.sun"],
+                    "to": "on",
+                    "for": "00:00:05",
+                }
+            ],
+            "condition": [
+                {"condition": "state", "entity_id": f"light.room_{i}", "state": "off"},
+                {
+                    "condition": "numeric_state",
+                    "entity_id": f"sensor.lux_{i}",
+                    "below": 20,
+                },
+            ],
+            "action": [
+                {
+                    "service": "light.turn_on",
+                    "target": {"entity_id": f"light.room_{i}"},
+                    "data": {"brightness_pct": 80},
+                },
+                {"delay": {"minutes": 5}},
+                {"wait_template": "{{ is_state('sun.sun', 'above_horizon') }}"},
+                {"service": "light.turn_off", "entity_id": f"light.room_{i}"},
+            ],
+        }
+        for i in range(1000)
+    ]
+
+    start = timer()
+    for config in configs:
+        cv.TRIGGER_SCHEMA(config["trigger"])
+        cv.CONDITIONS_SCHEMA(config["condition"])
+        cv.SCRIPT_SCHEMA(config["action"])
+    return timer() - start
+
+
+@benchmark
+async def validate_automation_config(hass):
+    """Validate the whole automation config of a thousand automations."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import loader
+    from homeassistant.components.automation.config import async_validate_config
+    from homeassistant.helpers import entity_registry as er
+
+    loader.async_setup(hass)
+    # The registry is loaded from an empty config dir
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await er.async_load(hass)
+    config = {
+        "automation": [
+            {
+                "id": f"motion_{i}",
+                "alias": f"Motion {i}",
+                "trigger": [
+                    {
+                        "platform": "state",
+                        "entity_id": [f"binary_sensor.motion_{i}", "sun.sun"],
+                        "to": "on",
+                        "for": "00:00:05",
+                    }
+                ],
+                "condition": [
+                    {
+                        "condition": "state",
+                        "entity_id": f"light.room_{i}",
+                        "state": "off",
+                    },
+                    {
+                        "condition": "numeric_state",
+                        "entity_id": f"sensor.lux_{i}",
+                        "below": 20,
+                    },
+                ],
+                "action": [
+                    {
+                        "service": "light.turn_on",
+                        "target": {"entity_id": [f"light.room_{i}", "light.hall"]},
+                        "data": {"brightness_pct": 80},
+                    },
+                    {"delay": {"minutes": 5}},
+                    {"service": "light.turn_off", "entity_id": f"light.room_{i}"},
+                ],
+            }
+            for i in range(1000)
+        ]
+    }
+
+    start = timer()
+    await async_validate_config(hass, config)
+    return timer() - start
+
+
+@benchmark
+async def evaluate_conditions(hass):
+    """Evaluate the conditions of a condition heavy automation 100k times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import condition, config_validation as cv
+    from homeassistant.helpers.trace import TraceLevel, trace_level
+
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("binary_sensor.motion", "on")
+    hass.states.async_set("sensor.lux", "12")
+    hass.states.async_set("sensor.temperature", "21.5")
+    config = cv.CONDITION_SCHEMA(
+        {
+            "condition": "and",
+            "conditions": [
+                "{{ states('sensor.temperature') | float > 18 }}",
+                {"condition": "state", "entity_id": "light.kitchen", "state": "off"},
+                {
+                    "condition": "state",
+                    "entity_id": "binary_sensor.motion",
+                    "state": "on",
+                },
+                {"condition": "numeric_state", "entity_id": "sensor.lux", "below": 20},
+                {
+                    "condition": "or",
+                    "conditions": [
+                        {
+                            "condition": "numeric_state",
+                            "entity_id": "sensor.temperature",
+                            "above": 25,
+                        },
+                        {
+                            "condition": "numeric_state",
+                            "entity_id": "sensor.temperature",
+                            "below": 22,
+                        },
+                    ],
+                },
+            ],
+        }
+    )
+    check = await condition.async_from_config(hass, config)
+
+    start = timer()
+    with trace_level(TraceLevel.OFF):
+        for _ in range(10**5):
+            check(hass)
+    return timer() - start
+
+
+@benchmark
+async def run_script(hass):
+    """Run a 20 step script 10k times without tracing."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import config_validation as cv
+    from homeassistant.helpers.script import Script
+    from homeassistant.helpers.trace import TraceLevel, trace_level
+
+    @core.callback
+    def callback_service(call):
+        """Handle a service call in the event loop."""
+
+    async def coroutine_service(call):
+        """Handle a service call in a coroutine."""
+
+    hass.services.async_register("test", "callback", callback_service)
+    hass.services.async_register("test", "coroutine", coroutine_service)
+    hass.states.async_set("sensor.temperature", "21.5")
+
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"variables": {"room": "kitchen", "brightness": 80}},
+            {"condition": "state", "entity_id": "sensor.temperature", "state": "21.5"},
+            {"service": "test.callback", "data": {"room": "{{ room }}"}},
+            {"event": "test_event", "event_data": {"room": "{{ room }}"}},
+            {"service": "test.coroutine", "data": {"brightness": 80}},
+        ]
+        * 4
+    )
+    script = Script(hass, sequence, "Benchmark", "benchmark")
+
+    start = timer()
+    with trace_level(TraceLevel.OFF):
+        for _ in range(10**4):
+            await script.async_run(context=core.Context())
+    return timer() - start
+
+
+@benchmark
+async def entity_service_call_unbatched(hass):
+    """Call a service targeting 80 entities of a hub 100 times."""
+    return await _entity_service_call(hass, batched=False)
+
+
+@benchmark
+async def entity_service_call_batched(hass):
+    """Call a service targeting 80 entities of a hub 100 times in batches."""
+    return await _entity_service_call(hass, batched=True)
+
+
+async def _entity_service_call(hass, batched):
+    """Call a service targeting 80 entities of a hub which sends one command at a time."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.entity import Entity
+    from homeassistant.helpers.entity_platform import EntityPlatform
+    from homeassistant.helpers.service import entity_service_call
+
+    hub_lock = asyncio.Lock()
+
+    async def send_command():
+        """Send a command to the hub, which takes 1 ms."""
+        async with hub_lock:
+            await asyncio.sleep(0.001)
+
+    class HubEntity(Entity):
+        """Entity of a hub."""
+
+        _attr_should_poll = False
+
+        async def async_turn_on(self, **kwargs):
+            """Turn the entity on."""
+            await send_command()
+
+    async def async_turn_on_batch(batch):
+        """Turn all entities on with a group command."""
+        await send_command()
+
+    platform = EntityPlatform(
+        hass=hass,
+        logger=logging.getLogger(__name__),
+        domain="light",
+        platform_name="hub",
+        platform=None,
+        scan_interval=timedelta(seconds=30),
+        entity_namespace=None,
+    )
+    if batched:
+        platform.async_register_batch_service_handler(
+            "light", "turn_on", async_turn_on_batch
+        )
+    for idx in range(80):
+        entity = HubEntity()
+        entity.hass = hass
+        entity.platform = platform
+        entity.entity_id = f"light.hub_{idx}"
+        platform.entities[entity.entity_id] = entity
+
+    call = core.ServiceCall("light", "turn_on", {"entity_id": "all"})
+
+    start = timer()
+    for _ in range(100):
+        await entity_service_call(hass, [platform], "async_turn_on", call)
+    return timer() - start
+
+
+@benchmark
+async def sensor_unit_conversion(hass):
+    """Calculate the state of sensors converting their unit 100k times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+    from homeassistant.const import UnitOfEnergy, UnitOfPressure, UnitOfTemperature
+    from homeassistant.util.unit_system import US_CUSTOMARY_SYSTEM
+
+    hass.config.units = US_CUSTOMARY_SYSTEM
+
+    class ConvertingSensor(SensorEntity):
+        """Sensor which has a unit converted for display."""
+
+        def __init__(self, device_class, native_unit, suggested_unit, native_value):
+            """Initialize the sensor."""
+            self.hass = hass
+            self.entity_id = f"sensor.{device_class}"
+            self._attr_device_class = device_class
+            self._attr_native_unit_of_measurement = native_unit
+            self._attr_suggested_unit_of_measurement = suggested_unit
+            self._attr_native_value = native_value
+
+    entities = [
+        ConvertingSensor(
+            SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS, None, 21.53
+        ),
+        ConvertingSensor(
+            SensorDeviceClass.ENERGY,
+            UnitOfEnergy.WATT_HOUR,
+            UnitOfEnergy.KILO_WATT_HOUR,
+            1234.5,
+        ),
+        ConvertingSensor(
+            SensorDeviceClass.PRESSURE, UnitOfPressure.HPA, UnitOfPressure.INHG, 1013
+        ),
+    ]
+
+    start = timer()
+    for _ in range(10**5):
+        for entity in entities:
+            entity.state  # pylint: disable=pointless-statement
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -1,7 +1,7 @@
 """Typing Helpers for Home Assistant."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from functools import lru_cache
 
 from homeassistant.const import (
@@ -107,6 +107,23 @@ class BaseUnitConverter:
         from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
         return lambda val: None if val is None else (val / from_ratio) * to_ratio
 
+    @classmethod
+    @lru_cache
+    def converter_factory_allow_none_batch(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[Iterable[float | None]], list[float | None]]:
+        """Return a function to convert many values from one unit to another.
+
+        The returned function allows None and converts all values without a
+        function call per value.
+        """
+        if from_unit == to_unit:
+            return list
+        from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
+        return lambda values: [
+            None if val is None else (val / from_ratio) * to_ratio for val in values
+        ]
+
     @classmethod
     @lru_cache
     def get_unit_ratio(cls, from_unit: str | None, to_unit: str | None) -> float:
@@ -388,6 +405,19 @@ class TemperatureConverter(BaseUnitConverter):
         convert = cls._converter_factory(from_unit, to_unit)
         return lambda value: None if value is None else convert(value)
 
+    @classmethod
+    @lru_cache(maxsize=8)
+    def converter_factory_allow_none_batch(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[Iterable[float | None]], list[float | None]]:
+        """Return a function to convert many temperatures from one unit to another."""
+        if from_unit == to_unit:
+            return list
+        convert = cls._converter_factory(from_unit, to_unit)
+        return lambda values: [
+            None if value is None else convert(value) for value in values
+        ]
+
     @classmethod
     def _converter_factory(
         cls, from_unit: str | None, to_unit: str | None
@@ -3,13 +3,19 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterator
 from contextlib import suppress
+from copy import deepcopy
+from dataclasses import dataclass, field
 import fnmatch
+import hashlib
 from io import StringIO, TextIOWrapper
 import logging
 import os
 from pathlib import Path
+import threading
+import time
 from typing import Any, TextIO, TypeVar, overload
 
+from lru import LRU
 import yaml
 
 try:
@@ -40,6 +46,119 @@ class YamlTypeError(HomeAssistantError):
     """Raised by load_yaml_dict if top level data is not a dict."""
 
 
+@dataclass(slots=True)
+class _Dependencies:
+    """Everything the parsed result of a YAML file depends on.
+
+    This includes (transitively) included files, the file listings of
+    included directories, environment variables and resolved secrets.
+    """
+
+    files: dict[str, _FileVersion] = field(default_factory=dict)
+    directories: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    env_vars: dict[str, str | None] = field(default_factory=dict)
+    secrets: dict[tuple[str, str], str] = field(default_factory=dict)
+
+    def update(self, other: _Dependencies) -> None:
+        """Add the dependencies of an included file."""
+        self.files.update(other.files)
+        self.directories.update(other.directories)
+        self.env_vars.update(other.env_vars)
+        self.secrets.update(other.secrets)
+
+    def is_valid(self, secrets: Secrets | None) -> bool:
+        """Return if none of the dependencies changed."""
+        for fname, version in self.files.items():
+            try:
+                if not version.is_current(fname):
+                    return False
+            except (OSError, UnicodeDecodeError):
+                return False
+        for loc, files in self.directories.items():
+            if tuple(_find_files(loc, "*.yaml")) != files:
+                return False
+        for name, value in self.env_vars.items():
+            if os.environ.get(name) != value:
+                return False
+        if self.secrets:
+            if secrets is None:
+                return False
+            for (requester_path, secret), value in self.secrets.items():
+                try:
+                    if secrets.get(requester_path, secret) != value:
+                        return False
+                except HomeAssistantError:
+                    return False
+        return True
+
+
+@dataclass(slots=True)
+class _FileVersion:
+    """The version of a file that was parsed."""
+
+    digest: bytes
+    # The modification time and size of the file, None if the file
+    # was modified too recently to tell changes apart by them
+    signature: tuple[int, int] | None
+
+    def is_current(self, fname: str) -> bool:
+        """Return if the file still has the same content.
+
+        Only reads the file if its modification time or size changed.
+        """
+        if self.signature is not None and self.signature == _signature(os.stat(fname)):
+            return True
+        with open(fname, encoding="utf-8") as file:
+            return _digest(file.read()) == self.digest
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """A parsed YAML file."""
+
+    version: _FileVersion
+    result: JSON_TYPE | None
+    dependencies: _Dependencies
+
+
+# Number of parsed YAML files to keep
+YAML_CACHE_SIZE = 512
+# A file modified less than this long ago may be modified again
+# without changing its modification time
+_RACY_MTIME_NS = 2_000_000_000
+
+# Parsed YAML files keyed by file name. An entry is reused as long as the
+# content of the file and of everything it depends on is unchanged, so
+# reloading the configuration only parses the files that were modified.
+_YAML_CACHE: LRU[str, _CacheEntry] = LRU(YAML_CACHE_SIZE)
+_LOADING = threading.local()
+
+
+def _digest(content: str) -> bytes:
+    """Return a digest of the content of a file."""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+
+def _signature(stat: os.stat_result) -> tuple[int, int] | None:
+    """Return the modification time and size of a file if they can be trusted."""
+    if time.time_ns() - stat.st_mtime_ns < _RACY_MTIME_NS:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _current_dependencies() -> _Dependencies | None:
+    """Return the dependencies of the file that is currently being parsed."""
+    stack: list[_Dependencies] | None = getattr(_LOADING, "stack", None)
+    if stack:
+        return stack[-1]
+    return None
+
+
+def clear_cache() -> None:
+    """Clear the cache of parsed YAML files."""
+    _YAML_CACHE.clear()
+
+
 class Secrets:
     """Store secrets while loading YAML."""
 
@@ -70,6 +189,8 @@ class Secrets:
                     secret,
                     secret_dir,
                 )
+                if (dependencies := _current_dependencies()) is not None:
+                    dependencies.secrets[(requester_path, secret)] = secrets[secret]
                 return secrets[secret]
 
         raise HomeAssistantError(f"Secret {secret} not defined")
@@ -216,14 +337,68 @@ LoaderType = FastSafeLoader | PythonSafeLoader
 
 
 def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE | None:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    The parsed result is cached and reused as long as neither the file nor any
+    of the files, directories, environment variables and secrets it depends on
+    changed.
+    """
+    parent = _current_dependencies()
+    entry = _YAML_CACHE.get(fname)
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            try:
+                signature = _signature(os.fstat(conf_file.fileno()))
+            except OSError:
+                signature = None
+            if (
+                entry is not None
+                and signature is not None
+                and entry.version.signature == signature
+            ):
+                content = None
+                version = entry.version
+            else:
+                content = conf_file.read()
+                version = _FileVersion(_digest(content), signature)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
 
+    if (
+        entry is not None
+        and entry.version.digest == version.digest
+        and entry.dependencies.is_valid(secrets)
+    ):
+        entry.version = version
+        if parent is not None:
+            parent.files[fname] = version
+            parent.update(entry.dependencies)
+        return deepcopy(entry.result)
+
+    if content is None:
+        # The file is unchanged but one of its dependencies changed
+        with open(fname, encoding="utf-8") as conf_file:
+            content = conf_file.read()
+
+    stream = StringIO(content)
+    # The loader uses the stream name to resolve includes and annotate nodes
+    setattr(stream, "name", fname)
+    dependencies = _Dependencies()
+    if (stack := getattr(_LOADING, "stack", None)) is None:
+        stack = _LOADING.stack = []
+    stack.append(dependencies)
+    try:
+        result = parse_yaml(stream, secrets)
+    finally:
+        stack.pop()
+
+    _YAML_CACHE[fname] = _CacheEntry(version, deepcopy(result), dependencies)
+    if parent is not None:
+        parent.files[fname] = version
+        parent.update(dependencies)
+    return result
+
 
 def load_yaml_dict(fname: str, secrets: Secrets | None = None) -> dict:
     """Load a YAML file and ensure the top level is a dict.
@@ -337,6 +512,14 @@ def _is_file_valid(name: str) -> bool:
     return not name.startswith(".")
 
 
+def _find_included_files(directory: str) -> list[str]:
+    """Return the YAML files in an included directory and track them."""
+    files = list(_find_files(directory, "*.yaml"))
+    if (dependencies := _current_dependencies()) is not None:
+        dependencies.directories[directory] = tuple(files)
+    return files
+
+
 def _find_files(directory: str, pattern: str) -> Iterator[str]:
     """Recursively load files in a directory."""
     for root, dirs, files in os.walk(directory, topdown=True):
@@ -351,7 +534,7 @@ def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDi
     """Load multiple files from directory as a dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name()), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_included_files(loc):
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
@@ -368,7 +551,7 @@ def _include_dir_merge_named_yaml(
     """Load multiple files from directory as a merged dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name()), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_included_files(loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -384,7 +567,7 @@ def _include_dir_list_yaml(
     loc = os.path.join(os.path.dirname(loader.get_name()), node.value)
     return [
         loaded_yaml
-        for f in _find_files(loc, "*.yaml")
+        for f in _find_included_files(loc)
         if os.path.basename(f) != SECRET_YAML
         and (loaded_yaml := load_yaml(f, loader.secrets)) is not None
     ]
@@ -396,7 +579,7 @@ def _include_dir_merge_list_yaml(
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.get_name()), node.value)
     merged_list: list[JSON_TYPE] = []
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_included_files(loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -465,6 +648,8 @@ def _handle_scalar_tag(
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    if (dependencies := _current_dependencies()) is not None:
+        dependencies.env_vars[args[0]] = os.environ.get(args[0])
 
     # Check for a default value
     if len(args) > 1:
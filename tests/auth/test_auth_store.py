@@ -4,7 +4,11 @@ from typing import Any
 from unittest.mock import patch
 
 from homeassistant.auth import auth_store
+from homeassistant.auth.permissions import PolicyPermissions
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from tests.common import MockConfigEntry
 
 
 async def test_loading_no_group_data_format(
@@ -258,3 +262,33 @@ async def test_loading_race_condition(hass: HomeAssistant) -> None:
         mock_dev_registry.assert_called_once_with(hass)
         mock_load.assert_called_once_with()
         assert results[0] == results[1]
+
+
+async def test_permissions_cache_registry_updated(hass: HomeAssistant) -> None:
+    """Test cached entity permissions are discarded when the registries change."""
+    store = auth_store.AuthStore(hass)
+    await store.async_get_users()
+    perm_lookup = store._perm_lookup
+    assert perm_lookup is not None
+
+    config_entry = MockConfigEntry()
+    config_entry.add_to_hass(hass)
+    dev_reg = dr.async_get(hass)
+    device = dev_reg.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        identifiers={("test", "device")},
+        suggested_area="Kitchen",
+    )
+    er.async_get(hass).async_get_or_create(
+        "light", "test", "1234", device_id=device.id, suggested_object_id="kitchen"
+    )
+    permissions = PolicyPermissions(
+        {"entities": {"area_ids": {"kitchen": {"read": True}}}}, perm_lookup
+    )
+    assert permissions.check_entity("light.kitchen", "read") is True
+    assert permissions.check_entity("light.kitchen", "control") is False
+
+    generation = perm_lookup.generation
+    dev_reg.async_update_device(device.id, area_id=None)
+    assert perm_lookup.generation > generation
+    assert permissions.check_entity("light.kitchen", "read") is False
@@ -387,6 +387,41 @@ async def test_cannot_retrieve_expired_access_token(hass: HomeAssistant) -> None
     assert await manager.async_validate_access_token(access_token) is None
 
 
+async def test_access_token_cache(hass: HomeAssistant) -> None:
+    """Test verified access tokens are cached until they are no longer valid."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+    assert manager.access_token_cache_hits == 0
+    assert manager.access_token_cache_misses == 1
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+    assert manager.access_token_cache_hits == 1
+    assert manager.access_token_cache_misses == 1
+
+    with freeze_time(
+        dt_util.utcnow() + auth_const.ACCESS_TOKEN_EXPIRATION + timedelta(seconds=11)
+    ):
+        assert await manager.async_validate_access_token(access_token) is None
+    assert manager.access_token_cache_hits == 1
+    assert manager.access_token_cache_misses == 2
+
+    access_token = manager.async_create_access_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+    await manager.async_deactivate_user(user)
+    assert await manager.async_validate_access_token(access_token) is None
+    await manager.async_activate_user(user)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+    assert manager.access_token_cache_hits == 2
+
+    await manager.async_remove_refresh_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is None
+    assert manager.access_token_cache_hits == 2
+
+
 async def test_generating_system_user(hass: HomeAssistant) -> None:
     """Test that we can add a system user."""
     events = []
@@ -647,6 +647,49 @@ async def test_states(
     assert json[1]["entity_id"] == "test.entity2"
 
 
+async def test_states_conditional_requests(
+    hass: HomeAssistant, mock_api_client: TestClient, hass_admin_user: MockUser
+) -> None:
+    """Test unchanged states are answered with a 304."""
+    hass.states.async_set("test.entity", "hello")
+    resp = await mock_api_client.get(const.URL_API_STATES)
+    assert resp.status == HTTPStatus.OK
+    etag = resp.headers["ETag"]
+    # The same tag is sent for the compressed and the identity body
+    assert etag.startswith("W/")
+
+    # The cached body is not encoded and hashed again
+    with patch("homeassistant.components.api.hashlib.blake2b") as blake2b_mock:
+        resp = await mock_api_client.get(
+            const.URL_API_STATES, headers={"If-None-Match": etag}
+        )
+    assert not blake2b_mock.called
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+    assert resp.headers["ETag"] == etag
+
+    hass.states.async_set("test.entity", "world")
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["ETag"] != etag
+    json = await resp.json()
+    assert json[0]["state"] == "world"
+
+    resp = await mock_api_client.get("/api/states/test.entity")
+    assert resp.status == HTTPStatus.OK
+    etag = resp.headers["ETag"]
+    resp = await mock_api_client.get(
+        "/api/states/test.entity", headers={"If-None-Match": etag}
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+
+    hass.states.async_remove("test.entity")
+    resp = await mock_api_client.get(const.URL_API_STATES)
+    assert resp.status == HTTPStatus.OK
+    assert await resp.json() == []
+
+
 async def test_states_view_filters(
     hass: HomeAssistant,
     hass_read_only_user: MockUser,
@@ -1063,6 +1063,85 @@ async def test_reload_unchanged_automation(
         assert len(calls) == 2
 
 
+async def test_reload_only_validates_changed_automations(
+    hass: HomeAssistant, calls
+) -> None:
+    """Test reload does not validate automations which did not change."""
+    config = {
+        automation.DOMAIN: [
+            {
+                "id": "one",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {"service": "test.automation"},
+            },
+            {
+                "id": "two",
+                "trigger": {"platform": "event", "event_type": "test_event_2"},
+                "action": {"service": "test.automation"},
+            },
+        ]
+    }
+    assert await async_setup_component(hass, automation.DOMAIN, config)
+
+    config[automation.DOMAIN][1]["trigger"]["event_type"] = "test_event_3"
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value=config,
+    ), patch(
+        "homeassistant.components.automation.config._async_validate_config_item",
+        wraps=automation.config._async_validate_config_item,
+    ) as mock_validate:
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert len(mock_validate.mock_calls) == 1
+    assert mock_validate.mock_calls[0].args[1]["id"] == "two"
+
+    hass.bus.async_fire("test_event")
+    hass.bus.async_fire("test_event_2")
+    hass.bus.async_fire("test_event_3")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
+async def test_reload_validates_automations_after_device_registry_update(
+    hass: HomeAssistant, calls
+) -> None:
+    """Test reload validates all automations after the device registry changed."""
+    config = {
+        automation.DOMAIN: [
+            {
+                "id": "one",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {"service": "test.automation"},
+            },
+            {
+                "id": "two",
+                "trigger": {"platform": "event", "event_type": "test_event_2"},
+                "action": {"service": "test.automation"},
+            },
+        ]
+    }
+    assert await async_setup_component(hass, automation.DOMAIN, config)
+
+    # Device triggers, conditions and actions depend on the device registry
+    hass.bus.async_fire(
+        dr.EVENT_DEVICE_REGISTRY_UPDATED, {"action": "remove", "device_id": "abcd"}
+    )
+    await hass.async_block_till_done()
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value=config,
+    ), patch(
+        "homeassistant.components.automation.config._async_validate_config_item",
+        wraps=automation.config._async_validate_config_item,
+    ) as mock_validate:
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert len(mock_validate.mock_calls) == 2
+
+
 @pytest.mark.parametrize("extra_config", ({}, {"id": "sun"}))
 async def test_reload_automation_when_blueprint_changes(
     hass: HomeAssistant, calls, extra_config
@@ -0,0 +1,81 @@
+"""The tests for the recent history kept in memory."""
+from datetime import timedelta
+
+from freezegun import freeze_time
+
+from homeassistant.components import history
+from homeassistant.components.history.recent import RecentHistory
+from homeassistant.components.recorder import Recorder
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+
+async def test_recent_history_opt_in(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the recent history is only kept in memory when configured."""
+    assert await async_setup_component(hass, "history", {})
+    assert history.const.DATA_RECENT_HISTORY not in hass.data
+
+
+async def test_recent_history_max_states(hass: HomeAssistant) -> None:
+    """Test the oldest state changes are dropped over the total limit."""
+    now = dt_util.utcnow()
+    recent_history = RecentHistory(hass, lambda entity_id: True, 2)
+    recent_history.async_setup()
+    with freeze_time(now):
+        hass.states.async_set("sensor.energy", "0")
+    for minutes in range(1, 4):
+        with freeze_time(now + timedelta(minutes=minutes)):
+            hass.states.async_set("sensor.power", str(minutes))
+    await hass.async_block_till_done()
+    # The current state of each entity is kept over the limit
+    assert recent_history.entity_count == 2
+    assert recent_history.state_count == 3
+
+    start_ts = (now - timedelta(hours=1)).timestamp()
+    assert recent_history.async_get_states(
+        start_ts,
+        (now + timedelta(minutes=2, seconds=30)).timestamp(),
+        ["sensor.energy", "sensor.power"],
+    ) == {
+        "sensor.energy": [(now.timestamp(), "0")],
+        "sensor.power": [
+            ((now + timedelta(minutes=2)).timestamp(), "2"),
+            ((now + timedelta(minutes=3)).timestamp(), "3"),
+        ],
+    }
+    # The state at the start time was dropped
+    assert (
+        recent_history.async_get_states(
+            start_ts, (now + timedelta(minutes=1)).timestamp(), ["sensor.power"]
+        )
+        is None
+    )
+
+
+async def test_recent_history_entity_removed(hass: HomeAssistant) -> None:
+    """Test removed entities are no longer tracked."""
+    now = dt_util.utcnow()
+    recent_history = RecentHistory(hass, lambda entity_id: True, 10)
+    recent_history.async_setup()
+    with freeze_time(now):
+        hass.states.async_set("sensor.power", "1")
+    with freeze_time(now + timedelta(minutes=1)):
+        hass.states.async_set("sensor.power", "2")
+    await hass.async_block_till_done()
+    assert recent_history.entity_count == 1
+
+    hass.states.async_remove("sensor.power")
+    await hass.async_block_till_done()
+    assert recent_history.entity_count == 0
+    assert recent_history.state_count == 0
+    assert (
+        recent_history.async_get_states(
+            (now - timedelta(hours=1)).timestamp(),
+            (now + timedelta(seconds=30)).timestamp(),
+            ["sensor.power"],
+        )
+        is None
+    )
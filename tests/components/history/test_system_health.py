@@ -0,0 +1,36 @@
+"""Test history system health."""
+from homeassistant.components.recorder import Recorder
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+from tests.components.recorder.common import async_wait_recording_done
+
+
+async def test_system_health_info(recorder_mock: Recorder, hass: HomeAssistant) -> None:
+    """Test system health info endpoint."""
+    assert await async_setup_component(
+        hass, "history", {"history": {"recent_history_max_states": 100}}
+    )
+    assert await async_setup_component(hass, "system_health", {})
+    hass.states.async_set("sensor.power", "1")
+    hass.states.async_set("sensor.power", "2")
+    await async_wait_recording_done(hass)
+    info = await get_system_health_info(hass, "history")
+    assert info == {
+        "recent_history": True,
+        "recent_history_entities": 1,
+        "recent_history_states": 2,
+        "recent_history_hits": 0,
+        "recent_history_misses": 0,
+    }
+
+
+async def test_system_health_info_disabled(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test system health info endpoint without the recent history."""
+    assert await async_setup_component(hass, "history", {})
+    assert await async_setup_component(hass, "system_health", {})
+    info = await get_system_health_info(hass, "history")
+    assert info == {"recent_history": False}
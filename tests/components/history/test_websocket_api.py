@@ -171,6 +171,162 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_max_points(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsamples numeric states with max_points."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    power_states = [
+        "10",
+        "12",
+        "8",
+        "11",
+        "unavailable",
+        "20",
+        "15",
+        "25",
+        "18",
+        "30",
+        "5",
+        "7",
+        "9",
+    ]
+    for minutes, state in enumerate(power_states):
+        with freeze_time(now + timedelta(minutes=minutes)):
+            hass.states.async_set("sensor.power", state)
+            hass.states.async_set("switch.door", "on" if minutes % 2 else "off")
+            await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": (now - timedelta(seconds=1)).isoformat(),
+            "end_time": (now + timedelta(hours=1)).isoformat(),
+            "entity_ids": ["sensor.power", "switch.door"],
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+            "max_points": 6,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    # The buckets are 6 minutes wide, the minimum, maximum and
+    # last state of each bucket and all non-numeric states are kept
+    assert [state["s"] for state in response["result"]["sensor.power"]] == [
+        "10",
+        "12",
+        "8",
+        "11",
+        "unavailable",
+        "20",
+        "30",
+        "5",
+        "7",
+        "9",
+    ]
+    assert response["result"]["sensor.power"][-1]["lu"] == pytest.approx(
+        (now + timedelta(minutes=12)).timestamp()
+    )
+    # Non-numeric states are not downsampled
+    assert len(response["result"]["switch.door"]) == len(power_states)
+
+
+async def test_history_during_period_recent_history(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period is answered from the recent history in memory."""
+    now = dt_util.utcnow() + timedelta(minutes=1)
+
+    await async_setup_component(
+        hass, "history", {"history": {"recent_history_max_states": 100}}
+    )
+    await async_recorder_block_till_done(hass)
+    with freeze_time(now):
+        hass.states.async_set("sensor.power", "1")
+        hass.states.async_set("switch.door", "on")
+    with freeze_time(now + timedelta(minutes=1)):
+        hass.states.async_set("sensor.power", "2")
+    with freeze_time(now + timedelta(minutes=2)):
+        hass.states.async_set("sensor.power", "2", {"changed": "attributes"})
+        hass.states.async_set("switch.door", "off")
+    with freeze_time(now + timedelta(minutes=3)):
+        hass.states.async_set("sensor.power", "3")
+    await async_wait_recording_done(hass)
+
+    # Answer the requests after the states changed
+    with freeze_time(now + timedelta(minutes=5)):
+        client = await hass_ws_client()
+        msg_id = 0
+
+        async def _history_during_period(start_time, entity_ids):
+            nonlocal msg_id
+            msg_id += 1
+            await client.send_json(
+                {
+                    "id": msg_id,
+                    "type": "history/history_during_period",
+                    "start_time": start_time.isoformat(),
+                    "end_time": (now + timedelta(minutes=150)).isoformat(),
+                    "entity_ids": entity_ids,
+                    "significant_changes_only": False,
+                    "no_attributes": True,
+                    "minimal_response": True,
+                }
+            )
+            response = await client.receive_json()
+            assert response["success"]
+            return response["result"]
+
+        recent_history = hass.data[history.const.DATA_RECENT_HISTORY]
+        start_time = now + timedelta(seconds=30)
+        with patch(
+            "homeassistant.components.history.websocket_api.history.get_significant_states"
+        ) as get_significant_states_mock:
+            result = await _history_during_period(
+                start_time, ["sensor.power", "switch.door"]
+            )
+        assert not get_significant_states_mock.called
+        assert recent_history.hits == 1
+        assert result == {
+            "sensor.power": [
+                {"s": "1", "lu": start_time.timestamp()},
+                {"s": "2", "lu": (now + timedelta(minutes=1)).timestamp()},
+                {"s": "3", "lu": (now + timedelta(minutes=3)).timestamp()},
+            ],
+            "switch.door": [
+                {"s": "on", "lu": start_time.timestamp()},
+                {"s": "off", "lu": (now + timedelta(minutes=2)).timestamp()},
+            ],
+        }
+
+        # The same result is returned from the database
+        hass.data.pop(history.const.DATA_RECENT_HISTORY)
+        assert (
+            await _history_during_period(start_time, ["sensor.power", "switch.door"])
+            == result
+        )
+        hass.data[history.const.DATA_RECENT_HISTORY] = recent_history
+
+        # The state at the start time is not known
+        assert await _history_during_period(now, ["sensor.power"]) == {
+            "sensor.power": [
+                {"s": "2", "lu": (now + timedelta(minutes=1)).timestamp()},
+                {"s": "3", "lu": (now + timedelta(minutes=3)).timestamp()},
+            ],
+        }
+        assert recent_history.hits == 1
+        assert recent_history.misses == 1
+
+
 async def test_history_during_period_impossible_conditions(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -523,6 +679,83 @@ async def test_history_stream_historical_only(
     }
 
 
+async def test_history_stream_historical_only_chunked(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sends the states of many entities in chunks."""
+    now = dt_util.utcnow()
+    await async_setup_component(
+        hass,
+        "history",
+        {},
+    )
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    sensor_one_last_updated = hass.states.get("sensor.one").last_updated
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.two", "off", attributes={"any": "attr"})
+    sensor_two_last_updated = hass.states.get("sensor.two").last_updated
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.three", "off", attributes={"any": "changed"})
+    sensor_three_last_updated = hass.states.get("sensor.three").last_updated
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    with patch.object(websocket_api, "MAX_ENTITY_IDS_PER_STREAM_MESSAGE", 2):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "entity_ids": ["sensor.one", "sensor.two", "sensor.three"],
+                "start_time": now.isoformat(),
+                "end_time": end_time.isoformat(),
+                "include_start_time_state": True,
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["id"] == 1
+        assert response["type"] == "result"
+
+        response = await client.receive_json()
+        assert response == {
+            "event": {
+                "end_time": sensor_two_last_updated.timestamp(),
+                "start_time": now.timestamp(),
+                "states": {
+                    "sensor.one": [
+                        {"lu": sensor_one_last_updated.timestamp(), "s": "on"}
+                    ],
+                    "sensor.two": [
+                        {"lu": sensor_two_last_updated.timestamp(), "s": "off"}
+                    ],
+                },
+            },
+            "id": 1,
+            "type": "event",
+        }
+
+        response = await client.receive_json()
+        assert response == {
+            "event": {
+                "end_time": sensor_three_last_updated.timestamp(),
+                "start_time": now.timestamp(),
+                "states": {
+                    "sensor.three": [
+                        {"lu": sensor_three_last_updated.timestamp(), "s": "off"}
+                    ],
+                },
+            },
+            "id": 1,
+            "type": "event",
+        }
+
+
 async def test_history_stream_significant_domain_historical_only(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -2,12 +2,17 @@
 
 
 from pathlib import Path
+from unittest.mock import patch
 
 from aiohttp.test_utils import TestClient
 from aiohttp.web_exceptions import HTTPForbidden
 import pytest
 
-from homeassistant.components.http.static import CachingStaticResource, _get_file_path
+from homeassistant.components.http.static import (
+    MAX_CACHED_FILE_SIZE,
+    CachingStaticResource,
+    _get_file_path,
+)
 from homeassistant.core import EVENT_HOMEASSISTANT_START, HomeAssistant
 from homeassistant.setup import async_setup_component
 
@@ -59,3 +64,131 @@ async def test_static_path_blocks_anchors(
     # changes we still block it.
     with pytest.raises(HTTPForbidden):
         _get_file_path(canonical_url, tmp_path, False)
+
+
+async def test_static_file_served_from_memory(
+    hass: HomeAssistant, aiohttp_client: ClientSessionGenerator, tmp_path: Path
+) -> None:
+    """Test small static files and their precompressed variants are kept in memory."""
+    (tmp_path / "app.js").write_bytes(b"console.log('hello');")
+    (tmp_path / "app.js.br").write_bytes(b"brotli")
+    (tmp_path / "app.js.gz").write_bytes(b"gzip")
+    (tmp_path / "big.js").write_bytes(b"a" * (MAX_CACHED_FILE_SIZE + 1))
+    app = hass.http.app
+    app.router.register_resource(CachingStaticResource("/static", str(tmp_path)))
+    client = await aiohttp_client(
+        app, server_kwargs={"skip_url_asserts": True}, auto_decompress=False
+    )
+
+    resp = await client.get("/static/app.js", headers={"Accept-Encoding": "identity"})
+    assert resp.status == 200
+    assert await resp.read() == b"console.log('hello');"
+    assert resp.headers["Content-Type"] == "text/javascript"
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    assert "Content-Encoding" not in resp.headers
+    etag = resp.headers["ETag"]
+    last_modified = resp.headers["Last-Modified"]
+
+    (tmp_path / "app.js").unlink()
+
+    resp = await client.get(
+        "/static/app.js", headers={"Accept-Encoding": "gzip, deflate, br"}
+    )
+    assert resp.status == 200
+    assert await resp.read() == b"brotli"
+    assert resp.headers["Content-Encoding"] == "br"
+    assert resp.headers["Content-Type"] == "text/javascript"
+
+    resp = await client.get("/static/app.js", headers={"Accept-Encoding": "gzip"})
+    assert resp.status == 200
+    assert await resp.read() == b"gzip"
+    assert resp.headers["Content-Encoding"] == "gzip"
+
+    resp = await client.get(
+        "/static/app.js", headers={"Accept-Encoding": "br;q=0, gzip;q=0.5"}
+    )
+    assert resp.status == 200
+    assert await resp.read() == b"gzip"
+    assert resp.headers["Content-Encoding"] == "gzip"
+
+    resp = await client.get(
+        "/static/app.js",
+        headers={"Accept-Encoding": "identity", "If-None-Match": etag},
+    )
+    assert resp.status == 304
+    assert resp.headers["ETag"] == etag
+
+    resp = await client.get(
+        "/static/app.js",
+        headers={"Accept-Encoding": "identity", "If-Modified-Since": last_modified},
+    )
+    assert resp.status == 304
+
+    resp = await client.get("/static/big.js")
+    assert resp.status == 200
+    assert len(await resp.read()) == MAX_CACHED_FILE_SIZE + 1
+    assert "Vary" not in resp.headers
+
+
+async def test_large_static_file_precompressed(
+    hass: HomeAssistant, aiohttp_client: ClientSessionGenerator, tmp_path: Path
+) -> None:
+    """Test precompressed variants of large files are sent from disk."""
+    big_body = b"a" * (MAX_CACHED_FILE_SIZE + 1)
+    (tmp_path / "big.js").write_bytes(big_body)
+    (tmp_path / "big.js.br").write_bytes(b"b" * (MAX_CACHED_FILE_SIZE + 1))
+    (tmp_path / "big.js.gz").write_bytes(b"g" * (MAX_CACHED_FILE_SIZE + 1))
+    app = hass.http.app
+    app.router.register_resource(CachingStaticResource("/static", str(tmp_path)))
+    client = await aiohttp_client(
+        app, server_kwargs={"skip_url_asserts": True}, auto_decompress=False
+    )
+
+    resp = await client.get(
+        "/static/big.js", headers={"Accept-Encoding": "gzip, deflate, br"}
+    )
+    assert resp.status == 200
+    assert await resp.read() == b"b" * (MAX_CACHED_FILE_SIZE + 1)
+    assert resp.headers["Content-Encoding"] == "br"
+    assert resp.headers["Content-Type"] == "text/javascript"
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    br_etag = resp.headers["ETag"]
+
+    resp = await client.get("/static/big.js", headers={"Accept-Encoding": "gzip"})
+    assert resp.status == 200
+    assert await resp.read() == b"g" * (MAX_CACHED_FILE_SIZE + 1)
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert resp.headers["ETag"] != br_etag
+
+    resp = await client.get("/static/big.js", headers={"Accept-Encoding": "identity"})
+    assert resp.status == 200
+    assert await resp.read() == big_body
+    assert "Content-Encoding" not in resp.headers
+    assert resp.headers["Vary"] == "Accept-Encoding"
+
+
+async def test_static_file_in_memory_reloaded_when_changed(
+    hass: HomeAssistant, aiohttp_client: ClientSessionGenerator, tmp_path: Path
+) -> None:
+    """Test files kept in memory are checked for changes on disk."""
+    app_js = tmp_path / "app.js"
+    app_js.write_bytes(b"old")
+    app = hass.http.app
+    app.router.register_resource(CachingStaticResource("/static", str(tmp_path)))
+    client = await aiohttp_client(
+        app, server_kwargs={"skip_url_asserts": True}, auto_decompress=False
+    )
+
+    resp = await client.get("/static/app.js")
+    assert await resp.read() == b"old"
+    etag = resp.headers["ETag"]
+
+    app_js.write_bytes(b"new body")
+    resp = await client.get("/static/app.js")
+    assert await resp.read() == b"old"
+
+    with patch("homeassistant.components.http.static.FILE_CACHE_TTL", -1):
+        resp = await client.get("/static/app.js", headers={"If-None-Match": etag})
+        assert resp.status == 200
+        assert await resp.read() == b"new body"
+        assert resp.headers["ETag"] != etag
@@ -959,6 +959,52 @@ async def test_light_brightness_step(
     assert entity0.state == "off"  # 126 - 126; brightness is 0, light should turn off
 
 
+async def test_light_turn_on_batched(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test turning on lights is passed to a batch handler with their params."""
+    platform = getattr(hass.components, "test.light")
+    platform.init(empty=True)
+    platform.ENTITIES.append(platform.MockLight("Test_0", STATE_ON))
+    platform.ENTITIES.append(platform.MockLight("Test_1", STATE_ON))
+    platform.ENTITIES.append(platform.MockLight("Test_2", STATE_ON))
+    for entity, brightness in zip(platform.ENTITIES, (100, 50, 10)):
+        entity.supported_features = light.SUPPORT_BRIGHTNESS
+        entity.brightness = brightness
+    assert await async_setup_component(hass, "light", {"light": {"platform": "test"}})
+    await hass.async_block_till_done()
+    entity0, entity1, entity2 = platform.ENTITIES
+
+    batch_calls = []
+
+    async def handle_batch(batch):
+        batch_calls.append(sorted((entity.entity_id, data) for entity, data in batch))
+
+    entity0.platform.async_register_batch_service_handler(
+        "light", "turn_on", handle_batch
+    )
+
+    await hass.services.async_call(
+        "light",
+        "turn_on",
+        {
+            "entity_id": [entity0.entity_id, entity1.entity_id, entity2.entity_id],
+            "brightness_step": -10,
+        },
+        blocking=True,
+    )
+
+    # The lights turned off by the brightness step are not batched
+    assert batch_calls == [
+        [
+            (entity0.entity_id, {"brightness": 90}),
+            (entity1.entity_id, {"brightness": 40}),
+        ]
+    ]
+    assert entity0.last_call("turn_on") is None
+    assert entity2.state == "off"
+
+
 async def test_light_brightness_pct_conversion(
     hass: HomeAssistant, enable_custom_integrations: None
 ) -> None:
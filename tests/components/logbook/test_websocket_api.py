@@ -11,8 +11,13 @@ from homeassistant import core
 from homeassistant.components import logbook, recorder
 from homeassistant.components.automation import ATTR_SOURCE, EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.logbook import websocket_api
+from homeassistant.components.logbook.queries.contexts import context_rows_stmt
 from homeassistant.components.recorder import Recorder
-from homeassistant.components.recorder.util import get_instance
+from homeassistant.components.recorder.util import (
+    execute_stmt_lambda_element,
+    get_instance,
+    session_scope,
+)
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.const import (
@@ -35,6 +40,7 @@ from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.entityfilter import CONF_ENTITY_GLOBS
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
+from homeassistant.util.ulid import ulid_to_bytes
 
 from tests.common import MockConfigEntry, async_fire_time_changed
 from tests.components.recorder.common import (
@@ -295,6 +301,255 @@ async def test_get_events(
     assert isinstance(results[0]["when"], float)
 
 
+async def test_get_events_paged(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events with a limit and a cursor."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    for state in (STATE_OFF, STATE_ON, STATE_OFF, STATE_ON, STATE_OFF, STATE_ON):
+        hass.states.async_set("light.kitchen", state)
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    msg_id = 0
+
+    async def _get_events(**kwargs):
+        nonlocal msg_id
+        msg_id += 1
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "logbook/get_events",
+                "start_time": now.isoformat(),
+                "end_time": (now + timedelta(minutes=2)).isoformat(),
+                "entity_ids": ["light.kitchen"],
+                **kwargs,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["id"] == msg_id
+        return response["result"]
+
+    async def _get_all_pages(limit):
+        events = []
+        pages = 0
+        cursor = None
+        while True:
+            kwargs = {"limit": limit}
+            if cursor is not None:
+                kwargs["cursor"] = cursor
+            page = await _get_events(**kwargs)
+            pages += 1
+            events.extend(page["events"])
+            if page["cursor"] is None:
+                return events, pages
+            # The cursor always moves forward
+            assert cursor is None or page["cursor"] > cursor
+            cursor = page["cursor"]
+
+    all_events = await _get_events()
+    assert len(all_events) == 5
+
+    events, pages = await _get_all_pages(2)
+    assert events == all_events
+    assert pages > 1
+    assert await _get_all_pages(100) == (all_events, 1)
+
+    # Rows with the same timestamp can be split over pages
+    with freeze_time(now + timedelta(minutes=1)):
+        for state in (STATE_OFF, STATE_ON, STATE_OFF):
+            hass.states.async_set("light.kitchen", state)
+            await hass.async_block_till_done()
+        await async_wait_recording_done(hass)
+
+    all_events = await _get_events()
+    assert len(all_events) == 8
+    for limit in (1, 2, 6, 7, 8):
+        events, pages = await _get_all_pages(limit)
+        assert events == all_events
+        assert pages > 1
+    assert await _get_all_pages(9) == (all_events, 1)
+
+    assert await _get_events(
+        start_time=(now + timedelta(days=1)).isoformat(), limit=2
+    ) == {"events": [], "cursor": None}
+
+
+async def test_get_events_paged_context(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the context of events is found when it started on an earlier page."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    hass.states.async_set("switch.hallway", STATE_OFF)
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    await hass.async_block_till_done()
+    context = core.Context(user_id="b400facee45711eaa9308bfd3d19e474")
+    hass.states.async_set("switch.hallway", STATE_ON, context=context)
+    await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen", STATE_ON, context=context)
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "limit": 1,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    page = response["result"]
+    assert page["events"] == [
+        {
+            "entity_id": "switch.hallway",
+            "state": "on",
+            "context_user_id": "b400facee45711eaa9308bfd3d19e474",
+            "when": ANY,
+        }
+    ]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "limit": 1,
+            "cursor": page["cursor"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["events"] == [
+        {
+            "entity_id": "light.kitchen",
+            "state": "on",
+            "context_user_id": "b400facee45711eaa9308bfd3d19e474",
+            "context_entity_id": "switch.hallway",
+            "context_state": "on",
+            "when": ANY,
+        }
+    ]
+
+
+async def test_get_events_paged_context_before_start(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test rows of contexts that started before the period do not fill a page."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    hass.states.async_set("switch.hallway", STATE_OFF)
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    await hass.async_block_till_done()
+    context = core.Context(user_id="b400facee45711eaa9308bfd3d19e474")
+    hass.states.async_set("switch.hallway", STATE_ON, context=context)
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    start_time = dt_util.utcnow()
+    hass.states.async_set("light.kitchen", STATE_ON, context=context)
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/get_events",
+            "start_time": start_time.isoformat(),
+            "entity_ids": ["light.kitchen"],
+            "limit": 1,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    page = response["result"]
+    assert page["events"] == [
+        {
+            "entity_id": "light.kitchen",
+            "state": "on",
+            "context_user_id": "b400facee45711eaa9308bfd3d19e474",
+            "context_entity_id": "switch.hallway",
+            "context_state": "on",
+            "when": ANY,
+        }
+    ]
+    assert page["cursor"] == [page["events"][0]["when"], 1]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "logbook/get_events",
+            "start_time": start_time.isoformat(),
+            "entity_ids": ["light.kitchen"],
+            "limit": 1,
+            "cursor": page["cursor"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"events": [], "cursor": None}
+
+
+async def test_context_rows_stmt_first_rows(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test only the first rows of the contexts are selected."""
+    await async_setup_component(hass, "logbook", {})
+    await async_recorder_block_till_done(hass)
+
+    context = core.Context(user_id="b400facee45711eaa9308bfd3d19e474")
+    hass.bus.async_fire("mock_event", context=context)
+    await hass.async_block_till_done()
+    hass.bus.async_fire("mock_event", context=context)
+    hass.states.async_set("switch.hallway", STATE_ON, context=context)
+    await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen", STATE_ON, context=context)
+    await async_wait_recording_done(hass)
+
+    def _get_rows():
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                (row.event_type, row.entity_id)
+                for row in execute_stmt_lambda_element(
+                    session,
+                    context_rows_stmt([ulid_to_bytes(context.id)]),
+                    orm_rows=False,
+                )
+            ]
+
+    assert await get_instance(hass).async_add_executor_job(_get_rows) == [
+        ("mock_event", None),
+        (None, "switch.hallway"),
+    ]
+
+
 async def test_get_events_entities_filtered_away(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
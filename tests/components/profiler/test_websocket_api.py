@@ -0,0 +1,77 @@
+"""Test the profiler websocket API."""
+import asyncio
+
+import pytest
+
+from homeassistant.components.profiler import CONF_SECONDS, SERVICE_STATE_WRITE_STATS
+from homeassistant.components.profiler.const import DOMAIN
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from tests.common import MockConfigEntry, MockEntity, MockEntityPlatform
+from tests.typing import WebSocketGenerator
+
+
+async def test_state_write_stats(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test collecting statistics of state writes."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    platform = MockEntityPlatform(hass, domain="test", platform_name="mock_platform")
+    entity = MockEntity(entity_id="test.test", state="on")
+    await platform.async_add_entities([entity])
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/state_write_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"running": False, "duration": 0.0, "stats": []}
+
+    task = hass.async_create_task(
+        hass.services.async_call(
+            DOMAIN, SERVICE_STATE_WRITE_STATS, {CONF_SECONDS: 0.1}, blocking=True
+        )
+    )
+    await asyncio.sleep(0)
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STATE_WRITE_STATS, {CONF_SECONDS: 0.1}, blocking=True
+        )
+
+    entity.async_write_ha_state()
+    entity._values["state"] = "off"
+    entity.async_write_ha_state()
+    await client.send_json_auto_id({"type": "profiler/state_write_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["running"] is True
+    stats = response["result"]["stats"]
+    assert len(stats) == 1
+    assert stats[0]["integration"] == "mock_platform"
+    assert stats[0]["entity_class"] == "tests.common.MockEntity"
+    assert stats[0]["writes"] == 2
+    assert stats[0]["writes_per_second"] > 0
+    assert stats[0]["unchanged_writes"] == 1
+    assert stats[0]["calculate_time"] > 0
+    assert stats[0]["set_time"] > 0
+
+    await task
+    assert "State writes of tests.common.MockEntity from mock_platform: 2" in (
+        caplog.text
+    )
+
+    await client.send_json_auto_id({"type": "profiler/state_write_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["running"] is False
+    assert response["result"]["duration"] >= 0.1
+    assert response["result"]["stats"][0]["writes"] == 2
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -37,6 +37,7 @@ from homeassistant.helpers.script import (
     SCRIPT_MODE_RESTART,
     SCRIPT_MODE_SINGLE,
     _async_stop_scripts_at_shutdown,
+    async_get_service_concurrency_limit,
 )
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.setup import async_setup_component
@@ -498,6 +499,68 @@ async def test_reload_unchanged_script(
         assert len(calls) == 2
 
 
+async def test_reload_only_validates_changed_scripts(
+    hass: HomeAssistant, calls
+) -> None:
+    """Test reload does not validate scripts which did not change."""
+    config = {
+        script.DOMAIN: {
+            "one": {"sequence": [{"service": "test.script"}]},
+            "two": {"sequence": [{"service": "test.script"}]},
+        }
+    }
+    assert await async_setup_component(hass, script.DOMAIN, config)
+
+    config[script.DOMAIN]["two"]["alias"] = "Two"
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value=config,
+    ), patch(
+        "homeassistant.components.script.config._async_validate_config_item",
+        wraps=script.config._async_validate_config_item,
+    ) as mock_validate:
+        await hass.services.async_call(script.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert len(mock_validate.mock_calls) == 1
+    assert mock_validate.mock_calls[0].args[1] == "two"
+    assert hass.states.get("script.two").name == "Two"
+
+    await hass.services.async_call(DOMAIN, "one", blocking=True)
+    await hass.services.async_call(DOMAIN, "two", blocking=True)
+    assert len(calls) == 2
+
+
+async def test_reload_validates_scripts_after_device_registry_update(
+    hass: HomeAssistant, calls
+) -> None:
+    """Test reload validates all scripts after the device registry changed."""
+    config = {
+        script.DOMAIN: {
+            "one": {"sequence": [{"service": "test.script"}]},
+            "two": {"sequence": [{"service": "test.script"}]},
+        }
+    }
+    assert await async_setup_component(hass, script.DOMAIN, config)
+
+    # Device conditions and actions depend on the device registry
+    hass.bus.async_fire(
+        dr.EVENT_DEVICE_REGISTRY_UPDATED, {"action": "remove", "device_id": "abcd"}
+    )
+    await hass.async_block_till_done()
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value=config,
+    ), patch(
+        "homeassistant.components.script.config._async_validate_config_item",
+        wraps=script.config._async_validate_config_item,
+    ) as mock_validate:
+        await hass.services.async_call(script.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert len(mock_validate.mock_calls) == 2
+
+
 async def test_service_descriptions(hass: HomeAssistant) -> None:
     """Test that service descriptions are loaded and reloaded correctly."""
     # Test 1: has "description" but no "fields"
@@ -1451,6 +1514,30 @@ async def test_websocket_config(
     assert msg["error"]["code"] == "not_found"
 
 
+async def test_websocket_concurrency_stats(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the concurrency stats command."""
+    assert await async_setup_component(hass, "script", {})
+    async_get_service_concurrency_limit(hass).async_set_limit("light", 2)
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "script/concurrency_stats"})
+
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "light": {
+            "limit": 2,
+            "in_flight": 0,
+            "queued": 0,
+            "max_queued": 0,
+            "acquired": 0,
+            "waited": 0,
+            "total_wait_time": 0.0,
+        }
+    }
+
+
 async def test_script_service_changed_entity_id(hass: HomeAssistant) -> None:
     """Test the script service works for scripts with overridden entity_id."""
     entity_reg = er.async_get(hass)
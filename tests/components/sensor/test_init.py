@@ -32,6 +32,7 @@ from homeassistant.const import (
     UnitOfEnergy,
     UnitOfLength,
     UnitOfMass,
+    UnitOfPower,
     UnitOfPressure,
     UnitOfSpeed,
     UnitOfTemperature,
@@ -902,6 +903,46 @@ async def test_custom_unit_change(
     assert state.attributes.get(ATTR_UNIT_OF_MEASUREMENT) == native_unit
 
 
+async def test_native_unit_change(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test changes of the native unit are picked up by the cached unit conversion."""
+    entity_registry = er.async_get(hass)
+    platform = getattr(hass.components, "test.sensor")
+    platform.init(empty=True)
+    platform.ENTITIES["0"] = platform.MockSensor(
+        name="Test",
+        native_value="1500",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        unique_id="very_unique",
+    )
+
+    entity0 = platform.ENTITIES["0"]
+    assert await async_setup_component(hass, "sensor", {"sensor": {"platform": "test"}})
+    await hass.async_block_till_done()
+
+    entity_registry.async_update_entity_options(
+        "sensor.test", "sensor", {"unit_of_measurement": UnitOfPower.KILO_WATT}
+    )
+    await hass.async_block_till_done()
+    state = hass.states.get(entity0.entity_id)
+    assert state.state == "1.500"
+    assert state.attributes.get(ATTR_UNIT_OF_MEASUREMENT) == UnitOfPower.KILO_WATT
+
+    entity0._values["native_unit_of_measurement"] = UnitOfPower.KILO_WATT
+    entity0._values["native_value"] = "2.5"
+    entity0.async_write_ha_state()
+    state = hass.states.get(entity0.entity_id)
+    assert state.state == "2.5"
+    assert state.attributes.get(ATTR_UNIT_OF_MEASUREMENT) == UnitOfPower.KILO_WATT
+
+    entity0._values["native_unit_of_measurement"] = UnitOfPower.WATT
+    entity0.async_write_ha_state()
+    state = hass.states.get(entity0.entity_id)
+    assert state.state == "0.0025"
+
+
 @pytest.mark.parametrize(
     (
         "unit_system",
@@ -38,7 +38,7 @@ def _find_traces(traces, trace_type, item_id):
 
 
 async def _setup_automation_or_script(
-    hass, domain, configs, script_config=None, stored_traces=None
+    hass, domain, configs, script_config=None, stored_traces=None, trace_level=None
 ):
     """Set up automations or scripts from automation config."""
     if domain == "script":
@@ -62,6 +62,10 @@ async def _setup_automation_or_script(
                 config["trace"] = {}
                 config["trace"]["stored_traces"] = stored_traces
 
+    if trace_level is not None:
+        for config in configs.values() if domain == "script" else configs:
+            config.setdefault("trace", {})["trace_level"] = trace_level
+
     assert await async_setup_component(hass, domain, {domain: configs})
 
 
@@ -587,6 +591,62 @@ async def test_trace_overflow(
     assert len(_find_traces(response["result"], domain, "sun")) == 1
 
 
+@pytest.mark.parametrize(
+    ("domain", "prefix"), [("automation", "action"), ("script", "sequence")]
+)
+@pytest.mark.parametrize(
+    ("trace_level", "num_traces", "has_variables"),
+    [("off", 0, False), ("summary", 1, False), ("full", 1, True)],
+)
+async def test_trace_level(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    domain,
+    prefix,
+    trace_level,
+    num_traces,
+    has_variables,
+) -> None:
+    """Test the trace level limits what is recorded."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": [{"variables": {"planet": "sun"}}, {"event": "some_event"}],
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config], trace_level=trace_level
+    )
+
+    client = await hass_ws_client()
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    traces = _find_traces(response["result"], domain, "sun")
+    assert len(traces) == num_traces
+    if not traces:
+        return
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "trace/get",
+            "domain": domain,
+            "item_id": "sun",
+            "run_id": traces[0]["run_id"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    trace = response["result"]
+    assert set(trace["trace"]) >= {f"{prefix}/0", f"{prefix}/1"}
+    assert trace["trace"][f"{prefix}/1"][0]["path"] == f"{prefix}/1"
+    assert ("changed_variables" in trace["trace"][f"{prefix}/0"][0]) is has_variables
+
+
 @pytest.mark.parametrize(
     ("domain", "num_restored_moon_traces"), [("automation", 3), ("script", 1)]
 )
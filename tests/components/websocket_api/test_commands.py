@@ -17,7 +17,7 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
@@ -670,6 +670,70 @@ async def test_subscribe_unsubscribe_events(
     assert sum(hass.bus.async_listeners().values()) == init_count
 
 
+async def test_subscribe_events_filtered(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe events with filters."""
+    init_count = sum(hass.bus.async_listeners().values())
+
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "subscribe_events",
+            "event_type": [EVENT_STATE_CHANGED, "test_event", "test_event"],
+            "entity_ids": ["light.kitchen_*"],
+            "domains": ["switch"],
+            "exclude_attributes": ["secret"],
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert sum(hass.bus.async_listeners().values()) == init_count + 2
+
+    hass.states.async_set("light.living_room", "on")
+    hass.states.async_set("light.kitchen_ceiling", "on", {"secret": 1, "public": 2})
+    hass.bus.async_fire("test_event", {"hello": "world"})
+    hass.bus.async_fire("test_event", {"entity_id": "switch.fan"})
+
+    async with asyncio.timeout(3):
+        msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    event = msg["event"]
+    assert event["event_type"] == EVENT_STATE_CHANGED
+    assert event["data"]["entity_id"] == "light.kitchen_ceiling"
+    assert event["data"]["old_state"] is None
+    assert event["data"]["new_state"]["attributes"] == {"public": 2}
+
+    async with asyncio.timeout(3):
+        msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["event"]["event_type"] == "test_event"
+    assert msg["event"]["data"] == {"entity_id": "switch.fan"}
+
+    await websocket_client.send_json(
+        {"id": 6, "type": "unsubscribe_events", "subscription": 5}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
+async def test_subscribe_events_empty_event_types(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe events requires at least one event type."""
+    await websocket_client.send_json(
+        {"id": 5, "type": "subscribe_events", "event_type": []}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_INVALID_FORMAT
+
+
 async def test_get_states(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -9,6 +9,7 @@ import pytest
 
 from homeassistant.components.websocket_api import (
     async_register_command,
+    async_response,
     const,
     http,
     websocket_command,
@@ -503,3 +504,44 @@ async def test_binary_message(
     assert "Received binary message for non-existing handler 0" in caplog.text
     assert "Received binary message for non-existing handler 3" in caplog.text
     assert "Received binary message for non-existing handler 10" in caplog.text
+
+
+async def test_drain(hass: HomeAssistant, hass_ws_client: WebSocketGenerator) -> None:
+    """Test waiting for the sent messages to be written to the client."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+    pending_after_drain: list[int] = []
+
+    @websocket_command({"type": "drainer"})
+    @async_response
+    async def async_drainer(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        for idx in range(10):
+            connection.send_event(msg["id"], {"idx": idx})
+        await connection.async_drain()
+        pending_after_drain.append(len(instance._message_queue))
+        connection.send_result(msg["id"])
+
+    async_register_command(hass, async_drainer)
+
+    await websocket_client.send_json({"id": 1, "type": "drainer"})
+    for idx in range(10):
+        msg = await websocket_client.receive_json()
+        assert msg["event"] == {"idx": idx}
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "result"
+    assert pending_after_drain == [0]
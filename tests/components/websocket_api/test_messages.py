@@ -3,12 +3,15 @@ import pytest
 
 from homeassistant.components.websocket_api.messages import (
     _partial_cached_event_message as lru_event_cache,
+    _partial_cached_filtered_event_message as lru_filtered_event_cache,
     _state_diff_event,
     cached_event_message,
+    cached_filtered_event_message,
     message_to_json,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.util.json import json_loads
 
 from tests.common import async_capture_events
 
@@ -300,3 +303,22 @@ async def test_message_to_json(caplog: pytest.LogCaptureFixture) -> None:
 
 class _Unserializeable:
     """A class that cannot be serialized."""
+
+
+async def test_cached_filtered_event_message(hass: HomeAssistant) -> None:
+    """Test filtered event messages are cached per attribute filter."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("light.window", "on", {"color": "red", "brightness": 1})
+    await hass.async_block_till_done()
+
+    include = frozenset({"color"})
+    msg0 = json_loads(cached_filtered_event_message(2, events[0], include, None))
+    assert msg0["id"] == 2
+    assert msg0["event"]["data"]["new_state"]["attributes"] == {"color": "red"}
+    msg1 = json_loads(cached_filtered_event_message(3, events[0], None, include))
+    assert msg1["id"] == 3
+    assert msg1["event"]["data"]["new_state"]["attributes"] == {"brightness": 1}
+
+    cache_info = lru_filtered_event_cache.cache_info()
+    cached_filtered_event_message(4, events[0], include, None)
+    assert lru_filtered_event_cache.cache_info().hits == cache_info.hits + 1
@@ -0,0 +1,209 @@
+"""Tests for concurrency."""
+import asyncio
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import concurrency
+
+
+async def test_unlimited_keys(hass: HomeAssistant) -> None:
+    """Test keys without a limit are not limited."""
+    limiter = concurrency.KeyedConcurrencyLimit(hass)
+
+    assert limiter.async_limited_keys(["key1"]) == []
+    releases = [limiter.async_try_acquire(["key1"]) for _ in range(10)]
+    assert all(release is not None for release in releases)
+    assert limiter.async_get_stats() == {}
+
+
+async def test_try_acquire(hass: HomeAssistant) -> None:
+    """Test acquiring slots without waiting."""
+    limiter = concurrency.KeyedConcurrencyLimit(hass)
+    limiter.async_set_limit("key1", 1)
+    limiter.async_set_limit("key2", 2)
+
+    assert limiter.async_limited_keys(["key2", "key3", "key1", "key2"]) == [
+        "key1",
+        "key2",
+    ]
+
+    release = limiter.async_try_acquire(["key2"])
+    assert release is not None
+    release_both = limiter.async_try_acquire(["key1", "key2"])
+    assert release_both is not None
+
+    # key1 is not available, the slot of key2 must not be kept
+    assert limiter.async_try_acquire(["key2", "key1"]) is None
+    assert limiter.async_try_acquire(["key2"]) is None
+    stats = limiter.async_get_stats()
+    assert stats["key1"].in_flight == 1
+    assert stats["key2"].in_flight == 2
+
+    release_both()
+    assert limiter.async_get_stats()["key2"].in_flight == 1
+    assert limiter.async_try_acquire(["key2"]) is not None
+    release()
+    assert limiter.async_get_stats()["key1"] == concurrency.ConcurrencyStats(
+        limit=1, acquired=1
+    )
+
+
+async def test_acquire_in_order(hass: HomeAssistant) -> None:
+    """Test waiters are handed slots in the order they started waiting."""
+    limiter = concurrency.KeyedConcurrencyLimit(hass)
+    limiter.async_set_limit("key", 1)
+    order = []
+
+    async def _run(name):
+        release = await limiter.async_acquire(["key"])
+        order.append(name)
+        await asyncio.sleep(0)
+        release()
+
+    release = await limiter.async_acquire(["key"])
+    tasks = [hass.async_create_task(_run(name)) for name in ("a", "b", "c")]
+    await asyncio.sleep(0)
+    assert order == []
+    stats = limiter.async_get_stats()["key"]
+    assert stats.queued == 3
+    assert stats.max_queued == 3
+
+    # A new caller can't jump the line
+    assert limiter.async_try_acquire(["key"]) is None
+
+    release()
+    await asyncio.gather(*tasks)
+    assert order == ["a", "b", "c"]
+    stats = limiter.async_get_stats()["key"]
+    assert stats.in_flight == 0
+    assert stats.queued == 0
+    assert stats.acquired == 4
+    assert stats.waited == 3
+
+
+async def test_acquire_cancelled(hass: HomeAssistant) -> None:
+    """Test cancelling a waiter gives up its place in line."""
+    limiter = concurrency.KeyedConcurrencyLimit(hass)
+    limiter.async_set_limit("key1", 1)
+    limiter.async_set_limit("key2", 1)
+
+    release = await limiter.async_acquire(["key2"])
+    task = hass.async_create_task(limiter.async_acquire(["key1", "key2"]))
+    await asyncio.sleep(0)
+    stats = limiter.async_get_stats()
+    assert stats["key1"].in_flight == 1
+    assert stats["key2"].queued == 1
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    stats = limiter.async_get_stats()
+    assert stats["key1"].in_flight == 0
+    assert stats["key2"].queued == 0
+
+    release()
+    assert limiter.async_get_stats()["key2"].in_flight == 0
+
+    # Cancelled after the slot was handed over
+    release = await limiter.async_acquire(["key1"])
+    task = hass.async_create_task(limiter.async_acquire(["key1"]))
+    await asyncio.sleep(0)
+    release()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert limiter.async_get_stats()["key1"].in_flight == 0
+
+
+async def test_change_limit(hass: HomeAssistant) -> None:
+    """Test changing and removing a limit wakes up waiters."""
+    limiter = concurrency.KeyedConcurrencyLimit(hass)
+    limiter.async_set_limit("key", 1)
+
+    release = await limiter.async_acquire(["key"])
+    tasks = [hass.async_create_task(limiter.async_acquire(["key"])) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    limiter.async_set_limit("key", 2)
+    await asyncio.sleep(0)
+    assert [task.done() for task in tasks] == [True, False, False]
+    assert limiter.async_get_stats()["key"].in_flight == 2
+
+    limiter.async_set_limit("key", None)
+    await asyncio.gather(*tasks)
+    assert limiter.async_get_stats() == {}
+    assert limiter.async_try_acquire(["key"]) is not None
+
+    # Releasing slots of a removed limit doesn't affect a new limit
+    limiter.async_set_limit("key", 1)
+    release()
+    for task in tasks:
+        task.result()()
+    assert limiter.async_get_stats()["key"].in_flight == 0
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+async def test_invalid_limit(hass: HomeAssistant, limit: int) -> None:
+    """Test limits below one are rejected."""
+    limiter = concurrency.KeyedConcurrencyLimit(hass)
+    with pytest.raises(ValueError):
+        limiter.async_set_limit("key", limit)
+    assert limiter.async_get_stats() == {}
+
+
+async def test_remove_limit_while_acquiring(hass: HomeAssistant) -> None:
+    """Test removing the limit of a later key while waiting for an earlier one."""
+    limiter = concurrency.KeyedConcurrencyLimit(hass)
+    limiter.async_set_limit("key1", 1)
+    limiter.async_set_limit("key2", 1)
+
+    release = await limiter.async_acquire(["key1"])
+    task = hass.async_create_task(limiter.async_acquire(["key1", "key2"]))
+    await asyncio.sleep(0)
+    limiter.async_set_limit("key2", None)
+    release()
+    task_release = await task
+    assert limiter.async_get_stats()["key1"].in_flight == 1
+    task_release()
+    assert limiter.async_get_stats()["key1"].in_flight == 0
+
+
+async def test_acquire_owners_in_turn(hass: HomeAssistant) -> None:
+    """Test waiting owners are handed slots in turn."""
+    limiter = concurrency.KeyedConcurrencyLimit(hass)
+    limiter.async_set_limit("key", 1)
+    order = []
+
+    async def _run(owner, name):
+        release = await limiter.async_acquire(["key"], owner)
+        order.append(name)
+        await asyncio.sleep(0)
+        release()
+
+    release = await limiter.async_acquire(["key"])
+    tasks = [
+        hass.async_create_task(_run(owner, name))
+        for owner, name in (("a", "a1"), ("a", "a2"), ("a", "a3"), ("b", "b1"))
+    ]
+    await asyncio.sleep(0)
+    release()
+    await asyncio.gather(*tasks)
+    assert order == ["a1", "b1", "a2", "a3"]
+    assert limiter.async_get_stats()["key"].queued == 0
+
+
+async def test_set_limits(hass: HomeAssistant) -> None:
+    """Test replacing all limits."""
+    limiter = concurrency.KeyedConcurrencyLimit(hass)
+    assert not limiter.async_has_limits()
+    limiter.async_set_limits({"key1": 1, "key2": 2})
+    assert limiter.async_has_limits()
+    limiter.async_set_limits({"key2": 3, "key3": 1})
+    stats = limiter.async_get_stats()
+    assert {key: key_stats.limit for key, key_stats in stats.items()} == {
+        "key2": 3,
+        "key3": 1,
+    }
+    limiter.async_set_limits({})
+    assert not limiter.async_has_limits()
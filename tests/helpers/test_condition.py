@@ -170,6 +170,106 @@ async def test_and_condition(hass: HomeAssistant) -> None:
     )
 
 
+async def test_and_condition_trace_off(hass: HomeAssistant) -> None:
+    """Test the 'and' condition evaluates cheap checks first when not traced."""
+    config = {
+        "condition": "and",
+        "conditions": [
+            {
+                "condition": "template",
+                "value_template": "{{ states('sensor.temperature') | int > 50 }}",
+            },
+            {
+                "condition": "state",
+                "entity_id": "sensor.temperature",
+                "state": "100",
+            },
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    hass.states.async_set("sensor.temperature", 120)
+    with trace.trace_level(trace.TraceLevel.OFF), patch(
+        "homeassistant.helpers.condition.async_template", return_value=True
+    ) as mock_template:
+        assert not test(hass)
+        assert not mock_template.called
+
+        hass.states.async_set("sensor.temperature", 100)
+        assert test(hass)
+        assert mock_template.called
+
+    assert trace.trace_get(clear=False) == {}
+
+
+async def test_state_condition_cache(hass: HomeAssistant) -> None:
+    """Test state condition results are cached per state when not traced."""
+    config = {
+        "condition": "state",
+        "entity_id": ["sensor.temperature_1", "sensor.temperature_2"],
+        "state": "100",
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    hass.states.async_set("sensor.temperature_1", 100)
+    hass.states.async_set("sensor.temperature_2", 100)
+    with trace.trace_level(trace.TraceLevel.OFF), patch(
+        "homeassistant.helpers.condition.state", wraps=condition.state
+    ) as mock_state:
+        assert test(hass)
+        assert mock_state.call_count == 2
+        assert test(hass)
+        assert mock_state.call_count == 2
+
+        hass.states.async_set("sensor.temperature_2", 90)
+        assert not test(hass)
+        assert mock_state.call_count == 3
+
+        hass.states.async_set("sensor.temperature_2", 100)
+        hass.states.async_remove("sensor.temperature_1")
+        with pytest.raises(ConditionError, match="unknown entity"):
+            test(hass)
+
+    # Results are not cached when traced
+    hass.states.async_set("sensor.temperature_1", 100)
+    hass.states.async_set("sensor.temperature_2", 100)
+    with patch(
+        "homeassistant.helpers.condition.state", wraps=condition.state
+    ) as mock_state:
+        assert test(hass)
+        assert test(hass)
+        assert mock_state.call_count == 4
+
+
+async def test_numeric_state_condition_cache(hass: HomeAssistant) -> None:
+    """Test numeric state condition results are cached per state when not traced."""
+    config = {
+        "condition": "numeric_state",
+        "entity_id": "sensor.temperature",
+        "below": 110,
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    hass.states.async_set("sensor.temperature", 100)
+    with trace.trace_level(trace.TraceLevel.OFF), patch(
+        "homeassistant.helpers.condition.async_numeric_state",
+        wraps=condition.async_numeric_state,
+    ) as mock_numeric_state:
+        assert test(hass)
+        assert test(hass)
+        assert mock_numeric_state.call_count == 1
+
+        hass.states.async_set("sensor.temperature", 120)
+        assert not test(hass)
+        assert mock_numeric_state.call_count == 2
+
+
 async def test_and_condition_raises(hass: HomeAssistant) -> None:
     """Test the 'and' condition."""
     config = {
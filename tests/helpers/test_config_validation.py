@@ -11,6 +11,7 @@ import pytest
 import voluptuous as vol
 
 import homeassistant
+from homeassistant.const import ENTITY_MATCH_ALL, ENTITY_MATCH_NONE
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import (
@@ -19,6 +20,7 @@ from homeassistant.helpers import (
     selector,
     template,
 )
+from homeassistant.util.yaml.objects import NodeDictClass, NodeStrClass
 
 
 def test_boolean() -> None:
@@ -398,6 +400,36 @@ def test_time_period() -> None:
         assert schema(value) == result
 
 
+def test_time_period_fast_paths() -> None:
+    """Test time_period type dispatch matches the generic validators."""
+    assert cv.time_period(timedelta(seconds=5)) == timedelta(seconds=5)
+    assert cv.time_period(NodeStrClass("00:00:05")) == timedelta(seconds=5)
+    assert cv.time_period(2.5) == timedelta(seconds=2.5)
+    assert cv.time_period(True) == timedelta(seconds=1)
+    assert cv.time_period(NodeDictClass({"seconds": 5})) == timedelta(seconds=5)
+    assert cv.time_period({"minutes": "1", "seconds": 5}) == timedelta(
+        minutes=1, seconds=5
+    )
+
+    # Invalid strings are not cached
+    for _ in range(2):
+        with pytest.raises(vol.Invalid):
+            cv.time_period("hello:world")
+
+
+def test_positive_time_period() -> None:
+    """Test positive_time_period validation."""
+    schema = vol.Schema(cv.positive_time_period)
+
+    for value in (None, "-00:00:05", -5, {"seconds": -5}, "hello"):
+        with pytest.raises(vol.MultipleInvalid):
+            schema(value)
+
+    assert schema("00:00:05") == timedelta(seconds=5)
+    assert schema(0) == timedelta(0)
+    assert schema({"minutes": 1}) == timedelta(minutes=1)
+
+
 def test_remove_falsy() -> None:
     """Test remove falsy."""
     assert cv.remove_falsy([0, None, 1, "1", {}, [], ""]) == [1, "1"]
@@ -1295,6 +1327,34 @@ def test_comp_entity_ids() -> None:
             schema(invalid)
 
 
+def test_comp_entity_ids_fast_path() -> None:
+    """Test the results and errors of component entity IDs match vol.Any."""
+    slow_schema = vol.Schema(
+        vol.Any(
+            vol.All(vol.Lower, vol.Any(ENTITY_MATCH_ALL, ENTITY_MATCH_NONE)),
+            cv.entity_ids,
+        )
+    )
+    schema = vol.Schema(cv.comp_entity_ids)
+
+    for value in (
+        "AlL",
+        "none",
+        None,
+        "light.Kitchen, light.ceiling",
+        ["light.kitchen", "light.ceiling"],
+        {"light.kitchen": None},
+    ):
+        assert schema(value) == slow_schema(value)
+
+    for value in (["light.kitchen", "not-entity-id"], "*", ""):
+        with pytest.raises(vol.Invalid) as slow_err:
+            slow_schema(value)
+        with pytest.raises(vol.Invalid) as err:
+            schema(value)
+        assert str(err.value) == str(slow_err.value)
+
+
 def test_uuid4_hex(caplog: pytest.LogCaptureFixture) -> None:
     """Test uuid validation."""
     schema = vol.Schema(cv.uuid4_hex)
@@ -33,6 +33,8 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockPlatform,
+    async_capture_events,
+    async_fire_time_changed,
     mock_integration,
     mock_registry,
 )
@@ -612,6 +614,53 @@ async def test_async_remove_ignores_in_flight_polling(hass: HomeAssistant) -> No
     assert hass.states.get("test.test") is None
 
 
+async def test_coalesce_state_writes(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test state writes are coalesced."""
+
+    class CoalescingEntity(entity.Entity):
+        _state_write_coalesce_interval = 0
+
+    platform = MockEntityPlatform(hass, domain="test")
+    ent = CoalescingEntity()
+    ent.entity_id = "test.test"
+    await platform.async_add_entities([ent])
+    await hass.async_block_till_done()
+    events = async_capture_events(hass, "state_changed")
+
+    for state in ("on", "off", "on"):
+        ent._attr_state = state
+        ent.async_write_ha_state()
+    assert hass.states.get("test.test").state == STATE_UNKNOWN
+    await hass.async_block_till_done()
+    assert hass.states.get("test.test").state == "on"
+    assert len(events) == 1
+
+    # Writes are limited to one per interval
+    ent._state_write_coalesce_interval = 10
+    ent._attr_state = "off"
+    ent.async_write_ha_state()
+    await hass.async_block_till_done()
+    assert hass.states.get("test.test").state == "on"
+    assert len(events) == 1
+
+    freezer.tick(timedelta(seconds=10))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get("test.test").state == "off"
+    assert len(events) == 2
+
+    # A pending write is dropped when the entity is removed
+    ent._attr_state = "on"
+    ent.async_write_ha_state()
+    await ent.async_remove()
+    freezer.tick(timedelta(seconds=10))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get("test.test") is None
+
+
 async def test_async_remove_twice(hass: HomeAssistant) -> None:
     """Test removing an entity twice only cleans up once."""
     result = []
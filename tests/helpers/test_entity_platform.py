@@ -7,9 +7,11 @@ from typing import Any
 from unittest.mock import ANY, Mock, patch
 
 import pytest
+import voluptuous as vol
 
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE
 from homeassistant.core import (
+    Context,
     CoreState,
     HomeAssistant,
     ServiceCall,
@@ -1548,6 +1550,134 @@ async def test_register_entity_service_response_data(hass: HomeAssistant) -> Non
     }
 
 
+async def test_register_batch_service_handler(hass: HomeAssistant) -> None:
+    """Test a batch handler is called once for the entities of its platform."""
+    entity_calls = []
+    batch_calls = []
+
+    class HelloEntity(MockEntity):
+        """Entity with a hello method."""
+
+        async def async_hello(self, **kwargs: Any) -> None:
+            """Say hello."""
+            entity_calls.append((self.entity_id, kwargs))
+
+    async def handle_batch(batch: list[tuple[Entity, dict[str, Any]]]) -> None:
+        batch_calls.append([(entity.entity_id, data) for entity, data in batch])
+
+    entity_platform1 = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    entities1 = [
+        HelloEntity(entity_id=f"mock_integration.entity_{idx}") for idx in range(3)
+    ]
+    await entity_platform1.async_add_entities(entities1)
+    entity_platform2 = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    entity2 = HelloEntity(entity_id="mock_integration.entity_other")
+    await entity_platform2.async_add_entities([entity2])
+
+    entity_platform1.async_register_entity_service(
+        "hello", {vol.Optional("name"): str}, "async_hello"
+    )
+    entity_platform1.async_register_batch_service_handler(
+        "mock_platform", "hello", handle_batch
+    )
+
+    context = Context()
+    await hass.services.async_call(
+        "mock_platform",
+        "hello",
+        {"entity_id": "all", "name": "world"},
+        blocking=True,
+        context=context,
+    )
+    # The batch handler gets the same data as the entity method
+    assert batch_calls == [
+        [
+            ("mock_integration.entity_0", {"name": "world"}),
+            ("mock_integration.entity_1", {"name": "world"}),
+            ("mock_integration.entity_2", {"name": "world"}),
+        ]
+    ]
+    assert entity_calls == [("mock_integration.entity_other", {"name": "world"})]
+    assert all(entity._context is context for entity in entities1)
+
+    # A single entity is called directly
+    batch_calls.clear()
+    entity_calls.clear()
+    await hass.services.async_call(
+        "mock_platform",
+        "hello",
+        {"entity_id": "mock_integration.entity_0"},
+        blocking=True,
+    )
+    assert batch_calls == []
+    assert entity_calls == [("mock_integration.entity_0", {})]
+
+
+async def test_batch_service_handler_for_service_handlers(
+    hass: HomeAssistant,
+) -> None:
+    """Test services with their own handler are only batched with batch params."""
+    entity_calls = []
+    batch_calls = []
+
+    async def handle_service(entity: MockEntity, call: ServiceCall) -> None:
+        entity_calls.append(entity.entity_id)
+
+    def batch_params(entity: MockEntity, call: ServiceCall) -> dict[str, Any] | None:
+        if entity.entity_id == "mock_integration.entity_2":
+            return None
+        return {"name": entity.entity_id}
+
+    async def handle_batch(batch: list[tuple[Entity, dict[str, Any]]]) -> None:
+        batch_calls.append([(entity.entity_id, data) for entity, data in batch])
+
+    entity_platform = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    await entity_platform.async_add_entities(
+        [MockEntity(entity_id=f"mock_integration.entity_{idx}") for idx in range(3)]
+    )
+    entity_platform.async_register_entity_service("hello", {}, handle_service)
+    entity_platform.async_register_batch_service_handler(
+        "mock_platform", "hello", handle_batch
+    )
+    entity_platform.async_register_batch_service_handler(
+        "mock_platform", "hello_batched", handle_batch
+    )
+    entity_platform.async_register_entity_service(
+        "hello_batched", {}, handle_service, batch_params=batch_params
+    )
+
+    # Without batch params the call is not batched
+    await hass.services.async_call(
+        "mock_platform", "hello", {"entity_id": "all"}, blocking=True
+    )
+    assert batch_calls == []
+    assert sorted(entity_calls) == [
+        "mock_integration.entity_0",
+        "mock_integration.entity_1",
+        "mock_integration.entity_2",
+    ]
+
+    # The batch handler gets the data of each entity, and the entities
+    # without data are handled by the service handler
+    entity_calls.clear()
+    await hass.services.async_call(
+        "mock_platform", "hello_batched", {"entity_id": "all"}, blocking=True
+    )
+    assert batch_calls == [
+        [
+            ("mock_integration.entity_0", {"name": "mock_integration.entity_0"}),
+            ("mock_integration.entity_1", {"name": "mock_integration.entity_1"}),
+        ]
+    ]
+    assert entity_calls == ["mock_integration.entity_2"]
+
+
 async def test_register_entity_service_response_data_multiple_matches(
     hass: HomeAssistant,
 ) -> None:
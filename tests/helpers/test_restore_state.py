@@ -5,6 +5,7 @@ import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
@@ -25,6 +26,7 @@ from homeassistant.helpers.restore_state import (
 )
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from tests.common import (
     MockEntityPlatform,
@@ -101,7 +103,9 @@ async def test_async_get_instance_backwards_compatibility(hass: HomeAssistant) -
         assert data is await RestoreStateData.async_get_instance(hass)
 
 
-async def test_periodic_write(hass: HomeAssistant) -> None:
+async def test_periodic_write(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
     """Test that we write periodiclly but not after stop."""
     data = async_get(hass)
     await hass.async_block_till_done()
@@ -127,9 +131,21 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
-        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=15))
+        freezer.tick(timedelta(minutes=15))
+        async_fire_time_changed(hass)
         await hass.async_block_till_done()
 
+    # Nothing changed since the last write
+    assert not mock_write_data.called
+
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        freezer.tick(timedelta(minutes=45))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    # Written once the max interval has passed
     assert mock_write_data.called
 
     with patch(
@@ -143,13 +159,16 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
-        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
+        freezer.tick(timedelta(minutes=30))
+        async_fire_time_changed(hass)
         await hass.async_block_till_done()
 
     assert not mock_write_data.called
 
 
-async def test_save_persistent_states(hass: HomeAssistant) -> None:
+async def test_save_persistent_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
     """Test that we cancel the currently running job, save the data, and verify the perdiodic job continues."""
     data = async_get(hass)
     await hass.async_block_till_done()
@@ -193,7 +212,8 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
-        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=20))
+        freezer.tick(timedelta(hours=1))
+        async_fire_time_changed(hass)
         await hass.async_block_till_done()
     # Verify still saving
     assert mock_write_data.called
@@ -346,6 +366,91 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert written_states[1]["state"]["state"] == "off"
 
 
+async def test_periodic_dump_skips_unchanged_states(hass: HomeAssistant) -> None:
+    """Test periodic dumps only write when a stored state changed."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    await platform.async_add_entities([entity])
+
+    data = async_get(hass)
+    data.last_states = {
+        "input_boolean.b2": StoredState(
+            State("input_boolean.b2", "off"), None, dt_util.utcnow()
+        ),
+    }
+
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states(skip_unchanged=True)
+        assert mock_write_data.call_count == 1
+
+        await data.async_dump_states(skip_unchanged=True)
+        assert mock_write_data.call_count == 1
+
+        # Explicit dumps are never skipped
+        await data.async_dump_states()
+        assert mock_write_data.call_count == 2
+
+        hass.states.async_set("input_boolean.b1", "on")
+        await data.async_dump_states(skip_unchanged=True)
+        assert mock_write_data.call_count == 3
+
+        data.last_states.pop("input_boolean.b2")
+        await data.async_dump_states(skip_unchanged=True)
+        assert mock_write_data.call_count == 4
+
+    written_states = mock_write_data.mock_calls[-1][1][0]
+    assert [row["state"]["entity_id"] for row in written_states] == ["input_boolean.b1"]
+
+
+async def test_load_deserializes_states_lazily(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test stored states are only deserialized when accessed."""
+    now = dt_util.utcnow()
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            {
+                "state": json_loads(State("input_boolean.b1", "on").as_dict_json),
+                "extra_data": None,
+                "last_seen": now.isoformat(),
+            },
+            {
+                "state": json_loads(State("input_boolean.b2", "off").as_dict_json),
+                "extra_data": None,
+                "last_seen": now.isoformat(),
+            },
+        ],
+    }
+    hass.data.pop(DATA_RESTORE_STATE)
+    with patch(
+        "homeassistant.helpers.restore_state.State.from_dict",
+        wraps=State.from_dict,
+    ) as mock_from_dict:
+        await async_load(hass)
+        data = async_get(hass)
+        assert mock_from_dict.call_count == 0
+
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = "input_boolean.b1"
+        state = await entity.async_get_last_state()
+        assert state.state == "on"
+        assert mock_from_dict.call_count == 1
+
+        # Not accessed states are written back as loaded
+        assert (
+            data.last_states["input_boolean.b2"].as_dict()["state"]
+            == (hass_storage[STORAGE_KEY]["data"][1]["state"])
+        )
+        assert mock_from_dict.call_count == 1
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
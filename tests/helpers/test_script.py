@@ -33,6 +33,7 @@ from homeassistant.core import (
 )
 from homeassistant.exceptions import ConditionError, HomeAssistantError, ServiceNotFound
 from homeassistant.helpers import (
+    area_registry as ar,
     config_validation as cv,
     device_registry as dr,
     entity_registry as er,
@@ -105,10 +106,11 @@ def assert_element(trace_element, expected_element, path):
     if trace_element.path == "0":
         return
 
+    changed_variables = trace_element.as_dict().get("changed_variables")
     if "variables" in expected_element:
-        assert expected_element["variables"] == trace_element._variables
+        assert expected_element["variables"] == changed_variables
     else:
-        assert not trace_element._variables
+        assert not changed_variables
 
 
 def assert_action_trace(expected, expected_script_execution="finished"):
@@ -281,6 +283,192 @@ async def test_calling_service_basic(
     )
 
 
+@pytest.mark.parametrize(
+    ("service_callback", "long_action"), [(True, False), (False, True)]
+)
+async def test_calling_service_inline(
+    hass: HomeAssistant, service_callback: bool, long_action: bool
+) -> None:
+    """Test callback services are called without creating a task."""
+    calls = []
+
+    @callback
+    def service(call: ServiceCall) -> None:
+        calls.append(call)
+
+    async def async_service(call: ServiceCall) -> None:
+        calls.append(call)
+
+    handler = service if service_callback else async_service
+    hass.services.async_register("test", "script", handler)
+    sequence = cv.SCRIPT_SCHEMA({"service": "test.script", "data": {"hello": "world"}})
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    with patch(
+        "homeassistant.helpers.script._ScriptRun._async_run_long_action",
+        side_effect=script._ScriptRun._async_run_long_action,
+        autospec=True,
+    ) as mock_long_action:
+        await script_obj.async_run(context=Context())
+
+    assert len(calls) == 1
+    assert calls[0].data == {"hello": "world"}
+    assert mock_long_action.called is long_action
+
+
+async def test_service_concurrency_limit(hass: HomeAssistant) -> None:
+    """Test the number of concurrent service calls per domain can be limited."""
+    in_flight = 0
+    max_in_flight = 0
+    release = asyncio.Event()
+
+    async def async_service(call: ServiceCall) -> None:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await release.wait()
+        in_flight -= 1
+
+    hass.services.async_register("test", "script", async_service)
+    script.async_get_service_concurrency_limit(hass).async_set_limit("test", 2)
+    sequence = cv.SCRIPT_SCHEMA({"service": "test.script"})
+    script_obj = script.Script(
+        hass, sequence, "Test Name", "test_domain", script_mode="parallel", max_runs=5
+    )
+
+    for _ in range(5):
+        hass.async_create_task(script_obj.async_run(context=Context()))
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert in_flight == 2
+    limit = script.async_get_service_concurrency_limit(hass)
+    assert limit.async_get_stats()["test"].queued == 3
+
+    release.set()
+    await hass.async_block_till_done()
+    assert max_in_flight == 2
+    stats = limit.async_get_stats()["test"]
+    assert stats.acquired == 5
+    assert stats.in_flight == 0
+
+    # Stopping a run waiting for the limit gives up its place in line
+    release.clear()
+    limit.async_set_limit("test", 1)
+    for _ in range(2):
+        hass.async_create_task(script_obj.async_run(context=Context()))
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert limit.async_get_stats()["test"].queued == 1
+
+    await script_obj.async_stop()
+    assert not script_obj.is_running
+    stats = limit.async_get_stats()["test"]
+    assert stats.in_flight == 0
+    assert stats.queued == 0
+
+
+async def test_service_concurrency_limit_nested_call(hass: HomeAssistant) -> None:
+    """Test service calls made from a limited service call don't wait for its slot."""
+    calls = []
+    inner_script = script.Script(
+        hass, cv.SCRIPT_SCHEMA({"service": "test.inner"}), "Inner", "test_domain"
+    )
+
+    async def async_outer(call: ServiceCall) -> None:
+        await inner_script.async_run(context=call.context)
+
+    async def async_inner(call: ServiceCall) -> None:
+        calls.append(call)
+
+    hass.services.async_register("test", "outer", async_outer)
+    hass.services.async_register("test", "inner", async_inner)
+    limit = script.async_get_service_concurrency_limit(hass)
+    limit.async_set_limit("test", 1)
+    script_obj = script.Script(
+        hass, cv.SCRIPT_SCHEMA({"service": "test.outer"}), "Outer", "test_domain"
+    )
+
+    async with asyncio.timeout(5):
+        await script_obj.async_run(context=Context())
+    assert len(calls) == 1
+    stats = limit.async_get_stats()["test"]
+    assert stats.acquired == 1
+    assert stats.in_flight == 0
+
+
+async def test_service_concurrency_limit_keys_by_area(hass: HomeAssistant) -> None:
+    """Test the platforms of entities targeted by area are limited."""
+    config_entry = MockConfigEntry()
+    config_entry.add_to_hass(hass)
+    area = ar.async_get(hass).async_get_or_create("Kitchen")
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        identifiers={("hue", "1234")},
+    )
+    dr.async_get(hass).async_update_device(device.id, area_id=area.id)
+    er.async_get(hass).async_get_or_create("light", "hue", "1234", device_id=device.id)
+    script.async_get_service_concurrency_limit(hass).async_set_limit("hue", 1)
+
+    assert script._async_service_concurrency_limit_keys(
+        hass,
+        {"domain": "light", "service": "turn_on", "target": {"area_id": area.id}},
+    ) == ["hue"]
+    assert script._async_service_concurrency_limit_keys(
+        hass,
+        {"domain": "light", "service": "turn_on", "target": {"device_id": device.id}},
+    ) == ["hue"]
+    assert (
+        script._async_service_concurrency_limit_keys(
+            hass, {"domain": "light", "service": "turn_on", "service_data": {}}
+        )
+        == []
+    )
+
+
+async def test_script_trace_off(hass: HomeAssistant) -> None:
+    """Test steps are not traced when the trace level is off."""
+    events = async_capture_events(hass, "test_event")
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"variables": {"hello": "world"}},
+            {"condition": "template", "value_template": "{{ hello == 'world' }}"},
+            {"event": "test_event", "event_data": {"hello": "{{ hello }}"}},
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    with trace.trace_level(trace.TraceLevel.OFF):
+        await script_obj.async_run(context=Context())
+
+    assert len(events) == 1
+    assert events[0].data == {"hello": "world"}
+    assert trace.trace_get(clear=False) == {}
+
+
+async def test_script_trace_off_keeps_parent_trace(hass: HomeAssistant) -> None:
+    """Test an untraced script does not change the trace element of its caller."""
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"condition": "template", "value_template": "{{ true }}"},
+            {"wait_template": "{{ true }}"},
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    parent = trace.TraceElement(None, "parent")
+    parent.set_result(done=True)
+    trace.trace_stack_push(trace.trace_stack_cv, parent)
+    try:
+        with trace.trace_level(trace.TraceLevel.OFF):
+            await script_obj.async_run(context=Context())
+            trace.trace_set_result(result="child")
+            trace.trace_update_result(result="child")
+    finally:
+        trace.trace_stack_pop(trace.trace_stack_cv)
+
+    assert parent.as_dict()["result"] == {"done": True}
+
+
 async def test_calling_service_template(hass: HomeAssistant) -> None:
     """Test the calling of a service."""
     context = Context()
@@ -7,10 +7,13 @@ import voluptuous as vol
 from homeassistant.core import Context, HomeAssistant, ServiceCall, callback
 from homeassistant.helpers.trigger import (
     DATA_PLUGGABLE_ACTIONS,
+    IndexedStateTrigger,
     PluggableAction,
     _async_get_trigger_platform,
+    async_get_state_trigger_index,
     async_initialize_triggers,
     async_validate_trigger_config,
+    state_trigger_predicate_key,
 )
 from homeassistant.setup import async_setup_component
 
@@ -276,3 +279,110 @@ async def test_pluggable_action(hass: HomeAssistant, calls: list[ServiceCall]):
     remove_attach_2()
     assert not hass.data[DATA_PLUGGABLE_ACTIONS]
     assert not plug_2
+
+
+async def test_state_trigger_index(hass: HomeAssistant) -> None:
+    """Test the state trigger index shares predicates and dispatches matches."""
+    index = async_get_state_trigger_index(hass)
+    assert async_get_state_trigger_index(hass) is index
+
+    predicate = MagicMock(side_effect=lambda _, __, new: new.state == "on")
+    actions = [MagicMock(), MagicMock(), MagicMock()]
+    triggers = [
+        IndexedStateTrigger("one", ("to", "on"), predicate, actions[0]),
+        IndexedStateTrigger("two", ("to", "on"), predicate, actions[1]),
+        IndexedStateTrigger(
+            "three", object(), predicate, actions[2], dispatch_all=True
+        ),
+    ]
+    unsubs = [index.async_add(["light.Kitchen"], trigger) for trigger in triggers]
+    assert index.async_get_triggers("light.kitchen") == triggers
+
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    # One evaluation for the shared key and one for the unique key
+    assert predicate.call_count == 2
+    assert [trigger.evaluations for trigger in triggers] == [1, 1, 1]
+    assert [trigger.matches for trigger in triggers] == [1, 1, 1]
+    assert [action.call_count for action in actions] == [1, 1, 1]
+    assert actions[0].call_args[0][1] is True
+
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.other", "on")
+    await hass.async_block_till_done()
+    assert predicate.call_count == 4
+    assert [trigger.evaluations for trigger in triggers] == [2, 2, 2]
+    assert [trigger.matches for trigger in triggers] == [1, 1, 1]
+    # Only the trigger dispatching all state changes is called on a mismatch
+    assert [action.call_count for action in actions] == [1, 1, 2]
+    assert actions[2].call_args[0][1] is False
+
+    for unsub in unsubs:
+        unsub()
+    assert index.async_get_triggers("light.kitchen") == []
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    assert predicate.call_count == 4
+
+
+async def test_state_trigger_index_error(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an error in one trigger does not affect the others."""
+    index = async_get_state_trigger_index(hass)
+    action = MagicMock()
+    index.async_add(
+        ["light.kitchen"],
+        IndexedStateTrigger(
+            "broken", object(), MagicMock(side_effect=ValueError), action
+        ),
+    )
+    index.async_add(
+        "light.kitchen",
+        IndexedStateTrigger("working", object(), MagicMock(return_value=True), action),
+    )
+
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    assert action.call_count == 1
+    assert "Error while dispatching state change of light.kitchen to broken" in (
+        caplog.text
+    )
+
+
+def test_state_trigger_predicate_key() -> None:
+    """Test predicate keys are only shared for hashable items."""
+    assert state_trigger_predicate_key("state", None, ("to", "on")) == (
+        "state",
+        None,
+        ("to", "on"),
+    )
+    key = state_trigger_predicate_key("state", "attr", ("to", {"a": 1}))
+    assert key != state_trigger_predicate_key("state", "attr", ("to", {"a": 1}))
+
+
+async def test_state_triggers_share_predicate(
+    hass: HomeAssistant, calls: list[ServiceCall]
+) -> None:
+    """Test automations with the same state trigger share the evaluation."""
+    trigger = {"platform": "state", "entity_id": "light.kitchen", "to": "on"}
+    assert await async_setup_component(
+        hass,
+        "automation",
+        {
+            "automation": [
+                {"trigger": trigger, "action": {"service": "test.automation"}},
+                {"trigger": trigger, "action": {"service": "test.automation"}},
+            ]
+        },
+    )
+
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+    triggers = async_get_state_trigger_index(hass).async_get_triggers("light.kitchen")
+    assert len(triggers) == 2
+    assert triggers[0].predicate_key == triggers[1].predicate_key
+    assert [(t.evaluations, t.matches) for t in triggers] == [(2, 1), (2, 1)]
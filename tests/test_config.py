@@ -31,7 +31,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import ConfigSource, HomeAssistant, HomeAssistantError
 from homeassistant.exceptions import ConfigValidationError
-from homeassistant.helpers import config_validation as cv, issue_registry as ir
+from homeassistant.helpers import config_validation as cv, issue_registry as ir, script
 import homeassistant.helpers.check_config as check_config
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.typing import ConfigType
@@ -860,6 +860,30 @@ async def test_loading_configuration(hass: HomeAssistant) -> None:
     assert hass.config.language == "sv"
 
 
+async def test_loading_configuration_max_in_flight(hass: HomeAssistant) -> None:
+    """Test the concurrency limits of service calls made by scripts are loaded."""
+    await config_util.async_process_ha_core_config(hass, {})
+    assert script.DATA_SERVICE_CONCURRENCY_LIMIT not in hass.data
+
+    await config_util.async_process_ha_core_config(
+        hass, {"max_in_flight": {"light": 10, "zha": "4"}}
+    )
+    limit = script.async_get_service_concurrency_limit(hass)
+    assert {key: stats.limit for key, stats in limit.async_get_stats().items()} == {
+        "light": 10,
+        "zha": 4,
+    }
+
+    # Reloading the core config without the option removes the limits
+    await config_util.async_process_ha_core_config(hass, {})
+    assert not limit.async_has_limits()
+
+    with pytest.raises(vol.Invalid):
+        await config_util.async_process_ha_core_config(
+            hass, {"max_in_flight": {"light": 0}}
+        )
+
+
 @pytest.mark.parametrize(
     ("minor_version", "users", "user_data", "default_language"),
     (
@@ -1198,6 +1198,23 @@ async def test_serviceregistry_has_service(hass: HomeAssistant) -> None:
     assert not hass.services.has_service("non_existing", "test_service")
 
 
+async def test_serviceregistry_is_callback(hass: HomeAssistant) -> None:
+    """Test async_is_callback method."""
+
+    async def async_service(call: ServiceCall) -> None:
+        """Handle a service call."""
+
+    hass.services.async_register("test_domain", "callback", ha.callback(lambda _: None))
+    hass.services.async_register("test_domain", "coroutine", async_service)
+    hass.services.async_register("test_domain", "executor", lambda call: None)
+    assert hass.services.async_is_callback("test_domain", "callback")
+    assert hass.services.async_is_callback("tesT_domaiN", "callbacK")
+    assert not hass.services.async_is_callback("test_domain", "coroutine")
+    assert not hass.services.async_is_callback("test_domain", "executor")
+    assert not hass.services.async_is_callback("test_domain", "non_existing")
+    assert not hass.services.async_is_callback("non_existing", "callback")
+
+
 async def test_serviceregistry_call_with_blocking_done_in_time(
     hass: HomeAssistant,
 ) -> None:
@@ -1,4 +1,6 @@
 """Test to verify that we can load components."""
+import pathlib
+from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -6,6 +8,11 @@ import pytest
 from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_HOMEASSISTANT_STARTED,
+    __version__ as HA_VERSION,
+)
 from homeassistant.core import HomeAssistant, callback
 
 from .common import MockModule, async_get_persistent_notifications, mock_integration
@@ -206,6 +213,111 @@ async def test_get_integration_custom_component(
     assert integration.name == "Test Package"
 
 
+def test_manifest_cache(tmp_path: pathlib.Path) -> None:
+    """Test the manifest cache only rereads changed manifests."""
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text('{"domain": "test", "name": "Test"}')
+
+    cache = loader.ManifestCache("2024.1.0")
+    assert cache.get(tmp_path / "missing.json", False) is None
+    assert not cache.dirty
+
+    assert cache.get(manifest_path, False) == {"domain": "test", "name": "Test"}
+    assert cache.dirty
+    cache.dirty = False
+
+    with patch("pathlib.Path.read_text") as mock_read:
+        assert cache.get(manifest_path, False)["name"] == "Test"
+        assert cache.get(manifest_path, True)["name"] == "Test"
+    assert not mock_read.called
+
+    # Returned manifests can be mutated without changing the cache
+    cache.get(manifest_path, False)["name"] = "Mutated"
+    assert cache.get(manifest_path, False)["name"] == "Test"
+
+    # Built-in manifests are trusted without a stat, custom ones are validated
+    manifest_path.write_text('{"domain": "test", "name": "Test changed"}')
+    assert cache.get(manifest_path, True)["name"] == "Test"
+    assert cache.get(manifest_path, False)["name"] == "Test changed"
+    assert cache.dirty
+
+    stored = cache.as_dict()
+    assert stored["manifests"] is not cache.entries
+
+    manifest_path.unlink()
+    assert cache.get(manifest_path, False) is None
+    assert cache.as_dict() == {"ha_version": "2024.1.0", "manifests": {}}
+
+    # A directory is not a manifest
+    manifest_path.mkdir()
+    assert cache.get(manifest_path, False) is None
+
+
+def test_manifest_cache_prune(tmp_path: pathlib.Path) -> None:
+    """Test entries of removed manifests are pruned."""
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text('{"domain": "test", "name": "Test"}')
+    cache = loader.ManifestCache("2024.1.0")
+    assert cache.get(manifest_path, True)["name"] == "Test"
+    cache.dirty = False
+
+    cache.prune()
+    assert str(manifest_path) in cache.entries
+    assert not cache.dirty
+
+    manifest_path.unlink()
+    cache.prune()
+    assert cache.entries == {}
+    assert cache.dirty
+
+
+def test_manifest_cache_dev_version(tmp_path: pathlib.Path) -> None:
+    """Test built-in manifests are validated on dev versions."""
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text('{"domain": "test", "name": "Test"}')
+
+    cache = loader.ManifestCache("2024.2.0.dev0")
+    assert cache.get(manifest_path, True)["name"] == "Test"
+    manifest_path.write_text('{"domain": "test", "name": "Test changed"}')
+    assert cache.get(manifest_path, True)["name"] == "Test changed"
+
+
+async def test_manifest_cache_persisted(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    enable_custom_integrations: None,
+) -> None:
+    """Test the manifest cache is loaded from and saved to storage."""
+    manifest_path = str(
+        pathlib.Path(hue.__file__).parent.parent / "http" / "manifest.json"
+    )
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY] = {
+        "version": loader.MANIFEST_CACHE_STORAGE_VERSION,
+        "key": loader.MANIFEST_CACHE_STORAGE_KEY,
+        "data": {"ha_version": "0.1.0", "manifests": {manifest_path: {}}},
+    }
+    await loader.async_load_manifest_cache(hass)
+    cache: loader.ManifestCache = hass.data[loader.DATA_MANIFEST_CACHE]
+    # Stored cache was written by a different version
+    assert cache.entries == {}
+
+    integration = await loader.async_get_integration(hass, "test_package")
+    assert integration.name == "Test Package"
+    assert cache.dirty
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    assert not cache.dirty
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+    stored = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    assert stored["ha_version"] == HA_VERSION
+    assert "test_package" in {
+        entry["manifest"]["domain"] for entry in stored["manifests"].values()
+    }
+
+
 def test_integration_properties(hass: HomeAssistant) -> None:
     """Test integration properties."""
     integration = loader.Integration(
@@ -615,6 +615,46 @@ def test_unit_conversion_factory_allow_none(
     ) == pytest.approx(expected)
 
 
+@pytest.mark.parametrize(
+    ("converter", "value", "from_unit", "expected", "to_unit"),
+    [
+        # Process all items in _CONVERTED_VALUE
+        (converter, value, from_unit, expected, to_unit)
+        for converter, item in _CONVERTED_VALUE.items()
+        for value, from_unit, expected, to_unit in item
+    ],
+)
+def test_unit_conversion_factory_allow_none_batch(
+    converter: type[BaseUnitConverter],
+    value: float,
+    from_unit: str,
+    expected: float,
+    to_unit: str,
+) -> None:
+    """Test conversion of many values to other units."""
+    convert = converter.converter_factory_allow_none_batch(from_unit, to_unit)
+    assert convert((value, None, value)) == [
+        pytest.approx(expected),
+        None,
+        pytest.approx(expected),
+    ]
+    assert convert([]) == []
+    # The same results as converting the values one at a time
+    assert convert([value]) == [
+        converter.converter_factory_allow_none(from_unit, to_unit)(value)
+    ]
+
+
+def test_unit_conversion_factory_allow_none_batch_same_unit() -> None:
+    """Test converting many values to the same unit."""
+    assert SpeedConverter.converter_factory_allow_none_batch(
+        UnitOfSpeed.FEET_PER_SECOND, UnitOfSpeed.FEET_PER_SECOND
+    )((1, None)) == [1, None]
+    assert TemperatureConverter.converter_factory_allow_none_batch(
+        UnitOfTemperature.CELSIUS, UnitOfTemperature.CELSIUS
+    )((1, None)) == [1, None]
+
+
 @pytest.mark.parametrize(
     ("value", "from_unit", "expected", "to_unit"),
     [
@@ -4,10 +4,12 @@ import importlib
 import io
 import os
 import pathlib
+import time
 from typing import Any
 import unittest
 from unittest.mock import Mock, patch
 
+from lru import LRU
 import pytest
 import voluptuous as vol
 import yaml as pyyaml
@@ -565,6 +567,118 @@ def test_no_recursive_secrets(
     assert e.value.args == ("Secrets not supported in this YAML file",)
 
 
+def test_load_yaml_cache(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test parsed YAML files are reused until they or their includes change."""
+    config_file = tmp_path / YAML_CONFIG_FILE
+    config_file.write_text(
+        "homeassistant:\n"
+        "  packages: !include_dir_merge_named packages\n"
+        "password: !secret password\n"
+        "env: !env_var TEST_YAML_CACHE\n"
+    )
+    (tmp_path / yaml.SECRET_YAML).write_text("password: pwhash\n")
+    packages = tmp_path / "packages"
+    packages.mkdir()
+    (packages / "one.yaml").write_text("one:\n  light: []\n")
+    (packages / "two.yaml").write_text("two:\n  switch: []\n")
+    monkeypatch.setenv("TEST_YAML_CACHE", "env_value")
+
+    def load() -> dict:
+        return yaml_loader.load_yaml_dict(
+            str(config_file), yaml_loader.Secrets(tmp_path)
+        )
+
+    yaml_loader.clear_cache()
+    expected = {
+        "homeassistant": {"packages": {"one": {"light": []}, "two": {"switch": []}}},
+        "password": "pwhash",
+        "env": "env_value",
+    }
+    assert load() == expected
+
+    with patch.object(
+        yaml_loader, "parse_yaml", wraps=yaml_loader.parse_yaml
+    ) as mock_parse:
+        doc = load()
+        assert doc == expected
+        assert mock_parse.call_count == 0
+        # Line and file annotations are preserved
+        assert doc["homeassistant"]["packages"]["two"].__line__ == 2
+        assert doc["homeassistant"]["packages"]["two"].__config_file__ == str(
+            packages / "two.yaml"
+        )
+
+        # Returned data can be mutated without affecting the cache
+        doc["homeassistant"]["packages"].clear()
+        assert load() == expected
+        assert mock_parse.call_count == 0
+
+        # Only the changed package and the files including it are parsed
+        (packages / "two.yaml").write_text("two:\n  switch: [1]\n")
+        expected["homeassistant"]["packages"]["two"]["switch"] = [1]
+        assert load() == expected
+        assert {call.args[0].name for call in mock_parse.mock_calls} == {
+            str(config_file),
+            str(packages / "two.yaml"),
+        }
+
+        mock_parse.reset_mock()
+        (packages / "three.yaml").write_text("three: {}\n")
+        expected["homeassistant"]["packages"]["three"] = {}
+        assert load() == expected
+        assert mock_parse.call_count == 2
+
+        mock_parse.reset_mock()
+        (tmp_path / yaml.SECRET_YAML).write_text("password: other\n")
+        expected["password"] = "other"
+        assert load() == expected
+        # The top level configuration and the secrets file
+        assert mock_parse.call_count == 2
+
+        mock_parse.reset_mock()
+        monkeypatch.setenv("TEST_YAML_CACHE", "other")
+        expected["env"] = "other"
+        assert load() == expected
+        assert mock_parse.call_count == 1
+
+
+def test_load_yaml_cache_unchanged_files_not_read(tmp_path: pathlib.Path) -> None:
+    """Test files with an old modification time are not read again."""
+    config_file = tmp_path / YAML_CONFIG_FILE
+    config_file.write_text("light: !include light.yaml\n")
+    (tmp_path / "light.yaml").write_text("- platform: demo\n")
+    old_time = time.time() - 10
+    for path in (config_file, tmp_path / "light.yaml"):
+        os.utime(path, (old_time, old_time))
+
+    yaml_loader.clear_cache()
+    expected = {"light": [{"platform": "demo"}]}
+    assert yaml_loader.load_yaml(str(config_file)) == expected
+    with patch.object(yaml_loader, "_digest") as mock_digest:
+        assert yaml_loader.load_yaml(str(config_file)) == expected
+    assert not mock_digest.called
+
+    (tmp_path / "light.yaml").write_text("- platform: template\n")
+    assert yaml_loader.load_yaml(str(config_file)) == {
+        "light": [{"platform": "template"}]
+    }
+
+
+def test_load_yaml_cache_is_bounded(tmp_path: pathlib.Path) -> None:
+    """Test the number of cached files is bounded."""
+    yaml_loader.clear_cache()
+    with patch.object(yaml_loader, "_YAML_CACHE", LRU(2)) as cache:
+        for idx in range(3):
+            (tmp_path / f"{idx}.yaml").write_text(f"value: {idx}\n")
+            yaml_loader.load_yaml(str(tmp_path / f"{idx}.yaml"))
+        assert set(cache.keys()) == {
+            str(tmp_path / "1.yaml"),
+            str(tmp_path / "2.yaml"),
+        }
+
+
 def test_input_class() -> None:
     """Test input class."""
     input = yaml_loader.Input("hello")